@@ -0,0 +1,63 @@
+"""
+Bundled puzzle corpora with known solutions, for the benchmark suite.
+
+Each corpus file in benchmarks/corpora holds one puzzle per line, as the puzzle and its solution
+written row by row with one symbol per cell: 0 for an empty cell, 1-9, then A-P for 10-25.
+Lines starting with # are comments.
+"""
+import os
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from core_data.grid import Grid
+from utils.grid_utils import decode_values, encode_values, values_to_grid
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpora")
+CORPORA = ("easy", "hard", "17-clue", "16x16", "25x25")
+
+
+@dataclass(frozen=True)
+class CorpusPuzzle:
+    corpus: str  # Name of the corpus the puzzle comes from
+    grid_size: int
+    puzzle: Tuple[int, ...]  # Row-major values, 0 for empty cells
+    solution: Tuple[int, ...]  # Row-major values of the unique solution
+
+    def grid(self) -> Grid:
+        return values_to_grid(self.puzzle, self.grid_size)
+
+
+def encode(values: Tuple[int, ...]) -> str:
+    return encode_values(values)
+
+
+def decode(text: str) -> Tuple[int, ...]:
+    return decode_values(text)
+
+
+def corpus_path(name: str) -> str:
+    return os.path.join(CORPUS_DIR, f"{name}.txt")
+
+
+def load_corpus(name: str) -> List[CorpusPuzzle]:
+    """
+    Read a bundled corpus.
+
+    Args:
+        name (str): One of CORPORA.
+
+    Returns:
+        List[CorpusPuzzle]: The puzzles in file order.
+    """
+    puzzles = []
+    with open(corpus_path(name), "r") as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            puzzle_text, solution_text = line.split()
+            grid_size = int(len(puzzle_text) ** 0.5)
+            if grid_size * grid_size != len(puzzle_text) or len(solution_text) != len(puzzle_text):
+                raise ValueError(f"{corpus_path(name)}:{line_number}: not a square grid.")
+            puzzles.append(CorpusPuzzle(name, grid_size, decode(puzzle_text), decode(solution_text)))
+    return puzzles
@@ -0,0 +1,325 @@
+"""
+Load-test the game logic with many simulated players, to check capacity before a release.
+
+Every player runs a randomised session through the headless command handlers, in process and offline:
+it starts a game on a bundled corpus puzzle, then makes moves (mostly correct ones), asks for hints,
+undoes and redoes, saves and loads, and starts over once its puzzle is complete. Players are seeded
+by --seed and their number, so a run replays the same sessions; hints on random cells still use the
+global generator, which threads share. The corpus proves every puzzle unique, so each process records
+that in its solution cache before the players start, as the generator does for the puzzles it makes;
+--cold leaves the cache empty, so the first game on each puzzle pays for the uniqueness check.
+
+Players run on threads, split across --processes worker processes when more than one is asked for.
+Every process samples its CPU time and resident memory each --interval seconds while the players run.
+The report gives the throughput, latency percentiles per command, and a timeline of commands
+completed, CPU used (100% is one core) and resident memory across all processes.
+
+Run from the repository root:
+    python -m benchmarks.load_test [--players N] [--processes N] [--actions N] [--think-ms MS]
+                                   [--corpus NAME] [--cold] [--seed N] [--interval S] [--json] [--output FILE]
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from threading import Event, Thread
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from benchmarks.corpus import CORPORA, CorpusPuzzle, load_corpus
+from benchmarks.suite import summarise_timings
+from puzzle_handler.puzzle_solver.solution_cache import store_solution_count
+from user_interface.controller.headless_controller import run_command
+
+SEED = 2024
+# Relative frequency of each action a player picks once it has a game
+ACTION_WEIGHTS = (("move", 50), ("undo", 12), ("redo", 5), ("hint", 8), ("save", 10), ("load", 8), ("new", 3))
+CORRECT_MOVE_ODDS = 0.9  # Chance a move places the solution's value rather than a random one
+
+
+@dataclass(frozen=True)
+class CommandSample:
+    cmd: str
+    start_s: float  # Seconds since the load test started
+    latency_s: float
+    ok: bool
+
+
+@dataclass(frozen=True)
+class ResourceSample:
+    time_s: float  # Seconds since the load test started
+    cpu_s: float  # CPU time of the process, all threads, since its players started
+    rss_kib: Optional[float]  # Resident memory of the process, None where it cannot be read
+
+
+def resident_kib() -> Optional[float]:
+    # The current resident set size where /proc provides it (Linux), otherwise the peak where the
+    # resource module does (other Unix systems), otherwise nothing
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform == 'darwin' else float(peak)  # Bytes on macOS, KiB elsewhere
+
+
+class Player:
+    """
+    A simulated player choosing its next command from the last response, with its own seeded generator.
+    """
+
+    def __new__(cls, player_id: int, seed: int, puzzles: Sequence[CorpusPuzzle], save_path: str,
+                hint_limit: int):
+        instance = super(Player, cls).__new__(cls)
+        instance.player_id = player_id
+        instance.rng = random.Random(f"{seed}/{player_id}")
+        instance.puzzles = puzzles
+        instance.save_path = save_path
+        instance.hint_limit = hint_limit
+        instance.puzzle = None  # The CorpusPuzzle of the game in progress
+        instance.saved = False  # Whether save_path holds a game to load
+        return instance
+
+    def next_command(self, game: Optional[Dict]) -> Dict:
+        """
+        Pick the next command.
+
+        Args:
+            game (Optional[Dict]): The last successful response, with the grid, or None before the first game.
+
+        Returns:
+            Dict: The command for run_command.
+        """
+        if game is None or game["complete"]:
+            return self.new_game()
+        actions, weights = zip(*ACTION_WEIGHTS)
+        action = self.rng.choices(actions, weights)[0]
+        empty = [index for index, value in enumerate(game["grid"]) if not value]
+        if action == "move" and empty:
+            index = self.rng.choice(empty)
+            grid_size = game["grid_size"]
+            value = (self.puzzle.solution[index] if self.rng.random() < CORRECT_MOVE_ODDS
+                     else self.rng.randint(1, grid_size))
+            return {"cmd": "move", "moves": f"{chr(ord('A') + index // grid_size)}{index % grid_size + 1}={value}"}
+        if action == "hint" and empty and game["hints_used"] < self.hint_limit:
+            return {"cmd": "hint"}
+        if action == "save":
+            self.saved = True
+            return {"cmd": "save", "path": self.save_path}
+        if action == "load" and self.saved:
+            return {"cmd": "load", "path": self.save_path}
+        if action == "new":
+            return self.new_game()
+        return {"cmd": "redo" if action == "redo" else "undo"}
+
+    def new_game(self) -> Dict:
+        self.puzzle = self.rng.choice(self.puzzles)
+        self.saved = False  # A saved game belongs to the previous puzzle
+        return {"cmd": "new", "puzzle": list(self.puzzle.puzzle)}
+
+
+def play(player: Player, config: Dict, actions: int, think_s: float, started: float) -> List[CommandSample]:
+    """
+    Run one player's session, timing every command.
+    """
+    samples = []
+    game_state, game = None, None
+    for _ in range(actions):
+        command = player.next_command(game)
+        start = time.perf_counter()
+        start_s = time.time() - started
+        game_state, response = run_command(config, game_state, command)
+        samples.append(CommandSample(command["cmd"], start_s, time.perf_counter() - start, response["ok"]))
+        if response["ok"] and "grid" in response:
+            game = response
+        if think_s:
+            time.sleep(player.rng.uniform(0, 2 * think_s))
+    return samples
+
+
+def sample_resources(started: float, interval: float, stop: Event, samples: List[ResourceSample]) -> None:
+    # Sample on the interval boundaries counted from the start, so the samples of every process line up
+    cpu_start = time.process_time()
+    while True:
+        samples.append(ResourceSample(time.time() - started, time.process_time() - cpu_start, resident_kib()))
+        next_boundary = (math.floor((time.time() - started) / interval) + 1) * interval
+        if stop.wait(max(0.0, next_boundary - (time.time() - started))):
+            break
+    samples.append(ResourceSample(time.time() - started, time.process_time() - cpu_start, resident_kib()))
+
+
+def run_players(player_ids: Sequence[int], seed: int, corpus: str, cold: bool, actions: int, think_s: float,
+                directory: str, interval: float, started: float) -> Tuple[List[CommandSample], List[ResourceSample]]:
+    """
+    Run some players on one thread each in this process, sampling the process's resources meanwhile.
+
+    Returns:
+        Tuple[List[CommandSample], List[ResourceSample]]: The commands of all the players and the samples.
+    """
+    puzzles = load_corpus(corpus)
+    if not cold:
+        for puzzle in puzzles:
+            store_solution_count(puzzle.grid(), 1)
+    config = {'grid_size': puzzles[0].grid_size, 'hint_limit': 3}
+    players = [Player(player_id, seed, puzzles, os.path.join(directory, f"player-{player_id}.json"),
+                      config['hint_limit'])
+               for player_id in player_ids]
+    random.seed(seed)  # The global generator picks cells for hints without a logical deduction
+
+    resources: List[ResourceSample] = []
+    stop = Event()
+    sampler = Thread(target=sample_resources, args=(started, interval, stop, resources), daemon=True)
+    sampler.start()
+    try:
+        # Game logic output must not mix with the report
+        with redirect_stdout(sys.stderr), ThreadPoolExecutor(max_workers=len(players)) as executor:
+            sessions = list(executor.map(lambda player: play(player, config, actions, think_s, started), players))
+    finally:
+        stop.set()
+        sampler.join()
+    return [sample for session in sessions for sample in session], resources
+
+
+def timeline(commands: Sequence[CommandSample], resources: Sequence[Sequence[ResourceSample]],
+             interval: float) -> List[Dict]:
+    """
+    Bucket the run by interval: commands completed, CPU used by all processes, and their resident memory.
+    """
+    end = max([sample.start_s + sample.latency_s for sample in commands]
+              + [process[-1].time_s for process in resources if process])
+    buckets = [{"t_s": round((index + 1) * interval, 3), "commands": 0, "cpu_s": 0.0, "rss_kib": None}
+               for index in range(int(end // interval) + 1)]
+    for sample in commands:
+        buckets[int((sample.start_s + sample.latency_s) // interval)]["commands"] += 1
+    last_bucket = len(buckets) - 1
+    for process in resources:
+        peaks: Dict[int, float] = {}
+        for previous, sample in zip(process, process[1:]):
+            # A sample taken on a boundary closes the bucket ending there
+            bucket = min(last_bucket, max(0, round(sample.time_s / interval) - 1))
+            buckets[bucket]["cpu_s"] += sample.cpu_s - previous.cpu_s
+            if sample.rss_kib is not None:
+                peaks[bucket] = max(peaks.get(bucket, 0.0), sample.rss_kib)
+        for bucket, rss_kib in peaks.items():
+            buckets[bucket]["rss_kib"] = (buckets[bucket]["rss_kib"] or 0.0) + rss_kib
+    return [{"t_s": bucket["t_s"], "commands": bucket["commands"],
+             "cpu_percent": round(100 * bucket["cpu_s"] / interval, 1),
+             "rss_mib": round(bucket["rss_kib"] / 1024, 1) if bucket["rss_kib"] is not None else None}
+            for bucket in buckets]
+
+
+def summarise_commands(samples: Sequence[CommandSample]) -> Dict:
+    summary = {"commands": len(samples), "rejected": sum(1 for sample in samples if not sample.ok)}
+    summary.update(summarise_timings([sample.latency_s for sample in samples]))
+    return summary
+
+
+def run_load_test(players: int = 8, processes: int = 1, actions: int = 50, think_ms: float = 0.0,
+                  corpus: str = "easy", cold: bool = False, seed: int = SEED, interval: float = 0.5) -> Dict:
+    """
+    Run the simulated players and summarise the run.
+
+    Args:
+        players (int): Simulated players, all playing at once.
+        processes (int): Processes the players are split across; 1 runs them all in this process.
+        actions (int): Commands each player sends.
+        think_ms (float): Mean pause between a player's commands, 0 to send them back to back.
+        corpus (str): The bundled corpus the players' puzzles come from.
+        cold (bool): Leave the solution cache empty instead of recording the corpus puzzles as unique.
+        seed (int): Seed of the players' choices.
+        interval (float): Seconds between resource samples, and the width of the timeline buckets.
+
+    Returns:
+        Dict: The settings, environment, overall and per-command summaries and the timeline.
+    """
+    if players < 1 or processes < 1 or actions < 1:
+        raise ValueError("The load test needs at least one player, process and action.")
+    processes = min(processes, players)
+    groups = [range(index, players, processes) for index in range(processes)]
+    with tempfile.TemporaryDirectory() as directory:
+        started = time.time()
+        arguments = (seed, corpus, cold, actions, think_ms / 1e3, directory, interval, started)
+        if processes == 1:
+            results = [run_players(groups[0], *arguments)]
+        else:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                futures = [executor.submit(run_players, group, *arguments) for group in groups]
+                results = [future.result() for future in futures]
+    commands = sorted((sample for samples, _ in results for sample in samples), key=lambda sample: sample.start_s)
+    resources = [samples for _, samples in results]
+
+    first = commands[0].start_s
+    last = max(sample.start_s + sample.latency_s for sample in commands)
+    by_command: Dict[str, List[CommandSample]] = {}
+    for sample in commands:
+        by_command.setdefault(sample.cmd, []).append(sample)
+    return {
+        "settings": {"players": players, "processes": processes, "actions": actions, "think_ms": think_ms,
+                     "corpus": corpus, "cold": cold, "seed": seed, "interval": interval},
+        "environment": {"python": platform.python_version(), "implementation": platform.python_implementation(),
+                        "machine": platform.machine(), "cpus": os.cpu_count()},
+        "summary": {**summarise_commands(commands), "wall_s": round(last - first, 3),
+                    "throughput_per_s": round(len(commands) / (last - first), 1) if last > first else None},
+        "commands": {cmd: summarise_commands(by_command[cmd]) for cmd in sorted(by_command)},
+        "timeline": timeline(commands, resources, interval),
+    }
+
+
+def print_report(report: Dict) -> None:
+    summary = report["summary"]
+    settings = report["settings"]
+    print(f"{settings['players']} players in {settings['processes']} process(es), {settings['actions']} commands "
+          f"each: {summary['commands']} commands in {summary['wall_s']} s, "
+          f"{summary['throughput_per_s']} commands/s, {summary['rejected']} rejected")
+    print()
+    print(f"{'command':<10} {'n':>6} {'rejected':>8} {'p50 ms':>10} {'p90 ms':>10} {'p99 ms':>10} {'max ms':>10}")
+    for cmd, stats in [("all", summary)] + list(report["commands"].items()):
+        print(f"{cmd:<10} {stats['commands']:>6} {stats['rejected']:>8} {stats['p50_ms']:>10} {stats['p90_ms']:>10} "
+              f"{stats['p99_ms']:>10} {stats['max_ms']:>10}")
+    print()
+    print(f"{'t s':>8} {'commands':>9} {'cpu %':>7} {'rss MiB':>8}")
+    for bucket in report["timeline"]:
+        rss = bucket["rss_mib"] if bucket["rss_mib"] is not None else ""
+        print(f"{bucket['t_s']:>8} {bucket['commands']:>9} {bucket['cpu_percent']:>7} {rss:>8}")
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Load-test the game logic with simulated players.")
+    parser.add_argument("--players", type=int, default=8, help="Simulated players, all playing at once.")
+    parser.add_argument("--processes", type=int, default=1, help="Processes the players are split across.")
+    parser.add_argument("--actions", type=int, default=50, help="Commands each player sends.")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Mean pause between a player's commands.")
+    parser.add_argument("--corpus", choices=CORPORA, default="easy", help="Bundled corpus of the puzzles played.")
+    parser.add_argument("--cold", action="store_true",
+                        help="Start with an empty solution cache, so new games check their puzzle's uniqueness.")
+    parser.add_argument("--seed", type=int, default=SEED, help="Seed of the players' choices.")
+    parser.add_argument("--interval", type=float, default=0.5, help="Seconds between resource samples.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    parser.add_argument("--output", help="Also write the JSON results to this file.")
+    args = parser.parse_args(argv)
+
+    report = run_load_test(args.players, args.processes, args.actions, args.think_ms, args.corpus, args.cold, args.seed,
+                           args.interval)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
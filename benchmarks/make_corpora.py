@@ -0,0 +1,70 @@
+"""
+Regenerate the generated corpora (easy, 16x16 and 25x25) from fixed seeds.
+
+Puzzles are made by shuffling a patterned solution and emptying cells one at a time for as long as
+the logical hint engine still deduces every empty cell, which also proves the solution unique.
+The hard and 17-clue corpora are curated published puzzles and are not regenerated.
+
+Run from the repository root:
+    python -m benchmarks.make_corpora
+"""
+import random
+import sys
+from typing import List, Tuple
+
+from benchmarks.corpus import corpus_path, encode
+from puzzle_handler.puzzle_solver.logical_hints import build_hint_map
+from utils.grid_utils import values_to_grid
+
+# corpus name: (grid size, puzzles, empty cells wanted, seed)
+GENERATED = {
+    "easy": (9, 20, 45, 9),
+    "16x16": (16, 5, 40, 16),
+    "25x25": (25, 3, 30, 25),
+}
+
+
+def shuffled_solution(grid_size: int, rng: random.Random) -> Tuple[int, ...]:
+    # Rows and columns are shuffled within their bands and stacks, bands and stacks among themselves,
+    # and the values relabelled; every step keeps the grid a valid solution
+    subgrid_size = int(grid_size ** 0.5)
+
+    def shuffled_lines() -> List[int]:
+        bands = rng.sample(range(subgrid_size), subgrid_size)
+        return [band * subgrid_size + line for band in bands for line in rng.sample(range(subgrid_size), subgrid_size)]
+
+    rows, cols = shuffled_lines(), shuffled_lines()
+    labels = rng.sample(range(1, grid_size + 1), grid_size)
+    return tuple(labels[(row * subgrid_size + row // subgrid_size + col) % grid_size]
+                 for row in rows for col in cols)
+
+
+def make_puzzle(solution: Tuple[int, ...], grid_size: int, empty_cells: int, rng: random.Random) -> Tuple[int, ...]:
+    puzzle = list(solution)
+    emptied = 0
+    for index in rng.sample(range(len(puzzle)), len(puzzle)):
+        if emptied == empty_cells:
+            break
+        puzzle[index] = 0
+        if len(build_hint_map(values_to_grid(tuple(puzzle), grid_size))) == emptied + 1:
+            emptied += 1
+        else:
+            puzzle[index] = solution[index]  # Not deducible any more, keep the cell
+    return tuple(puzzle)
+
+
+def main() -> None:
+    for name, (grid_size, count, empty_cells, seed) in GENERATED.items():
+        rng = random.Random(seed)
+        lines = [f"# {count} generated {grid_size}x{grid_size} puzzles, seed {seed}; see benchmarks/make_corpora.py"]
+        for _ in range(count):
+            solution = shuffled_solution(grid_size, rng)
+            puzzle = make_puzzle(solution, grid_size, empty_cells, rng)
+            lines.append(f"{encode(puzzle)} {encode(solution)}")
+        with open(corpus_path(name), "w") as file:
+            file.write("\n".join(lines) + "\n")
+        print(f"{name}: {count} puzzles", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Measure how much memory grids, games and cached solutions take, to size puzzle pools and session servers.
+
+Every measurement builds --count distinct items from fixed seeds and keeps them alive together, then
+reports the bytes tracemalloc still sees allocated per item and the objects added per item by type:
+    grid/NxN                 a half-filled puzzle grid
+    game_state/NxN/undo=K    a game after K single-cell moves, each kept as an undo entry, on top of its grid
+    undo_entry/NxN           the bytes one undo entry adds, from the largest K
+    cached_solution/NxN      one solved puzzle in the shared solver memo, with its canonical key
+
+Run from the repository root:
+    python -m benchmarks.memory_footprint [--sizes N ...] [--count N] [--undo K ...] [--json] [--output FILE]
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+from benchmarks.render_benchmark import GRID_SIZES
+from core_data.cell_state import CellState
+from core_data.coordinate import Coordinate
+from core_data.game_state import GameState
+from core_data.grid import Grid, update_grid
+from puzzle_handler.puzzle_solver.solution_cache import store_solution
+from puzzle_handler.puzzle_solver.solver_memo import SOLVER_MEMO_SIZE, solver_memo
+from utils.grid_utils import values_to_grid
+from utils.memory_stats import Footprint, measure_footprint
+
+SEED = 2024
+UNDO_ENTRIES = (0, 10, 100)
+GIB = 1024 ** 3
+
+
+def solution_values(grid_size: int) -> Tuple[int, ...]:
+    # A valid solved grid of any square size, shifting each row by one subgrid width
+    subgrid_size = int(grid_size ** 0.5)
+    return tuple((row * subgrid_size + row // subgrid_size + col) % grid_size + 1
+                 for row in range(grid_size) for col in range(grid_size))
+
+
+def puzzle_values(grid_size: int, seed: int) -> Tuple[int, ...]:
+    # About half of the solution's cells left as givens, a different half for every seed
+    rng = random.Random(seed)
+    return tuple(value if rng.random() < 0.5 else 0 for value in solution_values(grid_size))
+
+
+def puzzle_grid(grid_size: int, seed: int) -> Grid:
+    return values_to_grid(puzzle_values(grid_size, seed), grid_size)
+
+
+def game_with_moves(grid: Grid, moves: int) -> GameState:
+    """
+    Start a game on the grid and fill its empty cells one move at a time, cycling through values once
+    every empty cell has one, so the game ends with the given number of undo entries.
+    """
+    grid_size = grid.grid_size
+    game_state = GameState(grid, {'grid_size': grid_size, 'hint_limit': 3})
+    empty = [(row, col) for row in range(grid_size) for col in range(grid_size) if not grid[row, col].value.value]
+    for move in range(moves):
+        row, col = empty[move % len(empty)]
+        previous = game_state.grid[row, col].value.value
+        value = (move // len(empty)) % grid_size + 1
+        new_grid = update_grid(game_state.grid, Coordinate(row, col, grid_size), value, CellState.USER_FILLED)
+        game_state = game_state.record_move(new_grid, [(row, col, previous)])
+    return game_state
+
+
+def cache_solution(grid_size: int, seed: int) -> None:
+    store_solution(puzzle_grid(grid_size, seed), values_to_grid(solution_values(grid_size), grid_size), True)
+
+
+def result(name: str, footprint: Footprint) -> Dict:
+    return {"name": name, "items": footprint.items, "bytes": footprint.bytes_each,
+            "per_gib": int(GIB // footprint.bytes_each) if footprint.bytes_each > 0 else None,
+            "objects": footprint.objects_each}
+
+
+def measure_size(grid_size: int, count: int, undo_entries: Sequence[int], seed: int = SEED) -> List[Dict]:
+    """
+    Measure the footprints of one grid size.
+
+    Args:
+        grid_size (int): The grid size, e.g. 9.
+        count (int): Items built per measurement.
+        undo_entries (Sequence[int]): Undo history lengths to measure games at.
+        seed (int): Seed of the first puzzle; item i uses seed + i.
+
+    Returns:
+        List[Dict]: One JSON-ready result per measurement.
+    """
+    label = f"{grid_size}x{grid_size}"
+    results = [result(f"grid/{label}", measure_footprint(lambda index: puzzle_grid(grid_size, seed + index), count))]
+
+    games = {}
+    for moves in undo_entries:
+        # Grids are built outside the measurement so the first move is charged the same as the others
+        grids = [puzzle_grid(grid_size, seed + index) for index in range(count + 1)]
+        games[moves] = measure_footprint(lambda index: game_with_moves(grids[index], moves), count)
+        results.append(result(f"game_state/{label}/undo={moves}", games[moves]))
+    if len(games) > 1 and max(games) > 0:
+        fewest, most = min(games), max(games)
+        per_entry = round((games[most].bytes_each - games[fewest].bytes_each) / (most - fewest), 1)
+        results.append({"name": f"undo_entry/{label}", "items": count, "bytes": per_entry,
+                        "per_gib": int(GIB // per_entry) if per_entry > 0 else None, "objects": {}})
+
+    # Each solution takes two memo entries, its canonical key and the solution, and none may be evicted
+    if 2 * (count + 1) > SOLVER_MEMO_SIZE:
+        raise ValueError(f"--count above {SOLVER_MEMO_SIZE // 2 - 1} would evict cached solutions.")
+    solver_memo.clear()
+    try:
+        results.append(result(f"cached_solution/{label}",
+                              measure_footprint(lambda index: cache_solution(grid_size, seed + index), count)))
+    finally:
+        solver_memo.clear()
+    return results
+
+
+def run_memory_benchmark(sizes: Sequence[int] = GRID_SIZES, count: int = 10,
+                         undo_entries: Sequence[int] = UNDO_ENTRIES, seed: int = SEED) -> Dict:
+    return {
+        "settings": {"sizes": list(sizes), "count": count, "undo_entries": list(undo_entries), "seed": seed},
+        "environment": {"python": platform.python_version(), "implementation": platform.python_implementation(),
+                        "machine": platform.machine()},
+        "footprints": [entry for size in sizes for entry in measure_size(size, count, undo_entries, seed)],
+    }
+
+
+def print_table(report: Dict) -> None:
+    print(f"{'footprint':<28} {'bytes':>10} {'KiB':>8} {'per GiB':>10}  objects per item")
+    for entry in report["footprints"]:
+        top = sorted(entry["objects"].items(), key=lambda item: -item[1])[:4]
+        objects = ", ".join(f"{name} {count:g}" for name, count in top)
+        per_gib = entry["per_gib"] if entry["per_gib"] is not None else ""
+        print(f"{entry['name']:<28} {entry['bytes']:>10} {entry['bytes'] / 1024:>8.1f} {per_gib:>10}  {objects}")
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure the memory taken by grids, games and cached solutions.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=GRID_SIZES, help="Grid sizes to measure.")
+    parser.add_argument("--count", type=int, default=10, help="Items built and kept alive per measurement.")
+    parser.add_argument("--undo", type=int, nargs="+", default=UNDO_ENTRIES,
+                        help="Undo history lengths to measure games at.")
+    parser.add_argument("--seed", type=int, default=SEED, help="Seed of the generated puzzles.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    parser.add_argument("--output", help="Also write the JSON results to this file.")
+    args = parser.parse_args(argv)
+
+    report = run_memory_benchmark(args.sizes, args.count, args.undo, args.seed)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_table(report)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,209 @@
+"""
+Compare a fresh benchmark run against the committed baseline and fail on regressions.
+
+A benchmark regresses when its median time grows by more than its tolerance (and by more than the
+timer noise floor), when it expands more search nodes, when it returns a wrong result, or when it
+no longer runs at all. A baseline entry that was wrong, failed or has no timed samples cannot vouch for
+anything, so it fails the gate too, and --update refuses to write one.
+The exit status is 1 if anything regressed or the baseline is unusable, and 0 otherwise.
+
+Timings depend on the machine, so refresh the baseline with --update on the machine that runs the gate.
+
+Run from the repository root:
+    python -m benchmarks.regression_gate [--baseline FILE] [--current FILE] [--tolerance PREFIX=PERCENT ...] [--update]
+"""
+import argparse
+import json
+import os
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from benchmarks.suite import run_suite
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Allowed growth of the median time in percent, by benchmark name prefix; the longest matching prefix wins
+TOLERANCES = {
+    "backtrack/": 30.0,
+    "count_solutions/": 30.0,
+    "generate_puzzle/": 40.0,
+    "save_load/": 40.0,
+    "render/": 50.0,
+}
+DEFAULT_TOLERANCE = 30.0
+NOISE_FLOOR_MS = 0.5  # Slowdowns below this are timer noise, whatever their percentage
+
+OK = "ok"
+IMPROVED = "improved"
+SLOWER = "SLOWER"
+MORE_NODES = "MORE NODES"
+INCORRECT = "INCORRECT"
+NOT_RUN = "NOT RUN"
+NEW = "new"
+BAD_BASELINE = "BAD BASELINE"
+REGRESSIONS = (SLOWER, MORE_NODES, INCORRECT, NOT_RUN, BAD_BASELINE)
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline_ms: Optional[float]  # Median time in the baseline, None if it did not run there
+    current_ms: Optional[float]  # Median time now, None if it did not run
+    tolerance: float  # Allowed growth of the median time in percent
+    status: str  # One of OK, IMPROVED, NEW or the REGRESSIONS
+
+    @property
+    def delta_percent(self) -> Optional[float]:
+        if not self.baseline_ms or self.current_ms is None:
+            return None
+        return (self.current_ms - self.baseline_ms) / self.baseline_ms * 100
+
+    @property
+    def regressed(self) -> bool:
+        return self.status in REGRESSIONS
+
+
+def tolerance_for(name: str, tolerances: Dict[str, float]) -> float:
+    prefixes = [prefix for prefix in tolerances if name.startswith(prefix)]
+    return tolerances[max(prefixes, key=len)] if prefixes else DEFAULT_TOLERANCE
+
+
+def baseline_problem(result: Dict) -> Optional[str]:
+    """
+    Say why a benchmark result cannot serve as a baseline: it failed, returned a wrong result or has no
+    timed samples. None when it can.
+    """
+    if "error" in result:
+        return result["error"]
+    if result.get("correct") is False:
+        return "incorrect"
+    if not result["samples"]:
+        return "no samples"
+    return None
+
+
+def compare_benchmark(baseline: Optional[Dict], current: Optional[Dict], tolerance: float) -> str:
+    if baseline is None:
+        return NEW if current is not None and current["samples"] else OK
+    if baseline_problem(baseline):
+        return BAD_BASELINE
+    if current is None or not current["samples"]:
+        return NOT_RUN
+    if current.get("correct") is False:
+        return INCORRECT
+    if current.get("nodes", {}).get("max", 0) > baseline.get("nodes", {}).get("max", 0):
+        return MORE_NODES  # Search trees are deterministic, so any growth is a real change
+    slowdown = current["p50_ms"] - baseline["p50_ms"]
+    if slowdown > NOISE_FLOOR_MS and slowdown > baseline["p50_ms"] * tolerance / 100:
+        return SLOWER
+    if -slowdown > NOISE_FLOOR_MS and -slowdown > baseline["p50_ms"] * tolerance / 100:
+        return IMPROVED
+    return OK
+
+
+def compare_reports(baseline: Dict, current: Dict, tolerances: Dict[str, float] = None) -> List[Comparison]:
+    """
+    Compare every benchmark of the baseline and the current run.
+
+    Args:
+        baseline (Dict): A report written by benchmarks.suite.
+        current (Dict): A report of the fresh run.
+        tolerances (Dict[str, float]): Allowed growth of the median time in percent by name prefix.
+
+    Returns:
+        List[Comparison]: One comparison per benchmark, baseline benchmarks first.
+    """
+    tolerances = TOLERANCES if tolerances is None else tolerances
+    baseline_results = {result["name"]: result for result in baseline["benchmarks"]}
+    current_results = {result["name"]: result for result in current["benchmarks"]}
+    names = list(baseline_results) + [name for name in current_results if name not in baseline_results]
+    comparisons = []
+    for name in names:
+        before, after = baseline_results.get(name), current_results.get(name)
+        tolerance = tolerance_for(name, tolerances)
+        comparisons.append(Comparison(
+            name,
+            before["p50_ms"] if before and before["samples"] else None,
+            after["p50_ms"] if after and after["samples"] else None,
+            tolerance,
+            compare_benchmark(before, after, tolerance),
+        ))
+    return comparisons
+
+
+def format_ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.3f}"
+
+
+def format_delta(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:+.1f}%"
+
+
+def print_deltas(comparisons: Sequence[Comparison]) -> None:
+    print(f"{'benchmark':<28} {'base p50 ms':>12} {'now p50 ms':>12} {'delta':>9} {'allowed':>8}  status")
+    for comparison in comparisons:
+        print(f"{comparison.name:<28} {format_ms(comparison.baseline_ms):>12} {format_ms(comparison.current_ms):>12} "
+              f"{format_delta(comparison.delta_percent):>9} {comparison.tolerance:>7.0f}%  {comparison.status}")
+
+
+def parse_tolerances(overrides: Sequence[str]) -> Dict[str, float]:
+    tolerances = dict(TOLERANCES)
+    for override in overrides:
+        prefix, separator, percent = override.partition("=")
+        if not separator:
+            raise argparse.ArgumentTypeError(f"Expected PREFIX=PERCENT, got {override!r}")
+        tolerances[prefix] = float(percent)
+    return tolerances
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fail when benchmarks regress against the stored baseline.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline report written by the suite.")
+    parser.add_argument("--current", help="Compare this report instead of running the suite.")
+    parser.add_argument("--tolerance", nargs="*", default=(), metavar="PREFIX=PERCENT",
+                        help="Override the allowed slowdown for benchmarks starting with PREFIX.")
+    parser.add_argument("--update", action="store_true", help="Write the fresh run as the new baseline.")
+    args = parser.parse_args(argv)
+    try:
+        tolerances = parse_tolerances(args.tolerance)
+    except argparse.ArgumentTypeError as error:
+        parser.error(str(error))
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+    if args.current:
+        with open(args.current, "r") as file:
+            current = json.load(file)
+    else:
+        # Rerun with the baseline's settings so both reports time the same inputs
+        current = run_suite(**baseline["settings"]) if baseline else run_suite(repeat=3, limit=3, max_nodes=2000)
+
+    if args.update or baseline is None:
+        problems = [f"{result['name']} ({baseline_problem(result)})" for result in current["benchmarks"]
+                    if baseline_problem(result)]
+        if problems:
+            print(f"Not writing a baseline with unusable benchmarks: {', '.join(problems)}")
+            return 1
+        with open(args.baseline, "w") as file:
+            json.dump(current, file, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    comparisons = compare_reports(baseline, current, tolerances)
+    print_deltas(comparisons)
+    regressions = [comparison.name for comparison in comparisons if comparison.regressed]
+    bad_baselines = [comparison.name for comparison in comparisons if comparison.status == BAD_BASELINE]
+    if bad_baselines:
+        print(f"Regenerate the baseline with --update; unusable entries: {', '.join(bad_baselines)}")
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed: {', '.join(regressions)}")
+        return 1
+    print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
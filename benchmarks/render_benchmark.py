@@ -0,0 +1,94 @@
+"""
+Measure grid rendering: time per frame, bytes per frame and writes per frame for each grid size.
+
+Run from the repository root:
+    python -m benchmarks.render_benchmark [--repeat N] [--json]
+"""
+import argparse
+import io
+import json
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+from typing import Dict, List
+
+from core_data.cell import Cell
+from core_data.cell_state import CellState
+from core_data.cell_value import CellValue
+from core_data.coordinate import Coordinate
+from core_data.grid import Grid
+from user_interface.display.display_grid import display_grid, render_grid
+
+GRID_SIZES = (4, 9, 16, 25)
+SEED = 2024
+
+
+class CountingWriter(io.StringIO):
+    """A stdout replacement counting write calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+def benchmark_grid(grid_size: int, seed: int = SEED) -> Grid:
+    """
+    Build a half-filled grid mixing every cell state, the same for a given size and seed.
+    """
+    rng = random.Random(seed)
+    subgrid_size = int(grid_size ** 0.5)
+    states = (CellState.PRE_FILLED, CellState.USER_FILLED, CellState.HINT)
+    cells = {
+        Coordinate(row, col, grid_size): Cell(
+            CellValue((row * subgrid_size + row // subgrid_size + col) % grid_size + 1, grid_size), rng.choice(states))
+        for row in range(grid_size) for col in range(grid_size) if rng.random() < 0.5
+    }
+    return Grid.create(grid_size, cells)
+
+
+def measure(grid_size: int, repeat: int) -> Dict:
+    grid = benchmark_grid(grid_size)
+    render_grid(grid)  # Build the cached template outside the timing
+
+    writer = CountingWriter()
+    with redirect_stdout(writer):
+        display_grid(grid)
+
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render_grid(grid)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        "grid_size": grid_size,
+        "median_us": round(timings[len(timings) // 2] * 1e6, 1),
+        "min_us": round(timings[0] * 1e6, 1),
+        "bytes_per_frame": len(writer.getvalue().encode("utf-8")),
+        "writes_per_frame": writer.writes,
+    }
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark grid rendering.")
+    parser.add_argument("--repeat", type=int, default=200, help="Frames rendered per grid size.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args(argv)
+
+    results = [measure(grid_size, args.repeat) for grid_size in GRID_SIZES]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'size':>5} {'median us':>10} {'min us':>10} {'bytes':>8} {'writes':>7}")
+    for result in results:
+        print(f"{result['grid_size']:>5} {result['median_us']:>10} {result['min_us']:>10} "
+              f"{result['bytes_per_frame']:>8} {result['writes_per_frame']:>7}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,87 @@
+"""
+Record the search tree of a solver on one puzzle, and summarise recorded trees.
+
+A trace is a JSON-lines stream (gzip-compressed when the file name ends in .gz) of the branches,
+guesses and backtracks of the stepwise solvers, which explore the same tree as backtrack and
+count_solutions. The summary shows a histogram of branches by depth, the cells branched and backtracked
+on most, and the guesses whose subtrees wasted the most nodes.
+
+Run from the repository root:
+    python -m benchmarks.search_tree record (--corpus NAME [--index I] | --puzzle DIGITS) [--solver solve|count]
+        [--max-nodes N] --output TRACE
+    python -m benchmarks.search_tree summary TRACE [--top N] [--json]
+"""
+import argparse
+import json
+import sys
+from typing import List
+
+from benchmarks.corpus import CORPORA, decode, load_corpus
+from puzzle_handler.puzzle_solver.search_trace import (SearchTrace, format_summary, open_trace, read_events,
+                                                       summarise_trace, trace_summary_to_dict)
+from puzzle_handler.puzzle_solver.stepwise_solver import count_solutions_stepwise, solve_stepwise
+from utils.grid_utils import values_to_grid
+
+SOLVERS = ("solve", "count")
+
+
+def record(args: argparse.Namespace) -> int:
+    if args.puzzle:
+        values = decode(args.puzzle)
+        grid = values_to_grid(values, int(round(len(values) ** 0.5)))
+    else:
+        grid = load_corpus(args.corpus)[args.index].grid()
+    with open_trace(args.output, "w") as file:
+        trace = SearchTrace(file)
+        if args.solver == "solve":
+            steps = solve_stepwise(grid, slice_nodes=1, trace=trace)
+        else:
+            steps = count_solutions_stepwise(grid, grid.grid_size, slice_nodes=1, trace=trace)
+        nodes = 0
+        try:
+            while nodes < args.max_nodes:
+                nodes = next(steps).nodes
+            steps.close()
+            print(f"Stopped after {nodes} nodes; the trace covers the search so far.", file=sys.stderr)
+        except StopIteration:
+            print(f"Search finished; trace written to {args.output}.", file=sys.stderr)
+    return 0
+
+
+def summary(args: argparse.Namespace) -> int:
+    with open_trace(args.trace) as file:
+        trace_summary = summarise_trace(read_events(file), args.top)
+    if args.json:
+        print(json.dumps(trace_summary_to_dict(trace_summary), indent=2))
+    else:
+        print(format_summary(trace_summary))
+    return 0
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Record and summarise solver search trees.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="Trace the solver on one puzzle.")
+    source = record_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--corpus", choices=CORPORA, help="Take the puzzle from a bundled corpus.")
+    source.add_argument("--puzzle", help="Row-major cells, 0 for empty and A-P above 9.")
+    record_parser.add_argument("--index", type=int, default=0, help="Puzzle of the corpus, from 0.")
+    record_parser.add_argument("--solver", choices=SOLVERS, default="solve",
+                               help="Trace backtrack's search (solve) or count_solutions' (count).")
+    record_parser.add_argument("--max-nodes", type=int, default=10000, help="Stop the search after this many nodes.")
+    record_parser.add_argument("--output", required=True, help="Trace file; compressed if it ends in .gz.")
+    record_parser.set_defaults(run=record)
+
+    summary_parser = commands.add_parser("summary", help="Summarise a recorded trace.")
+    summary_parser.add_argument("trace", help="Trace file written by record.")
+    summary_parser.add_argument("--top", type=int, default=10, help="Cells and wasted subtrees to list.")
+    summary_parser.add_argument("--json", action="store_true", help="Print the summary as JSON.")
+    summary_parser.set_defaults(run=summary)
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
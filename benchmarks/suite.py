@@ -0,0 +1,379 @@
+"""
+Benchmark the solver, the generator, saving and loading, and rendering against the bundled corpora.
+
+Every benchmark runs the same inputs from fixed seeds and reports percentiles of the wall time, the
+peak memory allocated while running its first input and, for the solvers, the search nodes expanded.
+Nodes are counted with the stepwise solvers, which explore the same tree as backtrack and
+count_solutions; puzzles whose search exceeds --max-nodes are reported as skipped instead of timed.
+When no puzzle of a corpus fits the budget, the first one is timed with the fewest cells filled in from
+its solution that bring it within budget, and the summary reports how many were filled. Benchmarks run
+on a thread with a deep stack, so the recursive solvers can finish 25x25 grids.
+
+Run from the repository root:
+    python -m benchmarks.suite [--repeat N] [--limit N] [--max-nodes N] [--only PREFIX ...] [--json] [--output FILE]
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from benchmarks.corpus import CORPORA, CorpusPuzzle, load_corpus
+from benchmarks.render_benchmark import GRID_SIZES, benchmark_grid
+from core_data.game_state import GameState
+from puzzle_handler.puzzle_generator.generate_puzzle import generate_puzzle
+from puzzle_handler.puzzle_solver.puzzle_solver import backtrack, count_solutions
+from puzzle_handler.puzzle_solver.solution_cache import store_solution_count
+from puzzle_handler.puzzle_solver.solver_memo import solver_memo
+from puzzle_handler.puzzle_solver.stepwise_solver import SolverSteps, solve_stepwise, count_solutions_stepwise
+from user_actions.load_saved_game import validate_saved_game_file
+from user_actions.save_game import game_state_to_dict
+from user_interface.display.display_grid import render_grid
+from utils.grid_utils import grid_to_values
+
+SEED = 2024
+DIFFICULTIES = ("easy", "medium", "hard")
+CONFIG = {'grid_size': 9, 'hint_limit': 3}
+# The recursive solvers go about one frame per empty cell deep, a few thousand on a 25x25 grid
+RECURSION_LIMIT = 20000
+STACK_SIZE = 256 * 1024 * 1024
+
+
+class SearchFailed(Exception):
+    """
+    Raised by a solver benchmark whose search ended without finding the corpus solution.
+    """
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str  # e.g. "backtrack/easy"
+    tasks: Tuple[Callable[[], object], ...]  # One callable per input; each sample runs one
+    check: Optional[Callable[[int, object], bool]] = None  # Whether task i returned the expected result
+    nodes: Tuple[int, ...] = ()  # Search nodes expanded per task, for the solvers
+    skipped: int = 0  # Inputs left out for exceeding the node budget
+    filled: int = 0  # Solution cells filled in to bring an input within the node budget
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    # Nearest-rank percentile of an already sorted sequence
+    index = max(0, min(len(sorted_values) - 1, math.ceil(round(fraction * len(sorted_values), 9)) - 1))
+    return sorted_values[index]
+
+
+def summarise_timings(timings: List[float]) -> Dict:
+    timings = sorted(timings)
+    return {
+        "p50_ms": round(percentile(timings, 0.50) * 1e3, 3),
+        "p90_ms": round(percentile(timings, 0.90) * 1e3, 3),
+        "p99_ms": round(percentile(timings, 0.99) * 1e3, 3),
+        "min_ms": round(timings[0] * 1e3, 3),
+        "max_ms": round(timings[-1] * 1e3, 3),
+        "mean_ms": round(sum(timings) / len(timings) * 1e3, 3),
+    }
+
+
+def peak_memory_kib(task: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        task()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+
+def search_nodes(steps: SolverSteps, max_nodes: int) -> Optional[int]:
+    """
+    Count the nodes a stepwise solver expands, giving up beyond max_nodes.
+    """
+    nodes = 0
+    try:
+        while True:
+            nodes = next(steps).nodes
+            if nodes > max_nodes:
+                steps.close()
+                return None
+    except StopIteration:
+        return nodes
+
+
+def filled_in(puzzle: CorpusPuzzle, cells: int, seed: int) -> CorpusPuzzle:
+    # The puzzle with that many of its empty cells, in an order fixed by the seed, set from its solution
+    empty = [index for index, value in enumerate(puzzle.puzzle) if not value]
+    random.Random(seed).shuffle(empty)
+    chosen = set(empty[:cells])
+    return replace(puzzle, puzzle=tuple(solved if index in chosen else given for index, (given, solved)
+                                        in enumerate(zip(puzzle.puzzle, puzzle.solution))))
+
+
+def fit_to_budget(puzzle: CorpusPuzzle, steps: Callable[[CorpusPuzzle], SolverSteps], max_nodes: int,
+                  seed: int) -> Optional[Tuple[CorpusPuzzle, int, int]]:
+    """
+    Bisect for the fewest solution cells to fill in that bring a puzzle's search within the node budget.
+
+    Args:
+        puzzle (CorpusPuzzle): A puzzle whose own search exceeds the budget.
+        steps (Callable[[CorpusPuzzle], SolverSteps]): Starts the stepwise solver on a puzzle.
+        max_nodes (int): The node budget.
+        seed (int): Seed of the order the cells are filled in.
+
+    Returns:
+        Optional[Tuple[CorpusPuzzle, int, int]]: The filled-in puzzle, the nodes its search expands and
+            the cells filled in, or None when even the solved grid exceeds the budget.
+    """
+    low, high = 0, puzzle.puzzle.count(0)  # The search exceeds the budget with low cells filled, fits with high
+    nodes = search_nodes(steps(filled_in(puzzle, high, seed)), max_nodes)
+    if nodes is None:
+        return None
+    while high - low > 1:
+        middle = (low + high) // 2
+        middle_nodes = search_nodes(steps(filled_in(puzzle, middle, seed)), max_nodes)
+        if middle_nodes is None:
+            low = middle
+        else:
+            high, nodes = middle, middle_nodes
+    return filled_in(puzzle, high, seed), nodes, high
+
+
+def counted_solutions(grid) -> int:
+    # Corpus puzzles have exactly one solution, so counting none means the search failed
+    count = count_solutions(grid, grid.grid_size, raise_errors=True)
+    if count == 0:
+        raise SearchFailed("count_solutions found no solution to a corpus puzzle.")
+    return count
+
+
+def solver_benchmarks(limit: int, max_nodes: int, only: Sequence[str] = (), seed: int = SEED) -> List[Benchmark]:
+    benchmarks = []
+    for corpus in CORPORA:
+        puzzles = load_corpus(corpus)[:limit]
+        solvers = (
+            ("backtrack", lambda puzzle: solve_stepwise(puzzle.grid(), slice_nodes=1),
+             lambda grid: backtrack(grid),
+             lambda puzzle, result: result[1] and tuple(grid_to_values(result[0])) == puzzle.solution),
+            ("count_solutions", lambda puzzle: count_solutions_stepwise(puzzle.grid(), puzzle.grid_size, slice_nodes=1),
+             counted_solutions,
+             lambda puzzle, result: result == 1),
+        )
+        for solver_name, steps, run, expected in solvers:
+            if not wanted(f"{solver_name}/{corpus}", only):
+                continue  # Counting the search trees is the slow part, skip it for unwanted benchmarks
+            kept: List[Tuple[CorpusPuzzle, int]] = []
+            for puzzle in puzzles:
+                nodes = search_nodes(steps(puzzle), max_nodes)
+                if nodes is not None:
+                    kept.append((puzzle, nodes))
+            filled = 0
+            if puzzles and not kept:
+                fitted = fit_to_budget(puzzles[0], steps, max_nodes, seed)
+                if fitted is not None:
+                    puzzle, nodes, filled = fitted
+                    kept.append((puzzle, nodes))
+            benchmarks.append(Benchmark(
+                f"{solver_name}/{corpus}",
+                tuple((lambda grid=puzzle.grid(), run=run: run(grid)) for puzzle, _ in kept),
+                lambda index, result, kept=kept, expected=expected: bool(expected(kept[index][0], result)),
+                tuple(nodes for _, nodes in kept),
+                len(puzzles) - len(kept),
+                filled,
+            ))
+    return benchmarks
+
+
+def generated_puzzle(difficulty: str, seed: int) -> Callable[[], object]:
+    def task():
+        # Cold cache and a fixed seed, so every sample generates the same puzzle from scratch. A local
+        # generator keeps the seed away from the global one
+        solver_memo.clear()
+        return generate_puzzle(CONFIG, difficulty, random.Random(seed))
+    return task
+
+
+def generator_benchmarks(limit: int, seed: int) -> List[Benchmark]:
+    return [Benchmark(f"generate_puzzle/{difficulty}",
+                      tuple(generated_puzzle(difficulty, seed + index) for index in range(limit)))
+            for difficulty in DIFFICULTIES]
+
+
+def save_load_round_trip(puzzle: CorpusPuzzle, directory: str) -> Callable[[], object]:
+    game_state = GameState(puzzle.grid(), CONFIG)
+    path = os.path.join(directory, f"{puzzle.corpus}.json")
+
+    def task():
+        # Loading checks uniqueness; the corpus already proves it, so keep the solver out of the timing.
+        # Stored here rather than once up front, as the generator benchmarks clear the solver memo
+        store_solution_count(game_state.grid, 1)
+        with open(path, "w") as file:
+            json.dump(game_state_to_dict(game_state), file)
+        return validate_saved_game_file(path)
+    return task
+
+
+def save_load_benchmarks(directory: str) -> List[Benchmark]:
+    benchmarks = []
+    for corpus in ("easy", "16x16", "25x25"):
+        puzzle = load_corpus(corpus)[0]
+        benchmarks.append(Benchmark(
+            f"save_load/{corpus}", (save_load_round_trip(puzzle, directory),),
+            lambda index, result, puzzle=puzzle: result is not None
+            and tuple(grid_to_values(result.grid)) == puzzle.puzzle))
+    return benchmarks
+
+
+def render_benchmarks(seed: int) -> List[Benchmark]:
+    return [Benchmark(f"render/{size}x{size}", ((lambda grid=benchmark_grid(size, seed): render_grid(grid)),))
+            for size in GRID_SIZES]
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int) -> Dict:
+    """
+    Time every task of the benchmark repeat times and summarise the samples.
+
+    Args:
+        benchmark (Benchmark): The benchmark to run.
+        repeat (int): Samples per task.
+
+    Returns:
+        Dict: The JSON-ready summary.
+    """
+    summary = {"name": benchmark.name, "samples": 0, "skipped": benchmark.skipped}
+    if benchmark.filled:
+        summary["filled"] = benchmark.filled
+    if not benchmark.tasks:
+        return summary
+    timings = []
+    correct = True
+    for index, task in enumerate(benchmark.tasks):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                result = task()
+            except (RecursionError, SearchFailed) as error:
+                # A failed search is reported instead of a time, however quickly it gave up
+                summary["error"] = type(error).__name__
+                return summary
+            timings.append(time.perf_counter() - start)
+            if benchmark.check is not None and not benchmark.check(index, result):
+                correct = False
+    summary["samples"] = len(timings)
+    summary.update(summarise_timings(timings))
+    summary["peak_kib"] = peak_memory_kib(benchmark.tasks[0])
+    if benchmark.nodes:
+        nodes = sorted(benchmark.nodes)
+        summary["nodes"] = {"min": nodes[0], "p50": percentile(nodes, 0.5), "max": nodes[-1]}
+    if benchmark.check is not None:
+        summary["correct"] = correct
+    return summary
+
+
+def with_deep_stack(function: Callable[[], object]) -> object:
+    """
+    Call function on a thread with a STACK_SIZE stack and at least RECURSION_LIMIT frames of recursion.
+    """
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = function()
+        except BaseException as error:
+            outcome["error"] = error
+
+    previous_limit = sys.getrecursionlimit()
+    previous_stack_size = threading.stack_size(STACK_SIZE)
+    sys.setrecursionlimit(max(previous_limit, RECURSION_LIMIT))
+    try:
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+    finally:
+        threading.stack_size(previous_stack_size)
+        sys.setrecursionlimit(previous_limit)
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+def wanted(name: str, only: Sequence[str]) -> bool:
+    return not only or any(name.startswith(prefix) for prefix in only)
+
+
+def collect_benchmarks(limit: int, max_nodes: int, seed: int, directory: str,
+                       only: Sequence[str] = ()) -> List[Benchmark]:
+    benchmarks = (solver_benchmarks(limit, max_nodes, only, seed) + generator_benchmarks(limit, seed)
+                  + save_load_benchmarks(directory) + render_benchmarks(seed))
+    return [benchmark for benchmark in benchmarks if wanted(benchmark.name, only)]
+
+
+def run_suite(repeat: int, limit: int, max_nodes: int, seed: int = SEED, only: Sequence[str] = ()) -> Dict:
+    """
+    Run the selected benchmarks.
+
+    Args:
+        repeat (int): Samples per input.
+        limit (int): Puzzles used per corpus, and puzzles generated per difficulty.
+        max_nodes (int): Node budget above which a solver input is skipped, or filled in.
+        seed (int): Seed for the generator and rendering inputs.
+        only (Sequence[str]): Benchmark name prefixes to run, e.g. "backtrack/easy"; all when empty.
+
+    Returns:
+        Dict: The settings, environment and one summary per benchmark.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        benchmarks = collect_benchmarks(limit, max_nodes, seed, directory, only)
+        results = with_deep_stack(lambda: [run_benchmark(benchmark, repeat) for benchmark in benchmarks])
+    return {
+        "settings": {"repeat": repeat, "limit": limit, "max_nodes": max_nodes, "seed": seed},
+        "environment": {"python": platform.python_version(), "implementation": platform.python_implementation(),
+                        "machine": platform.machine()},
+        "benchmarks": results,
+    }
+
+
+def print_table(report: Dict) -> None:
+    print(f"{'benchmark':<28} {'n':>4} {'skip':>4} {'p50 ms':>10} {'p90 ms':>10} {'p99 ms':>10} "
+          f"{'peak KiB':>9} {'nodes p50':>9} {'ok':>3}")
+    for result in report["benchmarks"]:
+        if not result["samples"]:
+            print(f"{result['name']:<28} {0:>4} {result['skipped']:>4} {result.get('error', '')}")
+            continue
+        nodes = result.get("nodes", {}).get("p50", "")
+        correct = {True: "yes", False: "NO"}.get(result.get("correct"), "")
+        filled = f"  {result['filled']} cells filled" if "filled" in result else ""
+        print(f"{result['name']:<28} {result['samples']:>4} {result['skipped']:>4} {result['p50_ms']:>10} "
+              f"{result['p90_ms']:>10} {result['p99_ms']:>10} {result['peak_kib']:>9} {nodes:>9} {correct:>3}"
+              f"{filled}")
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the solver, generator, persistence and rendering.")
+    parser.add_argument("--repeat", type=int, default=3, help="Samples per input.")
+    parser.add_argument("--limit", type=int, default=3, help="Puzzles per corpus and per generator difficulty.")
+    parser.add_argument("--max-nodes", type=int, default=2000,
+                        help="Skip solver inputs whose search expands more nodes than this, or fill them in.")
+    parser.add_argument("--seed", type=int, default=SEED, help="Seed for generated and rendered inputs.")
+    parser.add_argument("--only", nargs="*", default=(), help="Benchmark name prefixes to run.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    parser.add_argument("--output", help="Also write the JSON results to this file.")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.repeat, args.limit, args.max_nodes, args.seed, args.only)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_table(report)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,24 +1,101 @@
-from typing import Dict, Tuple, List, Optional
+from dataclasses import dataclass
+from typing import Dict, Tuple, List, Optional, Union, Sequence, TYPE_CHECKING
 
-from core_data.grid import Grid
+from core_data.cell_state import CellState
+from core_data.coordinate import Coordinate
+from core_data.grid import Grid, update_grid
+from core_data.persistent_stack import PersistentStack, EMPTY_STACK
+
+if TYPE_CHECKING:
+    from puzzle_handler.puzzle_solver.logical_hints import HintMap
+
+Action = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """A grid kept for undo or redo. Grids share every row a move did not touch."""
+    grid: Grid  # The grid to restore
+    after: Grid  # The grid the snapshot applies to; any other current grid means the snapshot is stale
+    depth: int  # Length of the action stack when the snapshot was taken
+    action_count: int  # Number of actions on top of the action stack covered by the snapshot
+
+
+def as_stack(actions: Union[List, PersistentStack, None]) -> PersistentStack:
+    # Lists (e.g. from a saved game) are converted once; stacks are shared as they are
+    if actions is None:
+        return EMPTY_STACK
+    if isinstance(actions, PersistentStack):
+        return actions
+    return PersistentStack.from_iterable(actions)
+
+
+def trim_stack(actions: PersistentStack, snapshots: PersistentStack,
+               max_entries: int) -> Tuple[PersistentStack, PersistentStack]:
+    # Drop the oldest actions, and the snapshots of moves that are no longer fully on the stack
+    dropped = len(actions) - max_entries
+    if dropped <= 0:
+        return actions, snapshots
+    kept_snapshots = [
+        Snapshot(snapshot.grid, snapshot.after, snapshot.depth - dropped, snapshot.action_count)
+        for snapshot in snapshots if snapshot.depth - snapshot.action_count >= dropped
+    ]
+    return (PersistentStack.from_iterable(actions.to_list()[dropped:]),
+            PersistentStack.from_iterable(kept_snapshots))
 
 
 class GameState:
-    def __new__(cls, grid: Grid, config: Dict, hints_used: int = 0, undo_stack: List[Tuple[int, int, int]] = None,
-                redo_stack: List[Tuple[int, int, int]] = None):
+    def __new__(cls, grid: Grid, config: Dict, hints_used: int = 0,
+                undo_stack: Union[List[Action], PersistentStack] = None,
+                redo_stack: Union[List[Action], PersistentStack] = None,
+                undo_snapshots: Optional[PersistentStack] = None,
+                redo_snapshots: Optional[PersistentStack] = None):
         instance = super(GameState, cls).__new__(cls)
         instance.grid = grid
         instance.config = config
         instance.hints_used = hints_used
-        instance.undo_stack = undo_stack if undo_stack is not None else []
-        instance.redo_stack = redo_stack if redo_stack is not None else []
+        instance.undo_stack = as_stack(undo_stack)
+        instance.redo_stack = as_stack(redo_stack)
+        instance.undo_snapshots = as_stack(undo_snapshots)
+        instance.redo_snapshots = as_stack(redo_snapshots)
+        instance._hint_map = None  # Deductions for the grid, built on first use
         return instance
 
+    def __reduce__(self):
+        # GameState.__new__ needs its arguments, so pickle through the constructor
+        return GameState, (self.grid, self.config, self.hints_used, self.undo_stack, self.redo_stack,
+                           self.undo_snapshots, self.redo_snapshots)
+
+    def _evolve(self, **changes) -> 'GameState':
+        fields = {
+            'grid': self.grid, 'config': self.config, 'hints_used': self.hints_used,
+            'undo_stack': self.undo_stack, 'redo_stack': self.redo_stack,
+            'undo_snapshots': self.undo_snapshots, 'redo_snapshots': self.redo_snapshots,
+        }
+        fields.update(changes)
+        evolved = GameState(**fields)
+        if fields['grid'] is self.grid:
+            evolved._hint_map = self._hint_map  # Still describes the same grid
+        return evolved
+
+    def hint_map(self) -> 'HintMap':
+        """
+        Every value the logical techniques can deduce on the current grid. Taken from the background solver
+        if it has already finished the grid, otherwise built, and kept until a move, hint or undo changes the grid.
+        """
+        if self._hint_map is None:
+            # Imported here: the solver package builds on core_data, not the other way round
+            from puzzle_handler.puzzle_solver.background_solver import precomputed
+            from puzzle_handler.puzzle_solver.logical_hints import build_hint_map
+            ready = precomputed(self.grid, timeout=0)  # Never waits for the background solver
+            self._hint_map = ready.hint_map if ready is not None else build_hint_map(self.grid)
+        return self._hint_map
+
     def increment_hints(self) -> 'GameState':
-        return GameState(self.grid, self.config, self.hints_used + 1, self.undo_stack, self.redo_stack)
+        return self._evolve(hints_used=self.hints_used + 1)
 
     def reset_hints(self) -> 'GameState':
-        return GameState(self.grid, self.config, 0, self.undo_stack, self.redo_stack)
+        return self._evolve(hints_used=0)
 
     def hints_remaining(self) -> int:
         return self.config['hint_limit'] - self.hints_used
@@ -27,29 +104,116 @@ class GameState:
         return self.hints_used < self.config['hint_limit']
 
     def with_grid(self, grid: Grid) -> 'GameState':
-        return GameState(grid, self.config, self.hints_used, self.undo_stack, self.redo_stack)
+        return self._evolve(grid=grid)
 
-    def push_undo(self, action: Tuple[int, int, int]) -> 'GameState':
-        new_undo_stack = self.undo_stack + [action]
-        return GameState(self.grid, self.config, self.hints_used, new_undo_stack, self.redo_stack)
+    def push_undo(self, action: Action) -> 'GameState':
+        return self._evolve(undo_stack=self.undo_stack.push(action))
 
-    def pop_undo(self) -> Tuple[Optional[Tuple[int, int, int]], 'GameState']:
+    def pop_undo(self) -> Tuple[Optional[Action], 'GameState']:
         if not self.undo_stack:
             return None, self
-        action = self.undo_stack[-1]
-        new_undo_stack = self.undo_stack[:-1]
-        return action, GameState(self.grid, self.config, self.hints_used, new_undo_stack, self.redo_stack)
+        action, new_undo_stack = self.undo_stack.pop()
+        return action, self._evolve(undo_stack=new_undo_stack)
 
-    def push_redo(self, action: Tuple[int, int, int]) -> 'GameState':
-        new_redo_stack = self.redo_stack + [action]
-        return GameState(self.grid, self.config, self.hints_used, self.undo_stack, new_redo_stack)
+    def push_redo(self, action: Action) -> 'GameState':
+        return self._evolve(redo_stack=self.redo_stack.push(action))
 
-    def pop_redo(self) -> Tuple[Optional[Tuple[int, int, int]], 'GameState']:
+    def pop_redo(self) -> Tuple[Optional[Action], 'GameState']:
         if not self.redo_stack:
             return None, self
-        action = self.redo_stack[-1]
-        new_redo_stack = self.redo_stack[:-1]
-        return action, GameState(self.grid, self.config, self.hints_used, self.undo_stack, new_redo_stack)
+        action, new_redo_stack = self.redo_stack.pop()
+        return action, self._evolve(redo_stack=new_redo_stack)
 
     def clear_redo(self) -> 'GameState':
-        return GameState(self.grid, self.config, self.hints_used, self.undo_stack, [])
+        return self._evolve(redo_stack=EMPTY_STACK, redo_snapshots=EMPTY_STACK)
+
+    def record_move(self, grid: Grid, actions: Sequence[Action]) -> 'GameState':
+        """
+        Apply a move: keep the current grid as an undo snapshot and switch to the new grid.
+
+        Args:
+            grid (Grid): The grid after the move.
+            actions (Sequence[Action]): (row, col, previous value) for each cell the move touched.
+
+        Returns:
+            GameState: The updated state, with the redo history cleared.
+        """
+        undo_stack = self.undo_stack
+        for action in actions:
+            undo_stack = undo_stack.push(action)
+        snapshot = Snapshot(self.grid, grid, len(undo_stack), len(actions))
+        return self._evolve(grid=grid, undo_stack=undo_stack, undo_snapshots=self.undo_snapshots.push(snapshot),
+                            redo_stack=EMPTY_STACK, redo_snapshots=EMPTY_STACK)
+
+    def undo(self) -> Tuple[List[Action], 'GameState']:
+        """
+        Undo the last move. Moves recorded with record_move are restored by switching back to their
+        snapshot; single actions without a usable snapshot (e.g. from a saved game) are replayed cell by cell.
+
+        Returns:
+            Tuple[List[Action], GameState]: The undone actions, most recent first, and the updated state.
+        """
+        actions, undo_stack, undo_snapshots, redo_stack, redo_snapshots, grid = self._step(
+            self.undo_stack, self.undo_snapshots, self.redo_stack, self.redo_snapshots)
+        return actions, self._evolve(grid=grid, undo_stack=undo_stack, undo_snapshots=undo_snapshots,
+                                     redo_stack=redo_stack, redo_snapshots=redo_snapshots)
+
+    def redo(self) -> Tuple[List[Action], 'GameState']:
+        """
+        Redo the last undone move, the mirror image of undo.
+
+        Returns:
+            Tuple[List[Action], GameState]: The redone actions, most recent first, and the updated state.
+        """
+        actions, redo_stack, redo_snapshots, undo_stack, undo_snapshots, grid = self._step(
+            self.redo_stack, self.redo_snapshots, self.undo_stack, self.undo_snapshots)
+        return actions, self._evolve(grid=grid, undo_stack=undo_stack, undo_snapshots=undo_snapshots,
+                                     redo_stack=redo_stack, redo_snapshots=redo_snapshots)
+
+    def history_size(self) -> int:
+        return len(self.undo_stack) + len(self.redo_stack)
+
+    def trim_history(self, max_entries: int) -> 'GameState':
+        """
+        Keep only the most recent max_entries undo and redo actions, with the snapshots covering them.
+
+        Args:
+            max_entries (int): The number of actions kept on each stack.
+
+        Returns:
+            GameState: The state with the older history dropped.
+        """
+        undo_stack, undo_snapshots = trim_stack(self.undo_stack, self.undo_snapshots, max_entries)
+        redo_stack, redo_snapshots = trim_stack(self.redo_stack, self.redo_snapshots, max_entries)
+        return self._evolve(undo_stack=undo_stack, undo_snapshots=undo_snapshots,
+                            redo_stack=redo_stack, redo_snapshots=redo_snapshots)
+
+    def _step(self, source: PersistentStack, source_snapshots: PersistentStack, target: PersistentStack,
+              target_snapshots: PersistentStack) -> Tuple:
+        # Move the top entry of one history to the other, restoring the grid it describes
+        if not source:
+            return [], source, source_snapshots, target, target_snapshots, self.grid
+
+        snapshot = source_snapshots.peek()
+        covers_top = snapshot is not None and snapshot.depth == len(source)
+        action_count = snapshot.action_count if covers_top else 1
+        if covers_top:
+            _, source_snapshots = source_snapshots.pop()
+
+        grid = self.grid
+        actions = []
+        for _ in range(action_count):
+            action, source = source.pop()
+            row, col, value = action
+            target = target.push((row, col, grid[row, col].value.value))
+            if not covers_top or snapshot.after is not self.grid:
+                # No snapshot for the current grid (e.g. a hint was applied since), restore the cell itself
+                state = CellState.USER_FILLED if value is not None and value != 0 else CellState.EMPTY
+                grid = update_grid(grid, Coordinate(row, col, grid.grid_size), value or None, state)
+            actions.append(action)
+
+        if covers_top and snapshot.after is self.grid:
+            grid = snapshot.grid  # Pointer swap, nothing is rebuilt
+        if covers_top:
+            target_snapshots = target_snapshots.push(Snapshot(self.grid, grid, len(target), action_count))
+        return actions, source, source_snapshots, target, target_snapshots, grid
@@ -1,5 +1,7 @@
+import random
 from dataclasses import dataclass
-from typing import Tuple, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Tuple, Dict, Optional, Union, List
 
 import numpy as np
 
@@ -11,6 +13,21 @@ from core_data.coordinate import Coordinate
 from core_data.row import Row
 
 
+# Zobrist tables per grid size: ZOBRIST_TABLES[size][cell_index][value] is a random 64-bit key
+ZOBRIST_TABLES: Dict[int, List[List[int]]] = {}
+
+
+def zobrist_table(grid_size: int) -> List[List[int]]:
+    table = ZOBRIST_TABLES.get(grid_size)
+    if table is None:
+        # Seeded by size so hashes are reproducible across runs and processes
+        rng = random.Random(grid_size)
+        # Empty cells (value 0) contribute nothing to the hash
+        table = [[0] + [rng.getrandbits(64) for _ in range(grid_size)] for _ in range(grid_size * grid_size)]
+        ZOBRIST_TABLES[grid_size] = table
+    return table
+
+
 @dataclass(frozen=True)
 class Grid:
     rows: Tuple[Row, ...]  # Immutable tuple of Row objects
@@ -79,7 +96,41 @@ class Grid:
         new_rows = list(self.rows)
         new_rows[coord.row_index] = new_row
         # Return a new Grid instance with the updated rows
-        return Grid(tuple(new_rows), self.grid_size)
+        new_grid = Grid(tuple(new_rows), self.grid_size)
+        # Carry the hash over in O(1): XOR the old value out and the new value in
+        if '_zobrist_hash' in self.__dict__:
+            old_cell = self.rows[coord.row_index].cells.get(coord)
+            cell_keys = zobrist_table(self.grid_size)[coord.row_index * self.grid_size + coord.col_index]
+            old_value = (old_cell.value.value or 0) if old_cell is not None else 0
+            new_hash = self._zobrist_hash ^ cell_keys[old_value] ^ cell_keys[cell.value.value or 0]
+            object.__setattr__(new_grid, '_zobrist_hash', new_hash)
+        return new_grid
+
+    @property
+    def zobrist_hash(self) -> int:
+        """64-bit Zobrist hash of the cell values, computed once and then updated incrementally."""
+        if '_zobrist_hash' not in self.__dict__:
+            table = zobrist_table(self.grid_size)
+            zobrist = 0
+            for row in self.rows:
+                for coord, cell in row.cells.items():
+                    if cell.value.value:
+                        zobrist ^= table[coord.row_index * self.grid_size + coord.col_index][cell.value.value]
+            object.__setattr__(self, '_zobrist_hash', zobrist)
+        return self._zobrist_hash
+
+    def __hash__(self) -> int:
+        return self.zobrist_hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Grid):
+            return NotImplemented
+        # Fast path: grids with different values always have different hashes
+        if self.grid_size != other.grid_size or self.zobrist_hash != other.zobrist_hash:
+            return False
+        return self.rows == other.rows
 
     @staticmethod
     def is_valid(rows: Tuple[Row, ...], grid_size: int) -> Tuple[bool, str]:
@@ -133,6 +184,18 @@ class Grid:
 
         return True, "Grid is valid."
 
+    def __reduce__(self):
+        # Pickle as the grid size plus one byte per cell for the value and one for the state
+        grid_size = self.grid_size
+        values = bytearray(grid_size * grid_size)
+        states = bytearray([CELL_STATES.index(CellState.EMPTY)]) * (grid_size * grid_size)
+        for row in self.rows:
+            for coord, cell in row.cells.items():
+                index = coord.row_index * grid_size + coord.col_index
+                values[index] = cell.value.value or 0
+                states[index] = CELL_STATES.index(cell.state)
+        return grid_from_bytes, (grid_size, bytes(values), bytes(states))
+
     def to_numpy(self) -> np.ndarray:
         """Convert the Grid to a numpy ndarray."""
         grid_array = np.zeros((self.grid_size, self.grid_size), dtype=int)
@@ -142,6 +205,54 @@ class Grid:
         return grid_array
 
 
+# Cell states in the order used by the byte encoding of pickled grids
+CELL_STATES: Tuple[CellState, ...] = tuple(CellState)
+
+# Shared immutable instances for the trusted construction path
+TRUSTED_COORDINATES: Dict[int, Tuple[Coordinate, ...]] = {}
+TRUSTED_CELLS: Dict[Tuple[int, int, int], Cell] = {}
+
+
+def trusted_cell(value: int, state_index: int, grid_size: int) -> Cell:
+    key = (value, state_index, grid_size)
+    cell = TRUSTED_CELLS.get(key)
+    if cell is None:
+        # Validated once through the public constructors, then shared by every trusted grid
+        cell = Cell(CellValue(value or None, grid_size), CELL_STATES[state_index])
+        TRUSTED_CELLS[key] = cell
+    return cell
+
+
+def grid_from_bytes(grid_size: int, values: bytes, states: bytes) -> Grid:
+    """
+    Rebuild a grid pickled by Grid.__reduce__ without re-running the validators.
+
+    Only byte strings produced by a valid Grid should be passed in; the rows and the grid
+    are assembled directly from shared, already-validated Coordinate and Cell instances.
+    """
+    if len(values) != grid_size * grid_size or len(states) != grid_size * grid_size:
+        raise ValueError("Encoded grid does not match its grid size.")
+    coordinates = TRUSTED_COORDINATES.get(grid_size)
+    if coordinates is None:
+        coordinates = tuple(Coordinate(r, c, grid_size) for r in range(grid_size) for c in range(grid_size))
+        TRUSTED_COORDINATES[grid_size] = coordinates
+
+    rows = []
+    for row_index in range(grid_size):
+        start = row_index * grid_size
+        cells = {coordinates[index]: trusted_cell(values[index], states[index], grid_size)
+                 for index in range(start, start + grid_size)}
+        row = object.__new__(Row)
+        object.__setattr__(row, 'cells', MappingProxyType(cells))
+        object.__setattr__(row, 'row_index', row_index)
+        rows.append(row)
+
+    grid = object.__new__(Grid)
+    object.__setattr__(grid, 'rows', tuple(rows))
+    object.__setattr__(grid, 'grid_size', grid_size)
+    return grid
+
+
 # Example Usage
 def test_grid():
     max_value = 9
@@ -165,9 +276,5 @@ if __name__ == "__main__":
 
 
 def update_grid(grid: Grid, coordinate: Coordinate, value: Optional[int], state: CellState) -> object:
-    new_cells = {coord: cell for row in grid.rows for coord, cell in row.cells.items()}
-    new_cells[coordinate] = Cell(CellValue(value, grid.grid_size), state)
-    rows = tuple(
-        Row({coord: new_cells[coord] for coord in new_cells if coord.row_index == row_index}, row_index) for row_index
-        in range(grid.grid_size))
-    return Grid(rows=rows, grid_size=grid.grid_size)
+    # Only the updated row is rebuilt; the other rows and the Zobrist hash are carried over
+    return grid.with_updated_cell(coordinate, Cell(CellValue(value, grid.grid_size), state))
@@ -0,0 +1,84 @@
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+
+class PersistentStack:
+    """
+    An immutable stack stored as a cons list. Push and pop are O(1) and every version shares
+    its tail with the versions it was built from, so keeping old versions costs nothing extra.
+
+    Iteration, indexing and equality follow list order (bottom first) so a stack can stand in
+    for the lists previously used for the undo and redo history.
+    """
+    __slots__ = ('head', 'tail', 'size')
+
+    def __new__(cls, head: Any = None, tail: Optional['PersistentStack'] = None):
+        instance = super(PersistentStack, cls).__new__(cls)
+        object.__setattr__(instance, 'head', head)  # The top item, None for the empty stack
+        object.__setattr__(instance, 'tail', tail)  # The stack below the top item, None for the empty stack
+        object.__setattr__(instance, 'size', 0 if tail is None else tail.size + 1)
+        return instance
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("PersistentStack is immutable.")
+
+    @staticmethod
+    def from_iterable(items: Iterable[Any]) -> 'PersistentStack':
+        # Items are given bottom first, as in a list
+        stack = EMPTY_STACK
+        for item in items:
+            stack = stack.push(item)
+        return stack
+
+    def push(self, item: Any) -> 'PersistentStack':
+        return PersistentStack(item, self)
+
+    def pop(self) -> Tuple[Optional[Any], 'PersistentStack']:
+        if self.tail is None:
+            return None, self
+        return self.head, self.tail
+
+    def peek(self) -> Optional[Any]:
+        return self.head
+
+    def to_list(self) -> List[Any]:
+        items = []
+        stack = self
+        while stack.tail is not None:
+            items.append(stack.head)
+            stack = stack.tail
+        items.reverse()
+        return items
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __bool__(self) -> bool:
+        return self.tail is not None
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.to_list())
+
+    def __getitem__(self, index: int) -> Any:
+        # The top of the stack is the last list element and is reachable in O(1)
+        if index == -1 and self.tail is not None:
+            return self.head
+        return self.to_list()[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PersistentStack):
+            return self.size == other.size and (self is other or self.to_list() == other.to_list())
+        if isinstance(other, (list, tuple)):
+            return self.size == len(other) and self.to_list() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"PersistentStack({self.to_list()!r})"
+
+    def __reduce__(self):
+        # Pickle as a flat list so long histories do not recurse through every cons cell
+        return PersistentStack.from_iterable, (self.to_list(),)
+
+
+EMPTY_STACK = PersistentStack()
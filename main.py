@@ -1,31 +1,62 @@
+import argparse
 import logging
+from typing import List, Optional
+
+from colorama import just_fix_windows_console
 
 from config.config import load_config, get_config_path
+from puzzle_handler.puzzle_solver.background_solver import configure_background_solver
+from puzzle_handler.puzzle_solver.solution_cache import configure_solution_cache
+from server.game_server import run_server
+from user_interface.controller.headless_controller import run_headless
 from user_interface.controller.main_menu_controller import menu_loop
+from utils.async_logging import configure_logging, stop_logging
+from utils.profiling import configure_profiling
+from utils.tracing import configure_tracing, log_trace_report
+
 
-# Configure logging to log to both console and file
-logging.basicConfig(
-    level=logging.DEBUG,  # Set the logging level to DEBUG to capture all types of log messages
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Define the log format
-    handlers=[
-        logging.FileHandler("error_log.txt")  # Log to a file
-    ]
-)
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Play Sudoku in the terminal.")
+    parser.add_argument("--headless", action="store_true",
+                        help="Read JSON commands from stdin, one per line, and write JSON results to stdout.")
+    parser.add_argument("--serve", action="store_true",
+                        help="Host many players over a local socket, as configured in the 'server' section.")
+    return parser.parse_args(argv)
 
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """
-    Main function to initialize configuration and start the menu loop.
+    Main function to initialize configuration and start the menu loop, or the headless command mode.
     """
+    arguments = parse_arguments(argv)
+    configure_logging({})  # Errors loading the configuration still reach the default log file
     try:
         config_path = get_config_path()  # Get the configuration file path
         config = load_config(config_path)  # Load the configuration settings
-
+        configure_logging(config)  # Level and file from the 'logging' section, written on a background thread
+        configure_solution_cache(config)  # Enable the persistent solver cache if configured
+        configure_tracing(config)  # Time user actions and solver calls if configured
+        configure_profiling(config)  # Profile chosen actions if configured or asked for in the environment
+
+        if arguments.headless:
+            run_headless(config)  # Scripted play: no prompts, no rendering
+            return
+        if arguments.serve:
+            run_server(config)  # Many sessions speaking the headless protocol over a socket
+            return
+
+        configure_background_solver(config)  # Solve ahead while the player is at a prompt
+        just_fix_windows_console()  # Enable ANSI colours and cursor moves on Windows consoles
         menu_loop(config)  # Initial call to start the menu loop
 
     except Exception as e:
         logging.error("An error occurred", exc_info=True)  # Log the error to the file
+        if arguments.headless or arguments.serve:
+            raise
         input("An error occurred. Press Enter to exit...")  # Keep the window open for the user to see the error
+    finally:
+        log_trace_report()  # Latency percentiles per action, when tracing is enabled
+        stop_logging()  # Write out the queued log records
 
 
 if __name__ == "__main__":
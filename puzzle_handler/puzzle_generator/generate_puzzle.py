@@ -1,10 +1,13 @@
-from typing import Dict
+import random
+from typing import Dict, Optional
 
 from core_data.coordinate import Coordinate
 from core_data.grid import Grid
 from puzzle_handler.puzzle_generator.remove_cell import remove_cells_recursive
-from puzzle_handler.puzzle_solver.puzzle_solver import backtrack, count_solutions, apply_naked_singles
+from puzzle_handler.puzzle_solver.puzzle_solver import apply_naked_singles
+from puzzle_handler.puzzle_solver.solution_cache import solve_cached, count_solutions_cached
 from utils.grid_utils import remove_cells
+from utils.tracing import traced
 
 
 class PuzzleGenerationError(Exception):
@@ -20,13 +23,15 @@ def determine_cells_to_remove(grid_size: int, difficulty: str) -> int:
     return difficulty_levels.get(difficulty.lower(), grid_size * grid_size // 4)
 
 
-def generate_puzzle(config: Dict, difficulty: str) -> Grid:
+@traced("generate_puzzle")
+def generate_puzzle(config: Dict, difficulty: str, rng: Optional[random.Random] = None) -> Grid:
+    # rng picks the cells to empty; the global generator does when it is None
     grid_size = config.get('grid_size', 9)
     validate_grid_size(grid_size)
     grid = create_and_solve_grid(grid_size)
     grid = apply_naked_singles(grid)
     num_cells_to_remove = determine_cells_to_remove(grid_size, difficulty)
-    coordinates_to_remove = select_cells_to_remove(grid_size, num_cells_to_remove)
+    coordinates_to_remove = select_cells_to_remove(grid_size, num_cells_to_remove, rng)
     grid = remove_cells_recursive(coordinates_to_remove, grid, grid_size)
     ensure_unique_solution(grid, grid_size)
     return grid
@@ -39,17 +44,17 @@ def validate_grid_size(grid_size: int):
 
 def create_and_solve_grid(grid_size: int) -> Grid:
     grid = Grid.create(grid_size=grid_size)
-    grid, success = backtrack(grid)
+    grid, success = solve_cached(grid)
     if not success:
         raise PuzzleGenerationError("Failed to puzzle_generator a valid Sudoku puzzle using backtracking.")
     return grid
 
 
-def select_cells_to_remove(grid_size: int, num_cells_to_remove: int) -> set:
-    cells_to_remove = remove_cells(grid_size, num_cells_to_remove)
+def select_cells_to_remove(grid_size: int, num_cells_to_remove: int, rng: Optional[random.Random] = None) -> set:
+    cells_to_remove = remove_cells(grid_size, num_cells_to_remove, rng)
     return {Coordinate(row, col, grid_size) for row, col in cells_to_remove}
 
 
 def ensure_unique_solution(grid: Grid, grid_size: int):
-    if count_solutions(grid, grid_size) != 1:
+    if count_solutions_cached(grid, grid_size) != 1:
         raise PuzzleGenerationError("Generated puzzle does not have a unique solution!")
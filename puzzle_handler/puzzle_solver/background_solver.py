@@ -0,0 +1,177 @@
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from core_data.grid import Grid
+from puzzle_handler.puzzle_solver.logical_hints import HintMap, build_hint_map
+from puzzle_handler.puzzle_solver.solution_cache import (known_solution, known_solution_count, store_solution,
+                                                         store_solution_count)
+from puzzle_handler.puzzle_solver.stepwise_solver import (solve_stepwise, count_solutions_stepwise, SolverSteps,
+                                                          DEFAULT_SLICE_NODES)
+
+
+@dataclass(frozen=True)
+class Precomputed:
+    """What the background solver worked out for one grid."""
+    grid: Grid  # The grid the results belong to
+    solution_count: int  # As count_solutions_cached returns with its default limit of 2
+    solution: Optional[Grid]  # The solved grid when the solution is unique, otherwise None
+    hint_map: HintMap  # The logical deductions on the grid; HintMap.easiest ranks them
+
+
+class BackgroundSolver:
+    """
+    Builds the hint map of the grid being played, counts its solutions and solves it on a daemon thread
+    while the player is at a prompt. Submitting another grid abandons the current search within one slice
+    of the stepwise solver and starts on the new grid. Finished counts and solutions go into the solution
+    cache, so solve_cached and count_solutions_cached answer them too.
+    """
+
+    def __new__(cls, slice_nodes: int = DEFAULT_SLICE_NODES):
+        instance = super(BackgroundSolver, cls).__new__(cls)
+        instance.slice_nodes = slice_nodes
+        instance._condition = threading.Condition()
+        instance._target = None  # The grid to work on, None when idle
+        instance._result = None  # Precomputed for the last grid finished
+        instance._failed = None  # The last grid whose precomputation raised
+        instance._stopped = False
+        instance._thread = None
+        return instance
+
+    def submit(self, grid: Optional[Grid]) -> None:
+        """
+        Make the grid the one to work on, abandoning work on any other grid. None leaves the worker idle.
+        """
+        with self._condition:
+            if self._stopped or grid == self._target:
+                return
+            self._target = grid
+            if self._thread is None and grid is not None:
+                self._thread = threading.Thread(target=self._run, name="background-solver", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def result(self, grid: Grid, timeout: Optional[float] = None) -> Optional[Precomputed]:
+        """
+        Get the precomputed results for the grid, waiting if the worker is still on it.
+
+        Args:
+            grid (Grid): The grid being played.
+            timeout (Optional[float]): The longest wait in seconds, None to wait until the worker is done.
+
+        Returns:
+            Optional[Precomputed]: The results, or None if the grid was not submitted or its work failed.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._ready(grid) or self._stopped or grid != self._target
+                                     or grid == self._failed, timeout)
+            return self._result if self._ready(grid) else None
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def _ready(self, grid: Grid) -> bool:
+        return self._result is not None and self._result.grid == grid
+
+    def _has_work(self) -> bool:
+        return self._target is not None and not self._ready(self._target) and self._target != self._failed
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._stopped or self._has_work())
+                if self._stopped:
+                    return
+                grid = self._target
+            try:
+                result = self._precompute(grid)
+                failed = False
+            except Exception:
+                logging.error("Background solver failed", exc_info=True)
+                result, failed = None, True
+            with self._condition:
+                if result is not None:
+                    self._result = result
+                if failed:
+                    self._failed = grid
+                self._condition.notify_all()
+
+    def _superseded(self, grid: Grid) -> bool:
+        return self._stopped or grid != self._target
+
+    def _finish(self, steps: SolverSteps, grid: Grid) -> Tuple[bool, object]:
+        # Run a stepwise solver, checking between slices whether the grid is still wanted
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return True, stop.value
+            if self._superseded(grid):
+                steps.close()
+                return False, None
+
+    def _precompute(self, grid: Grid) -> Optional[Precomputed]:
+        hint_map = build_hint_map(grid)
+        solution_count = known_solution_count(grid)
+        if solution_count is None:
+            finished, solution_count = self._finish(
+                count_solutions_stepwise(grid, grid.grid_size, slice_nodes=self.slice_nodes), grid)
+            if not finished:
+                return None
+            store_solution_count(grid, solution_count)
+
+        if solution_count != 1:
+            return Precomputed(grid, solution_count, None, hint_map)
+        solved = known_solution(grid)
+        if solved is None:
+            finished, solved = self._finish(solve_stepwise(grid, self.slice_nodes), grid)
+            if not finished:
+                return None
+            store_solution(grid, *solved)
+        solved_grid, success = solved
+        if not success:
+            return Precomputed(grid, solution_count, None, hint_map)
+        return Precomputed(grid, solution_count, solved_grid, hint_map)
+
+
+# The worker for the interactive game, enabled through configure_background_solver
+background_solver: Optional[BackgroundSolver] = None
+
+
+def configure_background_solver(config: Dict) -> None:
+    """
+    Start or disable the background solver from the 'background_solver' configuration section.
+
+    Args:
+        config (Dict): The game configuration.
+    """
+    global background_solver
+    if background_solver is not None:
+        background_solver.stop()
+    settings = config.get('background_solver') or {}
+    if settings.get('enabled', False):
+        background_solver = BackgroundSolver(settings.get('slice_nodes', DEFAULT_SLICE_NODES))
+    else:
+        background_solver = None
+
+
+def precompute(grid: Optional[Grid]) -> None:
+    """
+    Let the background solver, if enabled, work on the grid; None stops it working.
+    """
+    if background_solver is not None:
+        background_solver.submit(grid)
+
+
+def precomputed(grid: Grid, timeout: Optional[float] = None) -> Optional[Precomputed]:
+    """
+    Get the background solver's results for the grid, waiting up to timeout seconds (None for as long as it
+    takes, 0 not at all) if it is working on the grid. Returns None when the solver is disabled, was not given
+    this grid or has not finished it in time.
+    """
+    if background_solver is None:
+        return None
+    return background_solver.result(grid, timeout)
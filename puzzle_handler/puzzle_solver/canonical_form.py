@@ -0,0 +1,127 @@
+from dataclasses import dataclass
+from itertools import islice, permutations, product
+from math import isqrt
+from typing import Tuple, List, Sequence, Iterator
+
+# Upper bound on the tied row (or column) orderings examined per orientation.
+# Puzzles whose invariants leave more ties than this still get a valid representative,
+# it is just not guaranteed to be shared with every equivalent puzzle.
+MAX_TIED_ORDERINGS = 12
+
+
+@dataclass(frozen=True)
+class Transform:
+    """A validity-preserving Sudoku symmetry: optional transpose, band/row and stack/column order, digit relabel."""
+    transpose: bool  # Whether the grid is transposed before reordering
+    row_order: Tuple[int, ...]  # row_order[i] is the source row placed at canonical row i
+    col_order: Tuple[int, ...]  # col_order[j] is the source column placed at canonical column j
+    relabel: Tuple[int, ...]  # relabel[digit] is the canonical digit, index 0 keeps empty cells empty
+
+    def apply(self, values: Sequence[int], grid_size: int) -> Tuple[int, ...]:
+        """Map row-major values of the original grid to the canonical grid."""
+        oriented = transpose_values(values, grid_size) if self.transpose else values
+        return tuple(self.relabel[oriented[r * grid_size + c]] for r in self.row_order for c in self.col_order)
+
+    def invert(self, values: Sequence[int], grid_size: int) -> Tuple[int, ...]:
+        """Map row-major values of the canonical grid back to the original grid."""
+        inverse_relabel = [0] * len(self.relabel)
+        for digit, label in enumerate(self.relabel):
+            inverse_relabel[label] = digit
+        oriented = [0] * (grid_size * grid_size)
+        for i, r in enumerate(self.row_order):
+            for j, c in enumerate(self.col_order):
+                oriented[r * grid_size + c] = inverse_relabel[values[i * grid_size + j]]
+        return transpose_values(oriented, grid_size) if self.transpose else tuple(oriented)
+
+
+def transpose_values(values: Sequence[int], grid_size: int) -> Tuple[int, ...]:
+    return tuple(values[c * grid_size + r] for r in range(grid_size) for c in range(grid_size))
+
+
+def canonicalize(values: Sequence[int], grid_size: int) -> Tuple[Tuple[int, ...], Transform]:
+    """
+    Map a grid to its canonical representative and the transform that produces it.
+
+    The representative is the lexicographically smallest relabelled grid over every orientation and every
+    band/row and stack/column order that is consistent with the clue-pattern invariants. Relabelled digits,
+    swapped bands or stacks, swapped rows or columns within them and transposed grids therefore share a form.
+
+    Args:
+        values (Sequence[int]): Row-major cell values, 0 for empty cells.
+        grid_size (int): The size of the grid.
+
+    Returns:
+        Tuple[Tuple[int, ...], Transform]: The canonical values and the transform from the original grid.
+    """
+    best_key, best_transform = None, None
+    for transpose in (False, True):
+        oriented = transpose_values(values, grid_size) if transpose else tuple(values)
+        col_orders = list(line_orderings(transpose_values(oriented, grid_size), grid_size))
+        for row_order in line_orderings(oriented, grid_size):
+            for col_order in col_orders:
+                cells = [oriented[r * grid_size + c] for r in row_order for c in col_order]
+                key, relabel = relabel_by_first_appearance(cells, grid_size)
+                if best_key is None or key < best_key:
+                    best_key = key
+                    best_transform = Transform(transpose, row_order, col_order, relabel)
+    return best_key, best_transform
+
+
+def relabel_by_first_appearance(cells: Sequence[int], grid_size: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Renumber digits in order of first appearance; digits that never appear keep their relative order."""
+    relabel = [0] * (grid_size + 1)
+    next_label = 1
+    key = []
+    for value in cells:
+        if value and not relabel[value]:
+            relabel[value] = next_label
+            next_label += 1
+        key.append(relabel[value])
+    for digit in range(1, grid_size + 1):
+        if not relabel[digit]:
+            relabel[digit] = next_label
+            next_label += 1
+    return tuple(key), tuple(relabel)
+
+
+def line_orderings(values: Sequence[int], grid_size: int) -> Iterator[Tuple[int, ...]]:
+    """
+    Yield the row orders consistent with sorting bands, and rows within each band, by invariant keys.
+
+    Only rows with equal keys are permuted, so the orderings of two equivalent grids cover the same
+    canonical candidates. The number of orderings yielded is capped at MAX_TIED_ORDERINGS.
+    """
+    box_size = isqrt(grid_size)
+    row_counts = [sum(1 for c in range(grid_size) if values[r * grid_size + c]) for r in range(grid_size)]
+    col_counts = [sum(1 for r in range(grid_size) if values[r * grid_size + c]) for c in range(grid_size)]
+    # A row is characterised by its clue count and the clue counts of the columns it shares clues with
+    row_keys = [
+        (row_counts[r], tuple(sorted(col_counts[c] for c in range(grid_size) if values[r * grid_size + c])))
+        for r in range(grid_size)
+    ]
+    bands = [tuple(range(b * box_size, (b + 1) * box_size)) for b in range(box_size)]
+    band_keys = [tuple(sorted(row_keys[r] for r in band)) for band in bands]
+
+    band_orders = tied_permutations(list(range(box_size)), band_keys)
+    row_orders_per_band = [list(islice(tied_permutations(list(band), row_keys), MAX_TIED_ORDERINGS))
+                           for band in bands]
+
+    def orderings() -> Iterator[Tuple[int, ...]]:
+        for band_order in band_orders:
+            for row_orders in product(*row_orders_per_band):
+                yield tuple(r for b in band_order for r in row_orders[b])
+
+    return islice(orderings(), MAX_TIED_ORDERINGS)
+
+
+def tied_permutations(items: List[int], keys: Sequence) -> Iterator[Tuple[int, ...]]:
+    """Sort items by key and yield every order obtained by permuting items that share a key."""
+    ordered = sorted(items, key=lambda item: keys[item])
+    groups: List[List[int]] = []
+    for item in ordered:
+        if groups and keys[groups[-1][0]] == keys[item]:
+            groups[-1].append(item)
+        else:
+            groups.append([item])
+    for group_orders in product(*(permutations(group) for group in groups)):
+        yield tuple(item for group in group_orders for item in group)
@@ -0,0 +1,300 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations
+from types import MappingProxyType
+from typing import Callable, List, Mapping, Optional, Tuple
+
+from core_data.grid import Grid
+from utils.tracing import traced
+
+# Technique applications allowed per hint map before giving up; each one is a single pass over the grid
+DEFAULT_MAX_STEPS = 200
+
+Candidates = List[int]  # Bit mask of possible values per cell in row-major order, bit v - 1 for value v
+
+
+@dataclass(frozen=True)
+class LogicalHint:
+    """A value that follows from the grid by the named technique, after the listed eliminations."""
+    row: int
+    col: int
+    value: int
+    technique: str  # The technique placing the value, e.g. "hidden single"
+    eliminations: Tuple[str, ...] = ()  # Techniques that removed candidates first, in the order applied
+    difficulty: int = 1  # Rank of the hardest technique involved, 1 for a naked single
+    depth: int = 0  # Earlier deductions this one builds on, 0 if it follows from the grid as it is
+
+    def describe(self) -> str:
+        if not self.eliminations:
+            return self.technique
+        return f"{self.technique} after {', '.join(dict.fromkeys(self.eliminations))}"
+
+
+@dataclass(frozen=True)
+class Units:
+    """The cell indices of every row, column and subgrid of one grid size."""
+    rows: Tuple[Tuple[int, ...], ...]
+    columns: Tuple[Tuple[int, ...], ...]
+    boxes: Tuple[Tuple[int, ...], ...]
+    cell_units: Tuple[Tuple[int, int, int], ...]  # (row, column, box) number of each cell
+    peers: Tuple[Tuple[int, ...], ...]  # The other cells sharing a row, column or subgrid with each cell
+
+    @property
+    def all(self) -> Tuple[Tuple[int, ...], ...]:
+        # Boxes first: a value with one place in its subgrid is the easiest deduction to spot
+        return self.boxes + self.rows + self.columns
+
+
+@lru_cache(maxsize=None)
+def grid_units(grid_size: int) -> Units:
+    subgrid_size = int(grid_size ** 0.5)
+    rows = tuple(tuple(row * grid_size + col for col in range(grid_size)) for row in range(grid_size))
+    columns = tuple(tuple(row * grid_size + col for row in range(grid_size)) for col in range(grid_size))
+    boxes = tuple(
+        tuple((box_row + row) * grid_size + box_col + col
+              for row in range(subgrid_size) for col in range(subgrid_size))
+        for box_row in range(0, grid_size, subgrid_size) for box_col in range(0, grid_size, subgrid_size)
+    )
+    cell_units = tuple(
+        (index // grid_size, index % grid_size,
+         (index // grid_size) // subgrid_size * subgrid_size + (index % grid_size) // subgrid_size)
+        for index in range(grid_size * grid_size)
+    )
+    peers = tuple(
+        tuple(sorted(set(rows[row] + columns[col] + boxes[box]) - {index}))
+        for index, (row, col, box) in enumerate(cell_units)
+    )
+    return Units(rows, columns, boxes, cell_units, peers)
+
+
+def candidate_masks(grid: Grid) -> Optional[Candidates]:
+    """
+    Work out the candidates of every empty cell from its row, column and subgrid.
+
+    Returns:
+        Optional[Candidates]: The candidate masks (0 for filled cells), or None if the grid contradicts itself.
+    """
+    grid_size = grid.grid_size
+    units = grid_units(grid_size)
+    values = [0] * (grid_size * grid_size)
+    for row in grid.rows:
+        for coord, cell in row.cells.items():
+            values[coord.row_index * grid_size + coord.col_index] = cell.value.value or 0
+
+    used = {unit: 0 for unit in units.all}
+    for unit in units.all:
+        for index in unit:
+            if values[index]:
+                bit = 1 << (values[index] - 1)
+                if used[unit] & bit:
+                    return None  # The same value twice in one unit
+                used[unit] |= bit
+
+    full = (1 << grid_size) - 1
+    masks = [0] * (grid_size * grid_size)
+    for index, value in enumerate(values):
+        if not value:
+            row, col, box = units.cell_units[index]
+            masks[index] = full & ~(used[units.rows[row]] | used[units.columns[col]] | used[units.boxes[box]])
+            if not masks[index]:
+                return None  # An empty cell with nothing left to place
+    return masks
+
+
+def eliminate(masks: Candidates, cells, mask: int) -> bool:
+    changed = False
+    for index in cells:
+        if masks[index] & mask:
+            masks[index] &= ~mask
+            changed = True
+    return changed
+
+
+def locked_candidates(masks: Candidates, units: Units, lines_first: bool) -> bool:
+    # Pointing: a value confined to one line within a subgrid leaves the rest of that line.
+    # Box/line reduction: a value confined to one subgrid within a line leaves the rest of that subgrid.
+    grid_size = len(units.rows)
+    sources, targets = ((units.rows + units.columns, units.boxes) if lines_first
+                        else (units.boxes, units.rows + units.columns))
+    for source in sources:
+        for value in range(grid_size):
+            bit = 1 << value
+            cells = [index for index in source if masks[index] & bit]
+            if len(cells) < 2:
+                continue
+            for target in targets:
+                if target is not source and all(index in target for index in cells):
+                    if eliminate(masks, (index for index in target if index not in cells), bit):
+                        return True
+    return False
+
+
+def pointing(masks: Candidates, units: Units) -> bool:
+    return locked_candidates(masks, units, lines_first=False)
+
+
+def box_line_reduction(masks: Candidates, units: Units) -> bool:
+    return locked_candidates(masks, units, lines_first=True)
+
+
+def naked_subset(masks: Candidates, units: Units, size: int) -> bool:
+    # size cells of a unit whose candidates together number size: those values leave the rest of the unit
+    for unit in units.all:
+        small = [index for index in unit if masks[index] and bin(masks[index]).count('1') <= size]
+        for cells in combinations(small, size):
+            union = 0
+            for index in cells:
+                union |= masks[index]
+            if bin(union).count('1') == size:
+                if eliminate(masks, (index for index in unit if index not in cells), union):
+                    return True
+    return False
+
+
+def naked_pair(masks: Candidates, units: Units) -> bool:
+    return naked_subset(masks, units, 2)
+
+
+def naked_triple(masks: Candidates, units: Units) -> bool:
+    return naked_subset(masks, units, 3)
+
+
+def x_wing(masks: Candidates, units: Units) -> bool:
+    # A value with the same two places in two rows leaves the rest of both columns, and the other way round
+    grid_size = len(units.rows)
+    for lines, crossing in ((units.rows, units.columns), (units.columns, units.rows)):
+        for value in range(grid_size):
+            bit = 1 << value
+            pairs = {}
+            for line_number, line in enumerate(lines):
+                places = tuple(position for position, index in enumerate(line) if masks[index] & bit)
+                if len(places) == 2:
+                    pairs.setdefault(places, []).append(line_number)
+            for places, line_numbers in pairs.items():
+                if len(line_numbers) == 2:
+                    corners = {lines[number][position] for number in line_numbers for position in places}
+                    cells = (index for position in places for index in crossing[position] if index not in corners)
+                    if eliminate(masks, cells, bit):
+                        return True
+    return False
+
+
+# Techniques in order of cost. Singles, found by all_singles, are always placed first; elimination
+# techniques only run when there are none, and the search restarts from the cheapest after each one.
+PLACING_TECHNIQUES: Tuple[str, ...] = ("naked single", "hidden single")
+ELIMINATING_TECHNIQUES: Tuple[Tuple[str, Callable[[Candidates, Units], bool]], ...] = (
+    ("pointing", pointing),
+    ("box/line reduction", box_line_reduction),
+    ("naked pair", naked_pair),
+    ("naked triple", naked_triple),
+    ("x-wing", x_wing),
+)
+TECHNIQUE_RANKS = {name: rank for rank, name in
+                   enumerate(PLACING_TECHNIQUES + tuple(name for name, _ in ELIMINATING_TECHNIQUES), 1)}
+
+
+def difficulty(technique: str, eliminations: Tuple[str, ...]) -> int:
+    return max(TECHNIQUE_RANKS[name] for name in (technique,) + eliminations)
+
+
+@dataclass(frozen=True)
+class HintMap:
+    """Every value the techniques can deduce on a grid, by cell."""
+    hints: Mapping[Tuple[int, int], LogicalHint]  # Keyed by (row, col)
+
+    def get(self, row: int, col: int) -> Optional[LogicalHint]:
+        return self.hints.get((row, col))
+
+    def easiest(self) -> Optional[LogicalHint]:
+        # Deductions available now before those needing others first, then the cheapest technique
+        return min(self.hints.values(), key=lambda hint: (hint.depth, hint.difficulty, hint.row, hint.col),
+                   default=None)
+
+    def singles(self) -> Tuple[LogicalHint, ...]:
+        # The naked and hidden singles on the grid as it is
+        return tuple(hint for hint in self.hints.values() if hint.depth == 0 and not hint.eliminations)
+
+    def __len__(self) -> int:
+        return len(self.hints)
+
+
+EMPTY_HINT_MAP = HintMap(MappingProxyType({}))
+
+
+def all_singles(masks: Candidates, units: Units) -> List[Tuple[int, int, str]]:
+    # (cell index, value, technique) for every naked single, then every hidden single in another cell
+    singles = {}
+    for index, mask in enumerate(masks):
+        if mask and mask & (mask - 1) == 0:
+            singles[index] = (index, mask.bit_length(), "naked single")
+    for unit in units.all:
+        seen_once = 0
+        seen_twice = 0
+        for index in unit:
+            seen_twice |= seen_once & masks[index]
+            seen_once |= masks[index]
+        unit_singles = seen_once & ~seen_twice
+        if unit_singles:
+            for index in unit:
+                if masks[index] & unit_singles and index not in singles:
+                    bit = masks[index] & unit_singles
+                    singles[index] = (index, (bit & -bit).bit_length(), "hidden single")
+    return list(singles.values())
+
+
+@traced("build_hint_map")
+def build_hint_map(grid: Grid, max_steps: int = DEFAULT_MAX_STEPS) -> HintMap:
+    """
+    Deduce every value the techniques can reach in one propagation pass: all singles are placed together,
+    the eliminating techniques run only when there are none, and each deduction records how many rounds
+    of placements it needed and the hardest technique involved.
+
+    Args:
+        grid (Grid): The grid being played.
+        max_steps (int): The most technique applications to try.
+
+    Returns:
+        HintMap: The deductions, empty if the grid contradicts itself.
+    """
+    grid_size = grid.grid_size
+    masks = candidate_masks(grid)
+    if masks is None:
+        return EMPTY_HINT_MAP
+
+    units = grid_units(grid_size)
+    empty_cells = {index for index, mask in enumerate(masks) if mask}
+    hints = {}
+    eliminations = []
+    depth = 0
+    steps = 0
+    progress = True
+    while progress and steps < max_steps:
+        steps += 1
+        singles = all_singles(masks, units)
+        if singles:
+            applied = tuple(eliminations)
+            for index, value, technique in singles:
+                bit = 1 << (value - 1)
+                if not masks[index] & bit:
+                    return EMPTY_HINT_MAP  # Two singles claimed the same value in one unit
+                masks[index] = 0
+                empty_cells.discard(index)
+                for peer in units.peers[index]:
+                    masks[peer] &= ~bit
+                hints[(index // grid_size, index % grid_size)] = LogicalHint(
+                    index // grid_size, index % grid_size, value, technique, applied,
+                    difficulty(technique, applied), depth)
+            if any(not masks[index] for index in empty_cells):
+                return EMPTY_HINT_MAP  # A cell was left with nothing to place
+            depth += 1
+            continue
+        progress = False
+        for name, technique in ELIMINATING_TECHNIQUES:
+            steps += 1
+            if steps > max_steps:
+                break
+            if technique(masks, units):
+                eliminations.append(name)
+                progress = True
+                break
+    return HintMap(MappingProxyType(hints))
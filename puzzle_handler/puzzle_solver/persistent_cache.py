@@ -0,0 +1,154 @@
+import hashlib
+import logging
+import sqlite3
+import time
+from typing import Tuple, Optional, Sequence
+
+# Rows are (solution, solvable, solution_count, count_limit), mirroring CachedSolution
+CacheRow = Tuple[Optional[Tuple[int, ...]], Optional[bool], Optional[int], int]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    key TEXT PRIMARY KEY,
+    solution TEXT,
+    solvable INTEGER,
+    solution_count INTEGER,
+    count_limit INTEGER NOT NULL DEFAULT 0,
+    last_used REAL NOT NULL
+)
+"""
+
+# Merge with whatever another process stored meanwhile instead of overwriting known results with NULLs
+UPSERT = """
+INSERT INTO solutions (key, solution, solvable, solution_count, count_limit, last_used)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(key) DO UPDATE SET
+    solution = COALESCE(excluded.solution, solution),
+    solvable = COALESCE(excluded.solvable, solvable),
+    solution_count = COALESCE(excluded.solution_count, solution_count),
+    count_limit = CASE WHEN excluded.solution_count IS NULL THEN count_limit ELSE excluded.count_limit END,
+    last_used = excluded.last_used
+"""
+
+
+def content_hash(grid_size: int, values: Sequence[int]) -> str:
+    """
+    Hash the givens of a grid into a key that is stable across processes and sessions.
+    """
+    return hashlib.sha256(f"{grid_size}:{','.join(map(str, values))}".encode("ascii")).hexdigest()
+
+
+class PersistentSolutionCache:
+    """
+    An on-disk store of solutions and solution counts shared by every process using the same file.
+
+    Each operation runs on its own short-lived sqlite connection inside a transaction, so concurrent
+    processes and threads serialise on the database lock. The least recently used rows are evicted
+    once max_entries is exceeded. Storage errors are logged and treated as cache misses.
+    """
+
+    def __new__(cls, path: str, max_entries: int = 10000, timeout: float = 5.0):
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise ValueError("Persistent cache max_entries must be a positive integer.")
+        instance = super(PersistentSolutionCache, cls).__new__(cls)
+        instance.path = path
+        instance.max_entries = max_entries
+        instance.timeout = timeout
+        instance._initialise()
+        return instance
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode, transactions are opened explicitly where they are needed
+        return sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+
+    def _initialise(self) -> None:
+        try:
+            connection = self._connect()
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")  # Readers do not block the writer
+                connection.execute(SCHEMA)
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            logging.warning(f"Persistent solver cache unavailable at {self.path}: {e}")
+
+    def load(self, grid_size: int, values: Sequence[int]) -> Optional[CacheRow]:
+        """
+        Look up the stored results for the givens, refreshing their last-used time.
+
+        Args:
+            grid_size (int): The size of the grid.
+            values (Sequence[int]): Row-major givens, 0 for empty cells.
+
+        Returns:
+            Optional[CacheRow]: The stored results, or None if nothing is stored.
+        """
+        key = content_hash(grid_size, values)
+        try:
+            connection = self._connect()
+            try:
+                row = connection.execute(
+                    "SELECT solution, solvable, solution_count, count_limit FROM solutions WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                connection.execute("UPDATE solutions SET last_used = ? WHERE key = ?", (time.time(), key))
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            logging.warning(f"Persistent solver cache read failed: {e}")
+            return None
+
+        solution, solvable, solution_count, count_limit = row
+        return (tuple(int(value) for value in solution.split(",")) if solution else None,
+                None if solvable is None else bool(solvable), solution_count, count_limit)
+
+    def store(self, grid_size: int, values: Sequence[int], cache_row: CacheRow) -> None:
+        """
+        Store results for the givens, merging with any results already stored, then enforce the size cap.
+
+        Args:
+            grid_size (int): The size of the grid.
+            values (Sequence[int]): Row-major givens, 0 for empty cells.
+            cache_row (CacheRow): The results to store.
+        """
+        solution, solvable, solution_count, count_limit = cache_row
+        parameters = (
+            content_hash(grid_size, values),
+            ",".join(map(str, solution)) if solution is not None else None,
+            None if solvable is None else int(solvable),
+            solution_count,
+            count_limit,
+            time.time(),
+        )
+        try:
+            connection = self._connect()
+            try:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute(UPSERT, parameters)
+                (entries,) = connection.execute("SELECT COUNT(*) FROM solutions").fetchone()
+                if entries > self.max_entries:
+                    connection.execute(
+                        "DELETE FROM solutions WHERE key IN "
+                        "(SELECT key FROM solutions ORDER BY last_used ASC LIMIT ?)",
+                        (entries - self.max_entries,)
+                    )
+                connection.execute("COMMIT")
+            except sqlite3.Error:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                raise
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            logging.warning(f"Persistent solver cache write failed: {e}")
+
+    def __len__(self) -> int:
+        try:
+            connection = self._connect()
+            try:
+                return connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            return 0
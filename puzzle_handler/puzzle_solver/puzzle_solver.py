@@ -99,6 +99,7 @@ def find_empty_cell_with_fewest_options(grid: Grid) -> Optional[Tuple[int, int]]
 
 
 def backtrack(grid: Grid) -> Tuple[Grid, bool]:
+    # Runs once per search node: keep the messages lazily formatted, they are dropped below DEBUG
     logging.debug("Starting backtrack")
 
     grid = apply_naked_singles(grid)
@@ -109,7 +110,7 @@ def backtrack(grid: Grid) -> Tuple[Grid, bool]:
         return grid, True
 
     row, col = empty_cell
-    logging.debug(f"Empty cell found at {row, col}")
+    logging.debug("Empty cell found at %s", empty_cell)
 
     random_values = list(range(1, grid.grid_size + 1))
     sorted_values = sort_values_by_constraints(grid, row, col, random_values)
@@ -225,7 +226,7 @@ def check_unique_solvability(grid: Grid) -> bool:
     return count_solutions(grid, grid.grid_size) == 1
 
 
-def count_solutions(grid: Grid, grid_size: int, max_solutions: int = 2) -> int:
+def count_solutions(grid: Grid, grid_size: int, max_solutions: int = 2, raise_errors: bool = False) -> int:
     """
     Count the number of valid solutions for the Sudoku grid.
 
@@ -233,6 +234,8 @@ def count_solutions(grid: Grid, grid_size: int, max_solutions: int = 2) -> int:
         grid (Grid): The Sudoku grid.
         grid_size (int): The size of the grid.
         max_solutions (int): The maximum number of solutions to count.
+        raise_errors (bool): Raise errors of the search, such as a RecursionError on large grids, instead of
+            logging them and reporting 0 solutions.
 
     Returns:
         int: The number of valid solutions found.
@@ -252,7 +255,8 @@ def count_solutions(grid: Grid, grid_size: int, max_solutions: int = 2) -> int:
             # numpy_grid = grid.to_numpy()  # Convert Grid to numpy array
             if is_valid(grid, row, col, num):
                 new_grid = update_grid(grid, Coordinate(row, col, grid_size), num, CellState.PRE_FILLED)
-                num_solutions += count_solutions(new_grid, grid_size, max_solutions)
+                # Nested searches always raise, so a failure is not counted as a dead end and summed over
+                num_solutions += count_solutions(new_grid, grid_size, max_solutions, raise_errors=True)
                 if num_solutions >= max_solutions:
                     return num_solutions
             return count_values(num + 1)
@@ -260,6 +264,8 @@ def count_solutions(grid: Grid, grid_size: int, max_solutions: int = 2) -> int:
         num_solutions = count_values(1)
         return num_solutions
     except Exception as e:
+        if raise_errors:
+            raise
         logging.error(f"Error in count_solutions: {e}")
         return 0
 
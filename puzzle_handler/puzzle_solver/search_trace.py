@@ -0,0 +1,188 @@
+import gzip
+import json
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+# Event kinds written by SearchTrace, one JSON object per line
+BRANCH = "branch"  # A node picked a cell to guess on
+GUESS = "guess"  # A value was tried for the cell of the branch at the same depth
+BACKTRACK = "backtrack"  # The branch at this depth ran out of values and was abandoned
+SOLUTION = "solution"  # A node found the grid complete
+END = "end"  # The search finished
+
+
+class SearchTrace:
+    """
+    Writes the decisions of a stepwise solver as JSON lines. Every event carries the node being expanded
+    and the depth, the number of guesses on the current path.
+    """
+
+    def __new__(cls, stream: TextIO):
+        instance = super(SearchTrace, cls).__new__(cls)
+        instance._stream = stream
+        return instance
+
+    def emit(self, event: str, node: int, depth: int, **fields) -> None:
+        self._stream.write(json.dumps({"event": event, "node": node, "depth": depth, **fields},
+                                      separators=(",", ":")) + "\n")
+
+    def branch(self, node: int, depth: int, row: int, col: int, candidates: List[int], eliminated: int,
+               singles: int = 0) -> None:
+        # candidates: values the peers allow, in the order they are tried; eliminated: values the peers
+        # rule out; singles: cells the node filled by propagation before branching
+        self.emit(BRANCH, node, depth, row=row, col=col, candidates=candidates, eliminated=eliminated,
+                  singles=singles)
+
+    def guess(self, node: int, depth: int, row: int, col: int, value: int) -> None:
+        self.emit(GUESS, node, depth, row=row, col=col, value=value)
+
+    def backtrack(self, node: int, depth: int, row: int, col: int) -> None:
+        self.emit(BACKTRACK, node, depth, row=row, col=col)
+
+    def solution(self, node: int, depth: int) -> None:
+        self.emit(SOLUTION, node, depth)
+
+    def end(self, node: int, solutions: int) -> None:
+        self.emit(END, node, 0, solutions=solutions)
+
+
+@contextmanager
+def open_trace(path: str, mode: str = "r") -> Iterator[TextIO]:
+    """
+    Open a trace file for reading ('r') or writing ('w'), gzip-compressed if the path ends in .gz.
+    """
+    if path.endswith(".gz"):
+        with gzip.open(path, mode + "t", encoding="utf-8") as file:
+            yield file
+    else:
+        with open(path, mode, encoding="utf-8") as file:
+            yield file
+
+
+@dataclass(frozen=True)
+class WastedSubtree:
+    row: int
+    col: int
+    value: int  # The guess that led nowhere
+    depth: int  # Depth of the branch the guess was made at
+    first_node: int  # Node at which the guess was made
+    nodes: int  # Nodes expanded below the guess before it was abandoned
+
+
+@dataclass(frozen=True)
+class TraceSummary:
+    nodes: int  # Nodes expanded
+    solutions: int
+    max_depth: int
+    branches_by_depth: Dict[int, int]  # Branch decisions at each depth
+    hottest_cells: List[Tuple[Tuple[int, int], int, int]]  # ((row, col), branches, backtracks), most branched first
+    wasted: List[WastedSubtree] = field(default_factory=list)  # Largest failed subtrees not inside another one
+    wasted_nodes: int = 0  # Nodes expanded in failed subtrees
+
+    @property
+    def wasted_fraction(self) -> float:
+        return self.wasted_nodes / self.nodes if self.nodes else 0.0
+
+
+def read_events(lines: Iterable[str]) -> Iterator[Dict]:
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def summarise_trace(events: Iterable[Dict], top: int = 10) -> TraceSummary:
+    """
+    Summarise a search trace: how deep the search went, which cells it branched and backtracked on most,
+    and which guesses wasted the most nodes.
+
+    Args:
+        events (Iterable[Dict]): Parsed trace events, in the order they were written.
+        top (int): Cells and wasted subtrees to list.
+
+    Returns:
+        TraceSummary: The summary.
+    """
+    nodes = solutions = max_depth = 0
+    branches_by_depth: Counter = Counter()
+    branches_by_cell: Counter = Counter()
+    backtracks_by_cell: Counter = Counter()
+    open_guesses: List[List] = []  # [depth, row, col, value, first node, found a solution] along the current path
+    failed: List[WastedSubtree] = []
+
+    def close_guesses(depth: int, node: int) -> None:
+        # Guesses at this depth or deeper are finished; those that found no solution were wasted
+        while open_guesses and open_guesses[-1][0] >= depth:
+            guess_depth, row, col, value, first_node, productive = open_guesses.pop()
+            if not productive:
+                failed.append(WastedSubtree(row, col, value, guess_depth, first_node, node - first_node))
+
+    for event in events:
+        kind, node, depth = event["event"], event["node"], event["depth"]
+        nodes = max(nodes, node)
+        max_depth = max(max_depth, depth)
+        if kind == BRANCH:
+            branches_by_depth[depth] += 1
+            branches_by_cell[(event["row"], event["col"])] += 1
+        elif kind == GUESS:
+            close_guesses(depth, node)
+            open_guesses.append([depth, event["row"], event["col"], event["value"], node, False])
+        elif kind == BACKTRACK:
+            close_guesses(depth, node)
+            backtracks_by_cell[(event["row"], event["col"])] += 1
+        elif kind == SOLUTION:
+            solutions += 1
+            for guess in open_guesses:
+                guess[5] = True
+        elif kind == END:
+            close_guesses(0, node)
+
+    # Keep only the outermost failed subtrees, so nested failures are not counted twice
+    outermost: List[WastedSubtree] = []
+    for subtree in sorted(failed, key=lambda subtree: (subtree.first_node, subtree.depth)):
+        if outermost and subtree.first_node < outermost[-1].first_node + outermost[-1].nodes:
+            continue
+        outermost.append(subtree)
+    hottest = sorted(branches_by_cell, key=lambda cell: (-branches_by_cell[cell], -backtracks_by_cell[cell], cell))
+    return TraceSummary(
+        nodes, solutions, max_depth, dict(sorted(branches_by_depth.items())),
+        [(cell, branches_by_cell[cell], backtracks_by_cell[cell]) for cell in hottest[:top]],
+        sorted(outermost, key=lambda subtree: -subtree.nodes)[:top],
+        sum(subtree.nodes for subtree in outermost),
+    )
+
+
+def format_summary(summary: TraceSummary) -> str:
+    lines = [f"Nodes: {summary.nodes}, solutions: {summary.solutions}, max depth: {summary.max_depth}",
+             f"Wasted: {summary.wasted_nodes} nodes ({summary.wasted_fraction:.0%}) in failed subtrees",
+             "", "Branches by depth:"]
+    widest = max(summary.branches_by_depth.values(), default=0)
+    for depth, count in summary.branches_by_depth.items():
+        lines.append(f"  {depth:>3} {count:>7} {'#' * max(1, round(40 * count / widest))}")
+    lines += ["", "Hottest cells (branches, backtracks):"]
+    for (row, col), branches, backtracks in summary.hottest_cells:
+        lines.append(f"  {chr(ord('A') + row)}{col + 1:<3} {branches:>7} {backtracks:>7}")
+    lines += ["", "Largest wasted subtrees (guess, depth, first node, nodes):"]
+    for subtree in summary.wasted:
+        lines.append(f"  {chr(ord('A') + subtree.row)}{subtree.col + 1}={subtree.value:<4} {subtree.depth:>5} "
+                     f"{subtree.first_node:>10} {subtree.nodes:>7}")
+    return "\n".join(lines)
+
+
+def trace_summary_to_dict(summary: TraceSummary) -> Dict:
+    return {
+        "nodes": summary.nodes,
+        "solutions": summary.solutions,
+        "max_depth": summary.max_depth,
+        "branches_by_depth": summary.branches_by_depth,
+        "hottest_cells": [{"row": row, "col": col, "branches": branches, "backtracks": backtracks}
+                          for (row, col), branches, backtracks in summary.hottest_cells],
+        "wasted_nodes": summary.wasted_nodes,
+        "wasted": [asdict(subtree) for subtree in summary.wasted],
+    }
+
+
+def count_empty(values: Iterable[Optional[int]]) -> int:
+    return sum(1 for value in values if not value)
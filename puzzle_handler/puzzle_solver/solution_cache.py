@@ -0,0 +1,218 @@
+import logging
+from dataclasses import dataclass
+from typing import Tuple, Optional, Dict
+
+from core_data.grid import Grid
+from puzzle_handler.puzzle_solver.canonical_form import canonicalize, Transform
+from puzzle_handler.puzzle_solver.persistent_cache import PersistentSolutionCache
+from puzzle_handler.puzzle_solver.puzzle_solver import backtrack, count_solutions
+from puzzle_handler.puzzle_solver.solver_memo import solver_memo, memoize_solver
+from utils.grid_utils import grid_to_values, fill_empty_cells
+from utils.inflight import InFlightTable
+from utils.tracing import traced
+
+
+@dataclass(frozen=True)
+class CachedSolution:
+    """What is known about a canonical puzzle. Fields stay None until the matching solver has run."""
+    solution: Optional[Tuple[int, ...]] = None  # Canonical solution values, None if unknown or unsolvable
+    solvable: Optional[bool] = None  # Result of backtrack, None if it has not run
+    solution_count: Optional[int] = None  # Result of count_solutions, None if it has not run
+    count_limit: int = 0  # max_solutions used to compute solution_count
+
+
+# Optional on-disk layer behind the shared solver memo, enabled through configure_solution_cache
+persistent_cache: Optional[PersistentSolutionCache] = None
+
+# Searches and counts running now, so concurrent callers for the same canonical puzzle wait instead of repeating them
+solver_in_flight = InFlightTable()
+
+
+def configure_solution_cache(config: Dict) -> None:
+    """
+    Enable or disable the persistent solver cache from the 'solver_cache' configuration section.
+
+    Args:
+        config (Dict): The game configuration.
+    """
+    global persistent_cache
+    settings = config.get('solver_cache') or {}
+    if settings.get('persistent', False):
+        persistent_cache = PersistentSolutionCache(settings.get('path', 'solver_cache.sqlite3'),
+                                                   settings.get('max_entries', 10000))
+    else:
+        persistent_cache = None
+
+
+def lookup(key: Tuple) -> CachedSolution:
+    """
+    Fetch what is known about a canonical puzzle, from memory first and then from disk.
+    """
+    entry = solver_memo.get(('solution', key))
+    if entry is None:
+        entry = CachedSolution()
+        if persistent_cache is not None:
+            cache_row = persistent_cache.load(*key)
+            if cache_row is not None:
+                entry = CachedSolution(*cache_row)
+                solver_memo.put(('solution', key), entry)
+    return entry
+
+
+def remember(key: Tuple, entry: CachedSolution) -> None:
+    """
+    Record what is known about a canonical puzzle in memory and, when enabled, on disk.
+    """
+    solver_memo.put(('solution', key), entry)
+    if persistent_cache is not None:
+        persistent_cache.store(*key, (entry.solution, entry.solvable, entry.solution_count, entry.count_limit))
+
+
+@memoize_solver
+def canonical_key(grid: Grid) -> Tuple[Tuple, Transform]:
+    """
+    Compute the cache key shared by every puzzle equivalent to the grid.
+
+    Args:
+        grid (Grid): The Sudoku grid.
+
+    Returns:
+        Tuple[Tuple, Transform]: The cache key and the transform mapping the grid to its canonical form.
+    """
+    canonical_values, transform = canonicalize(grid_to_values(grid), grid.grid_size)
+    return (grid.grid_size, canonical_values), transform
+
+
+@traced("solve_cached")
+def solve_cached(grid: Grid) -> Tuple[Grid, bool]:
+    """
+    Solve the grid, answering repeated and equivalent puzzles from the solution cache. Concurrent calls
+    for equivalent puzzles share a single search.
+
+    Args:
+        grid (Grid): The Sudoku grid to solve.
+
+    Returns:
+        Tuple[Grid, bool]: The solved grid and True, or the original grid and False, as backtrack returns.
+    """
+    key, transform = canonical_key(grid)
+    entry = lookup(key)
+    if entry.solution is None and entry.solvable is not False and entry.solution_count != 0:
+        entry = solver_in_flight.run(('solve', key), lambda: solve_canonical(key, grid, transform))
+    if entry.solution is not None:
+        return fill_empty_cells(grid, transform.invert(entry.solution, grid.grid_size)), True
+    return grid, False
+
+
+def solve_canonical(key: Tuple, grid: Grid, transform: Transform) -> CachedSolution:
+    # Runs once per canonical puzzle at a time; callers map the canonical solution back through their transform
+    entry = lookup(key)
+    if entry.solution is not None or entry.solvable is False:
+        return entry
+    solved_grid, success = backtrack(grid)
+    return record_solution(key, transform, solved_grid, success)
+
+
+def record_solution(key: Tuple, transform: Transform, solved_grid: Grid, success: bool) -> CachedSolution:
+    solution = transform.apply(grid_to_values(solved_grid), solved_grid.grid_size) if success else None
+    entry = lookup(key)  # Keep counts stored while the search ran
+    entry = CachedSolution(solution, success, entry.solution_count, entry.count_limit)
+    remember(key, entry)
+    return entry
+
+
+@traced("count_solutions_cached")
+def count_solutions_cached(grid: Grid, grid_size: int, max_solutions: int = 2) -> int:
+    """
+    Count the solutions of the grid, answering repeated and equivalent puzzles from the solution cache.
+    Concurrent calls for equivalent puzzles and the same limit share a single count.
+
+    Args:
+        grid (Grid): The Sudoku grid.
+        grid_size (int): The size of the grid.
+        max_solutions (int): The maximum number of solutions to count.
+
+    Returns:
+        int: The number of valid solutions found, as count_solutions returns.
+    """
+    key, _ = canonical_key(grid)
+    cached = cached_count(lookup(key), max_solutions)
+    if cached is not None:
+        return cached
+    return solver_in_flight.run(('count', key, max_solutions),
+                                lambda: count_canonical(key, grid, grid_size, max_solutions))
+
+
+def cached_count(entry: CachedSolution, max_solutions: int) -> Optional[int]:
+    # An exact count answers any limit, a capped count only answers limits it already reached
+    if entry.solution_count is not None:
+        if entry.solution_count < entry.count_limit or max_solutions <= entry.count_limit:
+            return entry.solution_count
+    return None
+
+
+def count_canonical(key: Tuple, grid: Grid, grid_size: int, max_solutions: int) -> int:
+    cached = cached_count(lookup(key), max_solutions)
+    if cached is not None:
+        return cached
+    try:
+        num_solutions = count_solutions(grid, grid_size, max_solutions, raise_errors=True)
+    except Exception as e:
+        # A failed search, e.g. out of stack on a large grid, says nothing about the puzzle: report no
+        # solutions as count_solutions does, but cache nothing so the next call searches again
+        logging.error(f"Error in count_solutions: {e}")
+        return 0
+    record_count(key, num_solutions, max_solutions)
+    return num_solutions
+
+
+def record_count(key: Tuple, num_solutions: int, max_solutions: int) -> None:
+    entry = lookup(key)  # Keep a solution stored while the count ran
+    remember(key, CachedSolution(entry.solution, entry.solvable, num_solutions, max_solutions))
+
+
+def known_solution(grid: Grid) -> Optional[Tuple[Grid, bool]]:
+    """
+    Answer solve_cached from the solution cache alone.
+
+    Returns:
+        Optional[Tuple[Grid, bool]]: What solve_cached would return, or None if the grid has not been solved yet.
+    """
+    key, transform = canonical_key(grid)
+    entry = lookup(key)
+    if entry.solution is not None:
+        return fill_empty_cells(grid, transform.invert(entry.solution, grid.grid_size)), True
+    if entry.solvable is False or entry.solution_count == 0:
+        return grid, False
+    return None
+
+
+def known_solution_count(grid: Grid, max_solutions: int = 2) -> Optional[int]:
+    """
+    Answer count_solutions_cached from the solution cache alone, or return None if the count is not known.
+    """
+    key, _ = canonical_key(grid)
+    return cached_count(lookup(key), max_solutions)
+
+
+def store_solution(grid: Grid, solved_grid: Grid, success: bool) -> None:
+    """
+    Record a solve computed outside solve_cached (e.g. by a stepwise solver) so solve_cached can answer it.
+    """
+    key, transform = canonical_key(grid)
+    record_solution(key, transform, solved_grid, success)
+
+
+def store_solution_count(grid: Grid, num_solutions: int, max_solutions: int = 2) -> None:
+    """
+    Record a count computed outside count_solutions_cached so count_solutions_cached can answer it.
+    """
+    key, _ = canonical_key(grid)
+    record_count(key, num_solutions, max_solutions)
+
+
+def check_unique_solvability_cached(grid: Grid) -> bool:
+    """
+    Check if the Sudoku grid has a unique solution, consulting the solution cache first.
+    """
+    return count_solutions_cached(grid, grid.grid_size) == 1
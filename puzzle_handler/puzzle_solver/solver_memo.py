@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from typing import Tuple, Callable
+
+from core_data.grid import Grid
+from utils.grid_utils import grid_to_values
+from utils.lru_cache import LRUCache, CacheStats, memoize
+
+# Maximum number of results kept by the memo layer shared by all solver callers
+SOLVER_MEMO_SIZE = 4096
+
+solver_memo = LRUCache(SOLVER_MEMO_SIZE)
+
+
+@dataclass(frozen=True, eq=False)
+class GridKey:
+    """
+    Memo key for a grid's values and further arguments. It hashes by the grid's Zobrist hash, so lookups
+    stay cheap, and compares the values on a hash match, so two grids whose hashes collide never share a
+    result. Cell states are ignored, the solver only looks at values.
+    """
+    grid: Grid  # The grid whose values are looked up
+    args: Tuple  # Further arguments of the call
+
+    def __hash__(self) -> int:
+        return hash((self.grid.grid_size, self.grid.zobrist_hash, self.args))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GridKey):
+            return NotImplemented
+        if self.grid is other.grid:
+            return self.args == other.args
+        return (self.grid.grid_size == other.grid.grid_size and self.grid.zobrist_hash == other.grid.zobrist_hash
+                and self.args == other.args and grid_to_values(self.grid) == grid_to_values(other.grid))
+
+
+def grid_key(grid: Grid, *args) -> GridKey:
+    """
+    Build a hashable key from a grid's values and any further arguments.
+    """
+    return GridKey(grid, args)
+
+
+def memoize_solver(func: Callable) -> Callable:
+    """
+    Memoize a pure solver function whose first argument is a grid in the shared solver memo.
+    """
+    return memoize(solver_memo, grid_key)(func)
+
+
+def solver_memo_stats() -> CacheStats:
+    """
+    Report hits, misses and evictions of the shared solver memo.
+    """
+    return solver_memo.stats()
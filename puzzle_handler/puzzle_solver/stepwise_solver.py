@@ -0,0 +1,216 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Tuple, List, Callable, Optional, Generator, TypeVar
+
+from core_data.cell import Cell
+from core_data.cell_state import CellState
+from core_data.cell_value import CellValue
+from core_data.coordinate import Coordinate
+from core_data.grid import Grid, update_grid
+from puzzle_handler.puzzle_solver.puzzle_solver import (apply_naked_singles, find_empty_cell_with_fewest_options,
+                                                        sort_values_by_constraints, is_valid)
+from puzzle_handler.puzzle_solver.search_trace import SearchTrace, count_empty
+from utils.grid_utils import find_empty_cell, grid_to_values
+
+T = TypeVar('T')
+
+# Search nodes expanded between two progress reports; a 9x9 node takes several milliseconds
+DEFAULT_SLICE_NODES = 5
+
+
+@dataclass(frozen=True)
+class SolverProgress:
+    """Reported by the stepwise solvers at the end of each time slice."""
+    nodes: int  # Search nodes expanded so far
+    depth: int  # Guesses on the current search path
+    solutions: int  # Solutions found so far (at most 1 for solve_stepwise)
+
+
+SolverSteps = Generator[SolverProgress, None, T]
+
+
+def solve_stepwise(grid: Grid, slice_nodes: int = DEFAULT_SLICE_NODES,
+                   trace: Optional[SearchTrace] = None) -> SolverSteps[Tuple[Grid, bool]]:
+    """
+    Solve the grid as backtrack does, pausing every slice_nodes search nodes. The search runs on an
+    explicit stack, so it can be resumed from any loop and abandoned by closing the generator.
+
+    Args:
+        grid (Grid): The Sudoku grid to solve.
+        slice_nodes (int): The number of search nodes expanded between two yields.
+        trace (Optional[SearchTrace]): Records every branch, guess and backtrack when given.
+
+    Yields:
+        SolverProgress: Progress at the end of each slice.
+
+    Returns:
+        Tuple[Grid, bool]: The same result as backtrack, delivered through StopIteration.value.
+    """
+    grid_size = grid.grid_size
+    nodes = 0
+    root = None
+    frames: List[Tuple[Grid, int, int, List[int]]] = []  # (grid, row, col, values left to try) per guess
+    current = grid
+    while True:
+        nodes += 1
+        if nodes % slice_nodes == 0:
+            yield SolverProgress(nodes, len(frames), 0)
+
+        unpropagated = current
+        current = apply_naked_singles(current)
+        if root is None:
+            root = current
+        empty_cell = find_empty_cell_with_fewest_options(current)
+        if not empty_cell:
+            if trace is not None:
+                trace.solution(nodes, len(frames))
+                trace.end(nodes, 1)
+            return current, True
+        row, col = empty_cell
+        values = sort_values_by_constraints(current, row, col, list(range(1, grid_size + 1)))
+        if trace is not None:
+            candidates = [value for value in values if is_valid(current, row, col, value)]
+            singles = count_empty(grid_to_values(unpropagated)) - count_empty(grid_to_values(current))
+            trace.branch(nodes, len(frames), row, col, candidates, grid_size - len(candidates), singles)
+        frames.append((current, row, col, values))
+
+        # Move to the next valid value, backing up past guesses with none left
+        current = None
+        while frames and current is None:
+            parent, row, col, values = frames[-1]
+            while values and current is None:
+                value = values.pop(0)
+                if is_valid(parent, row, col, value):
+                    current = parent.with_updated_cell(Coordinate(row, col, grid_size),
+                                                       Cell(CellValue(value, grid_size), CellState.PRE_FILLED))
+                    if trace is not None:
+                        trace.guess(nodes, len(frames) - 1, row, col, value)
+            if current is None:
+                frames.pop()
+                if trace is not None:
+                    trace.backtrack(nodes, len(frames), row, col)
+        if current is None:
+            if trace is not None:
+                trace.end(nodes, 0)
+            return root, False
+
+
+def count_solutions_stepwise(grid: Grid, grid_size: int, max_solutions: int = 2,
+                             slice_nodes: int = DEFAULT_SLICE_NODES,
+                             trace: Optional[SearchTrace] = None) -> SolverSteps[int]:
+    """
+    Count the solutions of the grid as count_solutions does, pausing every slice_nodes search nodes.
+
+    Args:
+        grid (Grid): The Sudoku grid.
+        grid_size (int): The size of the grid.
+        max_solutions (int): The maximum number of solutions to count.
+        slice_nodes (int): The number of search nodes expanded between two yields.
+        trace (Optional[SearchTrace]): Records every branch, guess and backtrack when given.
+
+    Yields:
+        SolverProgress: Progress at the end of each slice.
+
+    Returns:
+        int: The same count as count_solutions, delivered through StopIteration.value.
+    """
+    nodes = 0
+    solutions = 0
+    frames: List[List] = []  # [grid, row, col, next value, solutions counted] per guess
+    current = grid
+    while True:
+        nodes += 1
+        if nodes % slice_nodes == 0:
+            yield SolverProgress(nodes, len(frames), solutions)
+
+        empty_cell = find_empty_cell(current)
+        if empty_cell:
+            row, col = empty_cell
+            if trace is not None:
+                candidates = [value for value in range(1, grid_size + 1) if is_valid(current, row, col, value)]
+                trace.branch(nodes, len(frames), row, col, candidates, grid_size - len(candidates))
+            frames.append([current, row, col, 1, 0])
+            result = None
+        else:
+            solutions += 1
+            result = 1
+            if trace is not None:
+                trace.solution(nodes, len(frames))
+
+        # Add finished subtrees to their parents until one has another value to try
+        current = None
+        while current is None:
+            if not frames:
+                if trace is not None:
+                    trace.end(nodes, result)
+                return result
+            frame = frames[-1]
+            parent, row, col, value, count = frame
+            if result is not None:
+                count += result
+                frame[4] = count
+                result = None
+                if count >= max_solutions:
+                    frames.pop()
+                    if trace is not None:
+                        trace.backtrack(nodes, len(frames), row, col)
+                    result = count
+                    continue
+            while value <= grid_size and not is_valid(parent, row, col, value):
+                value += 1
+            if value > grid_size:
+                frames.pop()
+                if trace is not None:
+                    trace.backtrack(nodes, len(frames), row, col)
+                result = count
+                continue
+            frame[3] = value + 1
+            current = update_grid(parent, Coordinate(row, col, grid_size), value, CellState.PRE_FILLED)
+            if trace is not None:
+                trace.guess(nodes, len(frames) - 1, row, col, value)
+
+
+def run_stepwise(steps: SolverSteps[T], on_progress: Optional[Callable[[SolverProgress], None]] = None) -> T:
+    """
+    Run a stepwise solver to the end in the calling thread.
+
+    Args:
+        steps (SolverSteps): A generator from solve_stepwise or count_solutions_stepwise.
+        on_progress (Optional[Callable[[SolverProgress], None]]): Called with the progress after each slice.
+
+    Returns:
+        The solver result.
+    """
+    while True:
+        try:
+            progress = next(steps)
+        except StopIteration as stop:
+            return stop.value
+        if on_progress is not None:
+            on_progress(progress)
+
+
+async def run_stepwise_async(steps: SolverSteps[T],
+                             on_progress: Optional[Callable[[SolverProgress], None]] = None) -> T:
+    """
+    Run a stepwise solver on the event loop, giving other tasks a turn after each slice. Cancelling
+    the awaiting task stops the search.
+
+    Args:
+        steps (SolverSteps): A generator from solve_stepwise or count_solutions_stepwise.
+        on_progress (Optional[Callable[[SolverProgress], None]]): Called with the progress after each slice.
+
+    Returns:
+        The solver result.
+    """
+    try:
+        while True:
+            try:
+                progress = next(steps)
+            except StopIteration as stop:
+                return stop.value
+            if on_progress is not None:
+                on_progress(progress)
+            await asyncio.sleep(0)
+    finally:
+        steps.close()
@@ -7,9 +7,6 @@ from core_data.game_state import GameState
 from core_data.grid import Grid
 from puzzle_handler.puzzle_solver.puzzle_solver import is_valid
 
-# Custom cache dictionary
-count_solutions_cache: Dict[Tuple, int] = {}
-
 
 def validate_move(grid: Grid, move: Tuple[Coordinate, Cell]) -> Tuple[bool, str]:
     """
@@ -34,20 +31,18 @@ def validate_move(grid: Grid, move: Tuple[Coordinate, Cell]) -> Tuple[bool, str]
 
 
 def is_puzzle_complete(grid: Grid) -> bool:
-    def check_cell(row: int, col: int) -> bool:
-        if row >= grid.grid_size:
-            return True
-        if col >= grid.grid_size:
-            return check_cell(row + 1, 0)
-        cell = grid[row, col]
-        if cell.value.value is None or not is_valid(grid, row, col, cell.value.value):
-            return False
-        return check_cell(row, col + 1)
-
-    return check_cell(0, 0)
-
-
-def check_and_handle_completion(game_state: GameState) -> GameState:
+    # Every row, column and subgrid holds each value exactly once. is_valid cannot check filled cells,
+    # it finds each cell's own value among its peers
+    grid_size = grid.grid_size
+    subgrid_size = int(grid_size ** 0.5)
+    expected = set(range(1, grid_size + 1))
+    rows = [[grid[row, col].value.value for col in range(grid_size)] for row in range(grid_size)]
+    subgrids = [[rows[row][col] for row in range(top, top + subgrid_size) for col in range(left, left + subgrid_size)]
+                for top in range(0, grid_size, subgrid_size) for left in range(0, grid_size, subgrid_size)]
+    return all(set(unit) == expected for unit in rows + [list(column) for column in zip(*rows)] + subgrids)
+
+
+def check_and_handle_completion(game_state: GameState) -> bool:
     """
     Check if the puzzle is complete and handle the completion scenario.
 
@@ -55,44 +50,29 @@ def check_and_handle_completion(game_state: GameState) -> GameState:
         game_state (GameState): The current state of the game.
 
     Returns:
-        GameState: The updated game state.
+        bool: True if the puzzle is complete and the user asks for a new game.
     """
     if is_puzzle_complete(game_state.grid):
         print("Congratulations! You Won")
-        handle_completion_choice(game_state.config)
-    return game_state
+        return handle_completion_choice(game_state.config)
+    return False
 
 
-def handle_completion_choice(config: Dict) -> None:
+def handle_completion_choice(config: Dict) -> bool:
     """
-    Handle the user's choice after completing the puzzle.
+    Ask whether to start a new game after completing the puzzle.
 
     Args:
         config (Dict): The game configuration.
-    """
-    choice = input("Want to Start a new Game (Yes/No): ").strip().lower()
-    handle_choice_recursively(choice, config)
-
 
-from user_actions.start_new_game import start_new_game
-
-
-def handle_choice_recursively(choice: str, config: Dict) -> None:
-    """
-    Recursively handle the user's choice for starting a new game or returning to the main menu.
-
-    Args:
-        choice (str): The user's choice.
-        config (Dict): The game configuration.
+    Returns:
+        bool: True if the user wants a new game.
     """
-    if choice == 'yes':
-        start_new_game(config)  # Call start_new_game directly
-    elif choice == 'no':
-        return  # Exit the recursion
-    else:
+    choice = input("Want to Start a new Game (Yes/No): ").strip().lower()
+    while choice not in ('yes', 'no'):
         print("Invalid choice. Please enter 'Yes' or 'No'.")
         choice = input("Want to Start a new Game (Yes/No): ").strip().lower()
-        handle_choice_recursively(choice, config)
+    return choice == 'yes'
 
 
 def has_empty_cells(grid: Grid) -> bool:
@@ -0,0 +1,249 @@
+import asyncio
+import json
+import logging
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import asdict
+from typing import Dict, Optional
+
+from core_data.game_state import GameState
+from puzzle_handler.puzzle_solver.solution_cache import configure_solution_cache
+from server.session_store import Session, SessionStore, SessionLimitError
+from user_interface.controller.headless_controller import CommandError, CommandResult, parse_command, run_command
+from utils import tracing
+from utils.async_logging import configure_logging
+from utils.memory_stats import memory_stats
+from utils.profiling import configure_profiling
+from utils.tracing import span, trace_report
+
+# Commands that generate, solve or count solutions run in the process pool; the rest are cheap and run inline
+POOLED_COMMANDS = frozenset({"new", "hint", "solve", "load"})
+# Commands naming a file; clients may only name files inside the configured save directory
+FILE_COMMANDS = frozenset({"save", "load"})
+
+DEFAULT_SERVER_CONFIG = {
+    "host": "127.0.0.1",
+    "port": 8765,
+    "socket_path": None,
+    "workers": 2,
+    "max_sessions": 1000,
+    "idle_timeout": 900,
+    "max_history": 500,
+    "sweep_interval": 60,
+    "save_dir": None,
+}
+
+
+def server_settings(config: Dict) -> Dict:
+    return {**DEFAULT_SERVER_CONFIG, **(config.get("server") or {})}
+
+
+def resolve_save_path(save_dir: Optional[str], path: Optional[str]) -> str:
+    """
+    Map the path a client gives to save or load a game to a file inside the server's save directory.
+
+    Args:
+        save_dir (Optional[str]): The configured save directory, None when saving is disabled.
+        path (Optional[str]): The path from the command, as the client sent it.
+
+    Returns:
+        str: The path of the file inside save_dir.
+
+    Raises:
+        CommandError: If saving is disabled, or the path is absolute or leaves the save directory.
+    """
+    if not save_dir:
+        raise CommandError("Saving and loading are disabled on this server.")
+    if not isinstance(path, str) or not path.strip():
+        raise CommandError("'save' and 'load' need a 'path' inside the save directory.")
+    parts = path.replace("\\", "/").split("/")
+    if os.path.isabs(path) or path.startswith(("/", "\\")) or os.path.splitdrive(path)[0] or ".." in parts:
+        raise CommandError(f"Invalid path {path!r}: give a relative path without '..'.")
+    root = os.path.realpath(save_dir)
+    full_path = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, full_path]) != root:  # e.g. through a symbolic link
+        raise CommandError(f"Invalid path {path!r}: it leaves the save directory.")
+    return full_path
+
+
+def initialise_worker(config: Dict) -> None:
+    # Workers log through their own queue, share the persistent solver cache with the server when it is
+    # enabled, and profile the pooled commands when profiling is enabled
+    configure_logging(config)
+    configure_solution_cache(config)
+    configure_profiling(config)
+
+
+def run_command_in_worker(config: Dict, game_state: Optional[GameState], command: Dict) -> CommandResult:
+    # Game states travel to and from the worker pickled; worker output must not reach the clients
+    with redirect_stdout(sys.stderr):
+        return run_command(config, game_state, command)
+
+
+class GameServer:
+    """
+    Hosts many players in one process. Clients send the JSON commands of the headless mode, one per line,
+    with a 'session' field naming their game; 'new' without a session opens one and returns its id, and
+    'close' ends it. Each session runs one command at a time; different sessions run concurrently.
+    """
+
+    def __new__(cls, config: Dict, executor: Optional[Executor] = None):
+        settings = server_settings(config)
+        instance = super(GameServer, cls).__new__(cls)
+        instance.config = config
+        instance.settings = settings
+        instance.sessions = SessionStore(settings["max_sessions"], settings["idle_timeout"],
+                                         settings["max_history"])
+        instance._executor = executor
+        instance._owns_executor = executor is None
+        return instance
+
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.settings["workers"],
+                                                 initializer=initialise_worker, initargs=(self.config,))
+        return self._executor
+
+    async def handle_line(self, line: str) -> Dict:
+        try:
+            command = parse_command(line)
+        except (CommandError, ValueError) as e:
+            return {"ok": False, "error": str(e)}
+        try:
+            return await self.dispatch(command)
+        except TypeError as e:
+            # A field of the wrong type, e.g. a list as the command name, must not end the connection
+            return {"ok": False, "error": f"Malformed command: {e}"}
+
+    async def dispatch(self, command: Dict) -> Dict:
+        """
+        Run one command for its session.
+
+        Args:
+            command (Dict): The parsed command, with a 'session' field except for 'new', 'stats', 'trace'
+                and 'memory'.
+
+        Returns:
+            Dict: The JSON-ready result, including the session id.
+        """
+        cmd = command.get("cmd")
+        session_id = command.get("session")
+        if session_id is not None and not isinstance(session_id, str):
+            return {"ok": False, "error": "'session' must be a string."}
+        if cmd == "stats":
+            return {"ok": True, **asdict(self.sessions.stats())}
+        if cmd == "trace":
+            # Spans of this process: every command end to end, and the inline commands in detail
+            return {"ok": True, "trace": trace_report()}
+        if cmd == "memory":
+            # Objects of this process, where the sessions live; pooled commands run in worker processes
+            return {"ok": True, "memory": memory_stats()}
+        if cmd == "close":
+            return {"ok": self.sessions.close(session_id), "session": session_id}
+
+        try:
+            session = self.sessions.create(session_id) if cmd == "new" else self.sessions.get(session_id)
+        except SessionLimitError as e:
+            return {"ok": False, "error": str(e)}
+        if session is None:
+            return {"ok": False, "error": f"Unknown or expired session {session_id!r}.", "session": session_id}
+        client_path = command.get("path")
+        if cmd in FILE_COMMANDS:
+            try:
+                save_path = resolve_save_path(self.settings["save_dir"], client_path)
+            except CommandError as e:
+                return {"ok": False, "error": str(e), "session": session.session_id}
+            if cmd == "save":
+                os.makedirs(os.path.dirname(save_path), exist_ok=True)
+            command = {**command, "path": save_path}
+
+        if not tracing.instrumented:
+            response = await self.run_session_command(session, command)
+        else:
+            with span(f"server.{cmd}"):
+                response = await self.run_session_command(session, command)
+        if cmd in FILE_COMMANDS and "path" in response:
+            response["path"] = client_path  # Keep the server's directories to itself
+        response["session"] = session.session_id
+        return response
+
+    async def run_session_command(self, session: Session, command: Dict) -> Dict:
+        async with session.lock:
+            if command.get("cmd") in POOLED_COMMANDS:
+                loop = asyncio.get_running_loop()
+                game_state, response = await loop.run_in_executor(
+                    self.executor(), run_command_in_worker, self.config, session.game_state, command)
+            else:
+                game_state, response = run_command(self.config, session.game_state, command)
+            self.sessions.update(session, game_state)
+        return response
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    response = await self.handle_line(line.decode("utf-8"))
+                except UnicodeDecodeError as e:
+                    response = {"ok": False, "error": f"Commands must be UTF-8 text: {e}"}
+                writer.write((json.dumps(response) + "\n").encode("utf-8"))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            logging.info(f"Client disconnected: {e}")
+        finally:
+            writer.close()
+
+    async def sweep_idle_sessions(self) -> None:
+        while True:
+            await asyncio.sleep(self.settings["sweep_interval"])
+            evicted = self.sessions.evict_idle()
+            if evicted:
+                logging.info(f"Evicted {evicted} idle sessions")
+
+    async def start(self) -> asyncio.AbstractServer:
+        """
+        Start listening on the configured Unix domain socket, or on localhost TCP if none is set.
+        """
+        socket_path = self.settings["socket_path"]
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)  # A stale socket from an earlier run
+            server = await asyncio.start_unix_server(self.handle_connection, path=socket_path)
+        else:
+            server = await asyncio.start_server(self.handle_connection, self.settings["host"], self.settings["port"])
+        logging.info(f"Game server listening on {socket_path or (self.settings['host'], self.settings['port'])}")
+        return server
+
+    async def serve_forever(self) -> None:
+        server = await self.start()
+        sweeper = asyncio.create_task(self.sweep_idle_sessions())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            sweeper.cancel()
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+
+def run_server(config: Dict) -> None:
+    """
+    Run the multi-session game server until interrupted.
+
+    Args:
+        config (Dict): Configuration settings, with an optional 'server' section.
+    """
+    try:
+        asyncio.run(GameServer(config).serve_forever())
+    except KeyboardInterrupt:
+        logging.info("Game server stopped")
@@ -0,0 +1,119 @@
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from core_data.game_state import GameState
+
+
+class SessionLimitError(Exception):
+    pass
+
+
+class Session:
+    """One player's game. Commands for a session run one at a time under its lock."""
+
+    def __new__(cls, session_id: str):
+        instance = super(Session, cls).__new__(cls)
+        instance.session_id = session_id
+        instance.game_state = None  # Set by the first new or load command
+        instance.last_used = time.monotonic()
+        instance.lock = asyncio.Lock()
+        return instance
+
+    def is_busy(self) -> bool:
+        return self.lock.locked()
+
+
+@dataclass(frozen=True)
+class SessionStats:
+    sessions: int  # Sessions currently held
+    created: int  # Sessions created since start
+    evicted: int  # Sessions dropped for being idle or to make room
+    trimmed: int  # Times a session's history was cut back to its memory limit
+
+
+class SessionStore:
+    """
+    The sessions of a server, least recently used first.
+
+    Memory per session is bounded by max_history, the number of undo and redo actions kept: beyond it the
+    oldest half of the history is dropped. Sessions idle for longer than idle_timeout seconds are evicted,
+    and when max_sessions is reached the least recently used idle session makes room for a new one.
+    """
+
+    def __new__(cls, max_sessions: int = 1000, idle_timeout: float = 900.0, max_history: int = 500):
+        if not isinstance(max_sessions, int) or max_sessions < 1:
+            raise ValueError("max_sessions must be a positive integer.")
+        if not isinstance(max_history, int) or max_history < 2:
+            raise ValueError("max_history must be an integer of at least 2.")
+        instance = super(SessionStore, cls).__new__(cls)
+        instance.max_sessions = max_sessions
+        instance.idle_timeout = idle_timeout
+        instance.max_history = max_history
+        instance._sessions = OrderedDict()
+        instance._created = 0
+        instance._evicted = 0
+        instance._trimmed = 0
+        return instance
+
+    def get(self, session_id: str) -> Optional[Session]:
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session.last_used = time.monotonic()
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def create(self, session_id: Optional[str] = None) -> Session:
+        if session_id is None:
+            session_id = uuid.uuid4().hex
+        if session_id in self._sessions:
+            return self.get(session_id)
+        if len(self._sessions) >= self.max_sessions and not self._evict_least_recently_used():
+            raise SessionLimitError(f"Server is full ({self.max_sessions} active sessions).")
+        session = Session(session_id)
+        self._sessions[session_id] = session
+        self._created += 1
+        return session
+
+    def update(self, session: Session, game_state: Optional[GameState]) -> None:
+        if game_state is not None and game_state.history_size() > self.max_history:
+            # Halving keeps trimming, which copies the history, rare
+            game_state = game_state.trim_history(self.max_history // 2)
+            self._trimmed += 1
+        session.game_state = game_state
+        session.last_used = time.monotonic()
+
+    def close(self, session_id: str) -> bool:
+        return self._sessions.pop(session_id, None) is not None
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """
+        Drop sessions unused for longer than idle_timeout.
+
+        Returns:
+            int: The number of sessions evicted.
+        """
+        now = time.monotonic() if now is None else now
+        expired = [session_id for session_id, session in self._sessions.items()
+                   if now - session.last_used > self.idle_timeout and not session.is_busy()]
+        for session_id in expired:
+            del self._sessions[session_id]
+        self._evicted += len(expired)
+        return len(expired)
+
+    def _evict_least_recently_used(self) -> bool:
+        for session_id, session in self._sessions.items():
+            if not session.is_busy():
+                del self._sessions[session_id]
+                self._evicted += 1
+                return True
+        return False
+
+    def stats(self) -> SessionStats:
+        return SessionStats(len(self._sessions), self._created, self._evicted, self._trimmed)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
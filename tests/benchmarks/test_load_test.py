@@ -0,0 +1,53 @@
+from benchmarks.corpus import load_corpus
+from benchmarks.load_test import CommandSample, Player, ResourceSample, run_load_test, timeline
+
+
+def script(player, responses):
+    return [player.next_command(response) for response in responses]
+
+
+def test_players_start_with_a_new_game_and_replay_from_their_seed():
+    puzzles = load_corpus("easy")
+    game = {"grid": list(puzzles[0].puzzle), "grid_size": 9, "hints_used": 0, "complete": False}
+    first = Player(1, 7, puzzles, "save.json", 3)
+    second = Player(1, 7, puzzles, "save.json", 3)
+    first_script = script(first, [None] + [game] * 30)
+    assert first_script[0]["cmd"] == "new"
+    assert first_script == script(second, [None] + [game] * 30)
+    assert first_script != script(Player(2, 7, puzzles, "save.json", 3), [None] + [game] * 30)
+
+
+def test_players_load_only_after_saving():
+    puzzles = load_corpus("easy")
+    game = {"grid": list(puzzles[0].puzzle), "grid_size": 9, "hints_used": 3, "complete": False}
+    player = Player(3, 1, puzzles, "save.json", 3)
+    commands = script(player, [None] + [game] * 200)
+    cmds = [command["cmd"] for command in commands]
+    assert "hint" not in cmds  # The hint limit is used up
+    saves = [index for index, cmd in enumerate(cmds) if cmd == "save"]
+    assert all(saves and index > saves[0] for index, cmd in enumerate(cmds) if cmd == "load")
+
+
+def test_timeline_buckets_commands_cpu_and_memory():
+    commands = [CommandSample("move", 0.1, 0.1, True), CommandSample("new", 0.6, 0.2, True)]
+    resources = [[ResourceSample(0.0, 0.0, 1024.0), ResourceSample(0.5, 0.25, 2048.0),
+                  ResourceSample(1.0, 0.5, 1024.0)]]
+    assert timeline(commands, resources, 0.5) == [
+        {"t_s": 0.5, "commands": 1, "cpu_percent": 50.0, "rss_mib": 2.0},
+        {"t_s": 1.0, "commands": 1, "cpu_percent": 50.0, "rss_mib": 1.0},
+        {"t_s": 1.5, "commands": 0, "cpu_percent": 0.0, "rss_mib": None},
+    ]
+
+
+def test_load_test_runs_every_player_to_the_end():
+    report = run_load_test(players=2, actions=8, seed=5, interval=0.1)
+    assert report["summary"]["commands"] == 16
+    assert report["commands"]["new"]["commands"] >= 2
+    assert sum(bucket["commands"] for bucket in report["timeline"]) == 16
+    assert report["summary"]["throughput_per_s"] > 0
+
+
+def test_load_test_splits_players_across_processes():
+    report = run_load_test(players=2, processes=2, actions=4, seed=5, interval=0.1)
+    assert report["settings"]["processes"] == 2
+    assert report["summary"]["commands"] == 8
@@ -0,0 +1,30 @@
+from benchmarks.memory_footprint import game_with_moves, puzzle_grid, run_memory_benchmark, solution_values
+from puzzle_handler.puzzle_solver.solver_memo import solver_memo
+from utils.grid_utils import grid_to_values
+
+
+def test_solution_values_are_solved_grids():
+    for grid_size in (4, 9):
+        values = solution_values(grid_size)
+        rows = [set(values[row * grid_size:(row + 1) * grid_size]) for row in range(grid_size)]
+        cols = [set(values[col::grid_size]) for col in range(grid_size)]
+        assert all(unit == set(range(1, grid_size + 1)) for unit in rows + cols)
+
+
+def test_game_with_moves_keeps_one_undo_entry_per_move():
+    grid = puzzle_grid(4, 1)
+    game_state = game_with_moves(grid, 12)
+    assert len(game_state.undo_stack) == 12
+    assert grid_to_values(game_state.grid) != grid_to_values(grid)
+
+
+def test_memory_benchmark_reports_every_footprint():
+    report = run_memory_benchmark(sizes=(4,), count=3, undo_entries=(0, 5))
+    footprints = {entry["name"]: entry for entry in report["footprints"]}
+    assert list(footprints) == ["grid/4x4", "game_state/4x4/undo=0", "game_state/4x4/undo=5", "undo_entry/4x4",
+                                "cached_solution/4x4"]
+    assert footprints["grid/4x4"]["objects"]["Cell"] == 16
+    assert footprints["game_state/4x4/undo=5"]["bytes"] > footprints["game_state/4x4/undo=0"]["bytes"]
+    assert footprints["undo_entry/4x4"]["bytes"] > 0
+    assert footprints["cached_solution/4x4"]["objects"]["CachedSolution"] == 1
+    assert len(solver_memo) == 0
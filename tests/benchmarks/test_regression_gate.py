@@ -0,0 +1,93 @@
+import json
+
+from benchmarks.regression_gate import (BAD_BASELINE, IMPROVED, INCORRECT, MORE_NODES, NEW, NOT_RUN, OK, SLOWER,
+                                        compare_reports, main, tolerance_for)
+
+
+def result(name, p50_ms, samples=3, **extra):
+    return dict({"name": name, "samples": samples, "skipped": 0, "p50_ms": p50_ms}, **extra)
+
+
+def report(*results):
+    return {"settings": {"repeat": 1, "limit": 1, "max_nodes": 10, "seed": 1}, "benchmarks": list(results)}
+
+
+def statuses(baseline, current, tolerances=None):
+    return {comparison.name: comparison.status for comparison in compare_reports(baseline, current, tolerances)}
+
+
+def test_tolerance_uses_longest_matching_prefix():
+    tolerances = {"backtrack/": 25.0, "backtrack/hard": 60.0}
+    assert tolerance_for("backtrack/hard", tolerances) == 60.0
+    assert tolerance_for("backtrack/easy", tolerances) == 25.0
+    assert tolerance_for("unknown", tolerances) == 30.0
+
+
+def test_slowdown_beyond_tolerance_regresses():
+    baseline = report(result("generate_puzzle/easy", 100.0), result("render/9x9", 10.0))
+    current = report(result("generate_puzzle/easy", 200.0), result("render/9x9", 12.0))
+    assert statuses(baseline, current) == {"generate_puzzle/easy": SLOWER, "render/9x9": OK}
+
+
+def test_tiny_slowdowns_are_noise():
+    baseline = report(result("render/4x4", 0.1))
+    current = report(result("render/4x4", 0.3))
+    assert statuses(baseline, current) == {"render/4x4": OK}
+
+
+def test_speedups_and_new_benchmarks_pass():
+    baseline = report(result("backtrack/easy", 100.0))
+    current = report(result("backtrack/easy", 40.0), result("backtrack/hard", 900.0))
+    comparisons = compare_reports(baseline, current)
+    assert [(comparison.status, comparison.regressed) for comparison in comparisons] == [(IMPROVED, False),
+                                                                                         (NEW, False)]
+    assert comparisons[0].delta_percent == -60.0
+
+
+def test_wrong_results_more_nodes_and_missing_benchmarks_regress():
+    baseline = report(result("count_solutions/easy", 10.0, correct=True),
+                      result("backtrack/easy", 10.0, nodes={"min": 40, "p50": 46, "max": 50}),
+                      result("save_load/easy", 10.0), result("backtrack/25x25", 10.0))
+    current = report(result("count_solutions/easy", 10.0, correct=False),
+                     result("backtrack/easy", 10.0, nodes={"min": 40, "p50": 46, "max": 51}),
+                     result("backtrack/25x25", None, samples=0))
+    assert statuses(baseline, current) == {"count_solutions/easy": INCORRECT, "backtrack/easy": MORE_NODES,
+                                           "save_load/easy": NOT_RUN, "backtrack/25x25": NOT_RUN}
+
+
+def test_incorrect_failed_and_untimed_baselines_are_refused():
+    baseline = report(result("count_solutions/25x25", 10.0, correct=False),
+                      result("backtrack/25x25", None, samples=0, error="RecursionError"),
+                      result("backtrack/17-clue", None, samples=0))
+    current = report(result("count_solutions/25x25", 10.0, correct=True), result("backtrack/25x25", 10.0),
+                     result("backtrack/17-clue", 10.0))
+    comparisons = compare_reports(baseline, current)
+    assert [(comparison.status, comparison.regressed) for comparison in comparisons] == [(BAD_BASELINE, True)] * 3
+
+
+def test_main_exits_non_zero_on_regression(tmp_path, capsys):
+    baseline_path, current_path = tmp_path / "baseline.json", tmp_path / "current.json"
+    baseline_path.write_text(json.dumps(report(result("generate_puzzle/easy", 100.0))))
+    current_path.write_text(json.dumps(report(result("generate_puzzle/easy", 200.0))))
+    arguments = ["--baseline", str(baseline_path), "--current", str(current_path)]
+
+    assert main(arguments) == 1
+    output = capsys.readouterr().out
+    assert "generate_puzzle/easy" in output and "+100.0%" in output and SLOWER in output
+
+    assert main(arguments + ["--tolerance", "generate_puzzle/=150"]) == 0
+
+
+def test_main_update_writes_baseline(tmp_path):
+    baseline_path, current_path = tmp_path / "baseline.json", tmp_path / "current.json"
+    current_path.write_text(json.dumps(report(result("render/9x9", 1.0))))
+    assert main(["--baseline", str(baseline_path), "--current", str(current_path), "--update"]) == 0
+    assert json.loads(baseline_path.read_text()) == report(result("render/9x9", 1.0))
+
+
+def test_main_refuses_to_update_with_unusable_results(tmp_path, capsys):
+    baseline_path, current_path = tmp_path / "baseline.json", tmp_path / "current.json"
+    current_path.write_text(json.dumps(report(result("count_solutions/hard", None, samples=0, skipped=3))))
+    assert main(["--baseline", str(baseline_path), "--current", str(current_path), "--update"]) == 1
+    assert "count_solutions/hard (no samples)" in capsys.readouterr().out
+    assert not baseline_path.exists()
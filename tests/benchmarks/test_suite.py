@@ -0,0 +1,113 @@
+import random
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.corpus import CORPORA, decode, encode, load_corpus
+from benchmarks.suite import (SEED, filled_in, fit_to_budget, percentile, run_suite, search_nodes,
+                              with_deep_stack)
+from puzzle_handler.puzzle_solver.stepwise_solver import count_solutions_stepwise, solve_stepwise
+
+
+def is_valid_solution(values, grid_size):
+    subgrid_size = int(grid_size ** 0.5)
+    expected = set(range(1, grid_size + 1))
+    rows = [values[row * grid_size:(row + 1) * grid_size] for row in range(grid_size)]
+    cols = [values[col::grid_size] for col in range(grid_size)]
+    boxes = [[values[(box_row + row) * grid_size + box_col + col]
+              for row in range(subgrid_size) for col in range(subgrid_size)]
+             for box_row in range(0, grid_size, subgrid_size) for box_col in range(0, grid_size, subgrid_size)]
+    return all(set(unit) == expected for unit in rows + cols + boxes)
+
+
+@pytest.mark.parametrize("corpus", CORPORA)
+def test_corpus_solutions_complete_their_puzzles(corpus):
+    puzzles = load_corpus(corpus)
+    assert puzzles
+    for puzzle in puzzles:
+        assert len(puzzle.puzzle) == len(puzzle.solution) == puzzle.grid_size ** 2
+        assert is_valid_solution(puzzle.solution, puzzle.grid_size)
+        assert all(given in (0, solved) for given, solved in zip(puzzle.puzzle, puzzle.solution))
+
+
+def test_17_clue_corpus_has_17_givens():
+    assert all(sum(1 for value in puzzle.puzzle if value) == 17 for puzzle in load_corpus("17-clue"))
+
+
+def test_encode_decode_round_trip():
+    values = tuple(range(26))
+    assert encode(values) == "0123456789ABCDEFGHIJKLMNOP"
+    assert decode(encode(values)) == values
+
+
+def test_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([1, 2], 0.5) == 1
+    assert percentile([7], 0.9) == 7
+
+
+def test_search_nodes_gives_up_beyond_the_budget():
+    grid = load_corpus("easy")[0].grid()
+    nodes = search_nodes(solve_stepwise(grid, slice_nodes=1), 1000)
+    assert nodes is not None
+    assert search_nodes(solve_stepwise(grid, slice_nodes=1), nodes - 1) is None
+
+
+def test_run_suite_reports_selected_benchmarks():
+    report = run_suite(repeat=2, limit=1, max_nodes=0, only=("render/4x4", "save_load/easy"))
+    results = {result["name"]: result for result in report["benchmarks"]}
+    assert set(results) == {"render/4x4", "save_load/easy"}
+    assert report["settings"]["repeat"] == 2
+    for result in results.values():
+        assert result["samples"] == 2
+        assert result["p50_ms"] <= result["p99_ms"] <= result["max_ms"]
+        assert result["peak_kib"] > 0
+    assert results["save_load/easy"]["correct"] is True
+
+
+def test_run_suite_skips_solver_inputs_over_the_node_budget():
+    report = run_suite(repeat=1, limit=2, max_nodes=0, only=("count_solutions/hard",))
+    assert report["benchmarks"] == [{"name": "count_solutions/hard", "samples": 0, "skipped": 2}]
+
+
+def test_fit_to_budget_fills_in_the_fewest_cells_that_fit():
+    puzzle = load_corpus("hard")[0]
+    steps = lambda candidate: count_solutions_stepwise(candidate.grid(), candidate.grid_size, slice_nodes=1)
+    fitted, nodes, filled = fit_to_budget(puzzle, steps, 50, SEED)
+    assert nodes <= 50
+    assert fitted.puzzle == filled_in(puzzle, filled, SEED).puzzle
+    assert sum(1 for given, original in zip(fitted.puzzle, puzzle.puzzle) if given != original) == filled
+    assert fitted.solution == puzzle.solution
+    assert search_nodes(steps(filled_in(puzzle, filled - 1, SEED)), 50) is None
+
+
+def test_a_count_of_no_solutions_is_reported_as_an_error():
+    with patch("benchmarks.suite.count_solutions", return_value=0):
+        report = run_suite(repeat=1, limit=1, max_nodes=1000, only=("count_solutions/easy",))
+    result, = report["benchmarks"]
+    assert result["samples"] == 0
+    assert result["error"] == "SearchFailed"
+
+
+def test_with_deep_stack_allows_deep_recursion_and_restores_the_limit():
+    limit = sys.getrecursionlimit()
+
+    def depth(frames):
+        return frames and 1 + depth(frames - 1)
+
+    assert with_deep_stack(lambda: depth(limit + 1000)) == limit + 1000
+    assert sys.getrecursionlimit() == limit
+    with pytest.raises(ZeroDivisionError):
+        with_deep_stack(lambda: 1 / 0)
+
+
+def test_generator_benchmarks_leave_the_global_generator_alone():
+    random.seed(7)
+    expected = random.random()
+    random.seed(7)
+    report = run_suite(repeat=1, limit=1, max_nodes=0, only=("generate_puzzle/easy",))
+    assert report["benchmarks"][0]["samples"] == 1
+    assert random.random() == expected
@@ -1,3 +1,5 @@
+import pickle
+
 from core_data.cell import Cell, CellValue, CellState
 from core_data.coordinate import Coordinate
 from core_data.game_state import GameState
@@ -141,3 +143,107 @@ def test_game_state_clear_redo():
     game_state = game_state.push_redo(action)
     new_game_state = game_state.clear_redo()
     assert new_game_state.redo_stack == []
+
+
+def test_game_state_pickle_round_trip():
+    cells = {
+        Coordinate(0, 0, 9): Cell(CellValue(1, 9), CellState.PRE_FILLED),
+    }
+    grid = Grid.create(9, cells)
+    game_state = GameState(grid, {'hint_limit': 3}, 1, [(0, 1, None)], [(0, 2, 5)])
+    restored = pickle.loads(pickle.dumps(game_state))
+    assert restored.grid == grid
+    assert restored.config == {'hint_limit': 3}
+    assert restored.hints_used == 1
+    assert restored.undo_stack == [(0, 1, None)]
+    assert restored.redo_stack == [(0, 2, 5)]
+
+
+def test_game_state_history_is_shared_between_states():
+    grid = Grid.create(9)
+    game_state = GameState(grid, {'hint_limit': 3}, undo_stack=[(0, 0, None)])
+    pushed = game_state.push_undo((0, 1, None))
+    assert pushed.undo_stack.tail is game_state.undo_stack
+    assert pushed.undo_stack.to_list() == [(0, 0, None), (0, 1, None)]
+    assert pushed.clear_redo().redo_stack == []
+
+
+def test_game_state_undo_restores_snapshot():
+    grid = Grid.create(9, {Coordinate(0, 0, 9): Cell(CellValue(1, 9), CellState.PRE_FILLED)})
+    game_state = GameState(grid, {'hint_limit': 3})
+    moved = grid.with_updated_cell(Coordinate(0, 1, 9), Cell(CellValue(2, 9), CellState.USER_FILLED))
+    moved = moved.with_updated_cell(Coordinate(0, 2, 9), Cell(CellValue(3, 9), CellState.USER_FILLED))
+    game_state = game_state.record_move(moved, [(0, 1, None), (0, 2, None)])
+
+    actions, undone = game_state.undo()
+    assert actions == [(0, 2, None), (0, 1, None)]
+    assert undone.grid is grid
+    assert undone.undo_stack == []
+    assert undone.redo_stack == [(0, 2, 3), (0, 1, 2)]
+
+    actions, redone = undone.redo()
+    assert actions == [(0, 1, 2), (0, 2, 3)]
+    assert redone.grid is moved
+    assert redone.undo_stack == [(0, 1, None), (0, 2, None)]
+    assert redone.redo_stack == []
+
+
+def test_game_state_undo_without_snapshot():
+    cells = {Coordinate(0, 1, 9): Cell(CellValue(2, 9), CellState.USER_FILLED)}
+    grid = Grid.create(9, cells)
+    # Histories loaded from a save file have no snapshots and are replayed cell by cell
+    game_state = GameState(grid, {'hint_limit': 3}, undo_stack=[(0, 1, 0)])
+    actions, undone = game_state.undo()
+    assert actions == [(0, 1, 0)]
+    assert undone.grid[0, 1].value.value is None
+    assert undone.grid[0, 1].state == CellState.EMPTY
+    assert undone.redo_stack == [(0, 1, 2)]
+
+    actions, redone = undone.redo()
+    assert redone.grid[0, 1].value.value == 2
+    assert redone.grid[0, 1].state == CellState.USER_FILLED
+
+
+def test_game_state_record_move_clears_redo():
+    grid = Grid.create(9)
+    game_state = GameState(grid, {'hint_limit': 3}, redo_stack=[(0, 0, 5)])
+    moved = grid.with_updated_cell(Coordinate(0, 0, 9), Cell(CellValue(4, 9), CellState.USER_FILLED))
+    game_state = game_state.record_move(moved, [(0, 0, None)])
+    assert game_state.redo_stack == []
+    assert game_state.grid is moved
+    _, empty_redo = game_state.redo()
+    assert empty_redo.grid is moved
+
+
+def test_game_state_trim_history():
+    grid = Grid.create(9)
+    game_state = GameState(grid, {'hint_limit': 3})
+    grids = [grid]
+    for col in range(4):
+        moved = grids[-1].with_updated_cell(Coordinate(0, col, 9), Cell(CellValue(col + 1, 9), CellState.USER_FILLED))
+        game_state = game_state.record_move(moved, [(0, col, None)])
+        grids.append(moved)
+
+    trimmed = game_state.trim_history(2)
+    assert trimmed.undo_stack == [(0, 2, None), (0, 3, None)]
+    assert len(trimmed.undo_snapshots) == 2
+    _, undone = trimmed.undo()
+    assert undone.grid is grids[3]
+    _, undone = undone.undo()
+    assert undone.grid is grids[2]
+    assert undone.undo()[0] == []
+
+
+def test_game_state_hint_map_is_kept_until_the_grid_changes():
+    cells = {Coordinate(0, col, 9): Cell(CellValue(col + 1, 9), CellState.PRE_FILLED) for col in range(8)}
+    grid = Grid.create(9, cells)
+    game_state = GameState(grid, {'hint_limit': 3})
+    hint_map = game_state.hint_map()
+    assert hint_map.get(0, 8).value == 9
+    assert game_state.hint_map() is hint_map
+    assert game_state.increment_hints().hint_map() is hint_map
+
+    moved = grid.with_updated_cell(Coordinate(0, 8, 9), Cell(CellValue(9, 9), CellState.USER_FILLED))
+    moved_state = game_state.record_move(moved, [(0, 8, None)])
+    assert moved_state.hint_map() is not hint_map
+    assert moved_state.hint_map().get(0, 8) is None
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 import numpy as np
@@ -71,6 +72,39 @@ class TestGrid(unittest.TestCase):
         self.assertEqual(grid_array[0, 0], 1)
         self.assertEqual(grid_array[0, 2], 0)
 
+    def test_zobrist_hash_is_updated_incrementally(self):
+        # Test that the carried-over hash matches a hash computed from scratch
+        coord = Coordinate(0, 2, self.max_value)
+        self.grid.zobrist_hash  # Compute the hash so the update can carry it over
+        updated_grid = self.grid.with_updated_cell(coord, Cell(CellValue(9, self.max_value), CellState.USER_FILLED))
+        self.assertIn('_zobrist_hash', updated_grid.__dict__)
+        rebuilt_grid = Grid.create(grid_size=9, cells={coord: cell for row in updated_grid.rows
+                                                       for coord, cell in row.cells.items()})
+        self.assertEqual(updated_grid.zobrist_hash, rebuilt_grid.zobrist_hash)
+        self.assertNotEqual(updated_grid.zobrist_hash, self.grid.zobrist_hash)
+        # Clearing the cell again restores the original hash
+        cleared_grid = updated_grid.with_updated_cell(coord, Cell(CellValue(None, self.max_value), CellState.EMPTY))
+        self.assertEqual(cleared_grid.zobrist_hash, self.grid.zobrist_hash)
+
+    def test_grid_hash_and_equality(self):
+        # Test that equal grids hash alike and can be used as set members and dictionary keys
+        same_grid = Grid.create(grid_size=9, cells=dict(self.cells))
+        self.assertEqual(self.grid, same_grid)
+        self.assertEqual(hash(self.grid), hash(same_grid))
+        self.assertEqual(len({self.grid, same_grid}), 1)
+        self.assertNotEqual(self.grid, Grid.create(grid_size=9))
+
+    def test_grid_pickle_round_trip(self):
+        # Test that pickling produces a compact encoding that rebuilds an equal grid
+        data = pickle.dumps(self.grid, protocol=pickle.HIGHEST_PROTOCOL)
+        self.assertLess(len(data), 300)
+        restored = pickle.loads(data)
+        self.assertEqual(restored, self.grid)
+        self.assertEqual(restored[0, 0].state, CellState.PRE_FILLED)
+        self.assertEqual(restored[0, 2].state, CellState.EMPTY)
+        self.assertIsNone(restored[0, 2].value.value)
+        self.assertTrue(Grid.is_valid(restored.rows, restored.grid_size)[0])
+
     def test_invalid_grid(self):
         # Test creation of an invalid grid (with invalid cell values)
         invalid_cells = {
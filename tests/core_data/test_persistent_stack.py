@@ -0,0 +1,41 @@
+import pickle
+
+import pytest
+
+from core_data.persistent_stack import PersistentStack, EMPTY_STACK
+
+
+def test_push_and_pop_share_structure():
+    stack = EMPTY_STACK.push(1).push(2)
+    pushed = stack.push(3)
+    assert pushed.tail is stack  # The older version is shared, not copied
+    item, popped = pushed.pop()
+    assert item == 3
+    assert popped is stack
+    assert stack == [1, 2]
+
+
+def test_pop_of_empty_stack():
+    item, stack = EMPTY_STACK.pop()
+    assert item is None
+    assert stack is EMPTY_STACK
+    assert not stack
+    assert len(stack) == 0
+
+
+def test_stack_behaves_like_a_list():
+    stack = PersistentStack.from_iterable([(0, 0, None), (1, 2, 3)])
+    assert stack == [(0, 0, None), (1, 2, 3)]
+    assert stack[-1] == (1, 2, 3)
+    assert stack[0] == (0, 0, None)
+    assert list(stack) == stack.to_list()
+    assert len(stack) == 2
+    with pytest.raises(AttributeError):
+        stack.head = None
+
+
+def test_long_history_pickles_without_recursion():
+    stack = PersistentStack.from_iterable(range(50000))
+    restored = pickle.loads(pickle.dumps(stack))
+    assert restored == stack
+    assert restored[-1] == 49999
@@ -0,0 +1,131 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from core_data.cell_state import CellState
+from core_data.coordinate import Coordinate
+from core_data.game_state import GameState
+from core_data.grid import update_grid
+from puzzle_handler.puzzle_solver import background_solver as background
+from puzzle_handler.puzzle_solver.background_solver import BackgroundSolver, configure_background_solver
+from puzzle_handler.puzzle_solver.logical_hints import build_hint_map
+from puzzle_handler.puzzle_solver.puzzle_solver import backtrack
+from puzzle_handler.puzzle_solver.solution_cache import solve_cached, count_solutions_cached
+from puzzle_handler.puzzle_solver.solver_memo import solver_memo
+from user_actions.request_hint import generate_hint, place_hint
+from utils.grid_utils import values_to_grid, grid_to_values
+
+PUZZLE = "034078012602105308190340560059061023406803701710920850061037084207409605340280170"
+
+
+def grid_from_string(puzzle: str, grid_size: int = 9):
+    return values_to_grid(tuple(int(char) for char in puzzle), grid_size)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    solver_memo.clear()
+    yield
+    solver_memo.clear()
+
+
+@pytest.fixture
+def solver():
+    worker = BackgroundSolver(slice_nodes=1)
+    yield worker
+    worker.stop()
+
+
+def test_background_solver_precomputes_solution_and_hint_map(solver):
+    grid = grid_from_string(PUZZLE)
+    solver.submit(grid)
+    ready = solver.result(grid, timeout=30)
+
+    assert ready.solution_count == 1
+    assert ready.solution == backtrack(grid)[0]
+    assert ready.hint_map == build_hint_map(grid)
+    assert all(hint.value == ready.solution[row, col].value.value for (row, col), hint in ready.hint_map.hints.items())
+
+
+def test_background_results_fill_the_solution_cache(solver):
+    grid = grid_from_string(PUZZLE)
+    solver.submit(grid)
+    solver.result(grid, timeout=30)
+
+    with patch('puzzle_handler.puzzle_solver.solution_cache.backtrack') as mock_backtrack, \
+            patch('puzzle_handler.puzzle_solver.solution_cache.count_solutions') as mock_count:
+        assert count_solutions_cached(grid, 9) == 1
+        assert solve_cached(grid) == backtrack(grid)
+    mock_backtrack.assert_not_called()
+    mock_count.assert_not_called()
+
+
+def test_submitting_a_new_grid_supersedes_the_old_one(solver):
+    grid = grid_from_string(PUZZLE)
+    moved = update_grid(grid, Coordinate(0, 0, 9), 5, CellState.USER_FILLED)
+    solver.submit(grid)
+    solver.submit(moved)
+
+    assert solver.result(grid, timeout=30) is None
+    ready = solver.result(moved, timeout=30)
+    assert ready.grid == moved
+    assert grid_to_values(ready.solution) == grid_to_values(backtrack(grid)[0])
+
+
+def test_result_for_a_grid_never_submitted_does_not_wait(solver):
+    assert solver.result(grid_from_string(PUZZLE), timeout=30) is None
+
+
+def test_unsolvable_grid_has_no_solution(solver):
+    grid = grid_from_string("1000010000000000", 4)
+    solver.submit(grid)
+    ready = solver.result(grid, timeout=30)
+    assert ready.solution_count == 0
+    assert ready.solution is None
+    assert len(ready.hint_map) == 0
+
+
+def test_generate_hint_answers_from_the_background_solver():
+    configure_background_solver({'background_solver': {'enabled': True, 'slice_nodes': 1}})
+    try:
+        grid = grid_from_string(PUZZLE)
+        background.precompute(grid)
+        background.precomputed(grid)
+        with patch('user_actions.request_hint.count_solutions_cached') as mock_count:
+            assert generate_hint(grid, 0, 0) == 5
+        mock_count.assert_not_called()
+    finally:
+        configure_background_solver({})
+    assert background.background_solver is None
+
+
+def test_game_hint_map_comes_from_the_finished_background_solver():
+    configure_background_solver({'background_solver': {'enabled': True, 'slice_nodes': 1}})
+    try:
+        grid = grid_from_string(PUZZLE)
+        assert GameState(grid, {'grid_size': 9, 'hint_limit': 3}).hint_map() is not None  # Not submitted yet
+        background.precompute(grid)
+        ready = background.precomputed(grid)
+        with patch('puzzle_handler.puzzle_solver.logical_hints.build_hint_map') as mock_build:
+            assert GameState(grid, {'grid_size': 9, 'hint_limit': 3}).hint_map() is ready.hint_map
+        mock_build.assert_not_called()
+    finally:
+        configure_background_solver({})
+
+
+def test_hints_from_the_hint_map_do_not_wait_for_the_background_solver(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(BackgroundSolver, '_precompute', lambda self, grid: release.wait(30) and None)
+    configure_background_solver({'background_solver': {'enabled': True, 'slice_nodes': 1}})
+    try:
+        grid = grid_from_string(PUZZLE)
+        background.precompute(grid)
+        start = time.perf_counter()
+        placed = place_hint(GameState(grid, {'grid_size': 9, 'hint_limit': 3}), 0, 0)
+        assert time.perf_counter() - start < 5
+        assert placed[1] == 5
+    finally:
+        release.set()
+        configure_background_solver({})
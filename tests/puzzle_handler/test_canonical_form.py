@@ -0,0 +1,38 @@
+import random
+
+from puzzle_handler.puzzle_solver.canonical_form import canonicalize, Transform
+
+PUZZLE = tuple(int(c) for c in
+               "530070000600195000098000060800060003400803001700020006060000280000419005000080079")
+
+
+def random_transform(rng: random.Random) -> Transform:
+    digits = list(range(1, 10))
+    rng.shuffle(digits)
+    bands, stacks = rng.sample(range(3), 3), rng.sample(range(3), 3)
+    row_order = tuple(b * 3 + r for b in bands for r in rng.sample(range(3), 3))
+    col_order = tuple(s * 3 + c for s in stacks for c in rng.sample(range(3), 3))
+    return Transform(rng.random() < 0.5, row_order, col_order, (0, *digits))
+
+
+def test_transform_round_trip():
+    key, transform = canonicalize(PUZZLE, 9)
+    assert transform.apply(PUZZLE, 9) == key
+    assert transform.invert(key, 9) == PUZZLE
+
+
+def test_equivalent_puzzles_share_canonical_form():
+    key, _ = canonicalize(PUZZLE, 9)
+    rng = random.Random(7)
+    for _ in range(20):
+        equivalent = random_transform(rng).apply(PUZZLE, 9)
+        equivalent_key, transform = canonicalize(equivalent, 9)
+        assert equivalent_key == key
+        assert transform.invert(equivalent_key, 9) == equivalent
+
+
+def test_canonical_form_relabels_digits_by_first_appearance():
+    key, _ = canonicalize(PUZZLE, 9)
+    seen = [value for value in key if value]
+    first_appearances = list(dict.fromkeys(seen))
+    assert first_appearances == list(range(1, 10))
@@ -0,0 +1,86 @@
+from core_data.cell_state import CellState
+from core_data.coordinate import Coordinate
+from core_data.grid import update_grid
+from puzzle_handler.puzzle_solver.logical_hints import candidate_masks, build_hint_map
+from puzzle_handler.puzzle_solver.puzzle_solver import backtrack
+from utils.grid_utils import values_to_grid, grid_to_values
+
+PUZZLE = "034078012602105308190340560059061023406803701710920850061037084207409605340280170"
+# Needs pointing, a naked triple and an x-wing before its first placement
+X_WING_PUZZLE = "100000569492056108056109240009640801064010000218035604040500016905061402621000005"
+X_WING_SOLUTION = "187423569492756138356189247539647821764218953218935674843592716975361482621874395"
+
+
+def grid_from_string(puzzle: str, grid_size: int = 9):
+    return values_to_grid(tuple(int(char) for char in puzzle), grid_size)
+
+
+def play_hints(grid):
+    # Apply hints until the techniques get stuck, returning the grid and the techniques used
+    techniques = []
+    hint = build_hint_map(grid).easiest()
+    while hint is not None:
+        techniques.append(hint)
+        grid = update_grid(grid, Coordinate(hint.row, hint.col, grid.grid_size), hint.value, CellState.HINT)
+        hint = build_hint_map(grid).easiest()
+    return grid, techniques
+
+
+def test_hints_solve_an_easy_puzzle_with_singles():
+    grid = grid_from_string(PUZZLE)
+    solved, hints = play_hints(grid)
+    assert grid_to_values(solved) == grid_to_values(backtrack(grid)[0])
+    assert {hint.technique for hint in hints} <= {"naked single", "hidden single"}
+    assert all(not hint.eliminations for hint in hints)
+
+
+def test_hints_use_elimination_techniques_when_singles_run_out():
+    solved, hints = play_hints(grid_from_string(X_WING_PUZZLE))
+    assert "".join(str(value) for value in grid_to_values(solved)) == X_WING_SOLUTION
+    assert hints[0].eliminations == ("pointing", "naked triple", "pointing", "x-wing")
+    assert hints[0].describe() == "hidden single after pointing, naked triple, x-wing"
+
+
+def test_hint_for_a_specific_cell():
+    hint = build_hint_map(grid_from_string(PUZZLE)).get(0, 0)
+    assert (hint.row, hint.col, hint.value) == (0, 0, 5)
+
+
+def test_hint_for_a_filled_cell_is_none():
+    assert build_hint_map(grid_from_string(PUZZLE)).get(0, 1) is None
+
+
+def test_work_cap_stops_the_search():
+    grid = grid_from_string(X_WING_PUZZLE)
+    assert len(build_hint_map(grid, max_steps=3)) == 0
+    assert build_hint_map(grid).easiest() is not None
+
+
+def test_contradictory_grid_has_no_hint():
+    grid = grid_from_string("1000010000000000", 4)  # 1 twice in the first subgrid
+    assert candidate_masks(grid) is None
+    assert build_hint_map(grid).easiest() is None
+
+
+def test_hint_map_matches_the_solution():
+    grid = grid_from_string(X_WING_PUZZLE)
+    hint_map = build_hint_map(grid)
+    assert len(hint_map) == X_WING_PUZZLE.count("0")
+    for (row, col), hint in hint_map.hints.items():
+        assert hint.value == int(X_WING_SOLUTION[row * 9 + col])
+    assert hint_map.singles() == ()
+    assert hint_map.easiest().depth == 0
+
+
+def test_hint_map_ranks_cells_by_depth_and_difficulty():
+    grid = grid_from_string(PUZZLE)
+    hint_map = build_hint_map(grid)
+    singles = hint_map.singles()
+    assert singles and all(hint.depth == 0 for hint in singles)
+    assert {hint.technique for hint in hint_map.hints.values()} <= {"naked single", "hidden single"}
+    easiest = hint_map.easiest()
+    assert (easiest.depth, easiest.difficulty) == (0, 1)
+
+
+def test_hint_map_of_a_contradictory_grid_is_empty():
+    assert len(build_hint_map(grid_from_string("1000010000000000", 4))) == 0
@@ -0,0 +1,51 @@
+from multiprocessing import Pool
+
+from puzzle_handler.puzzle_solver.persistent_cache import PersistentSolutionCache, content_hash
+
+GIVENS = (1, 0, 0, 0) * 4
+SOLUTION = (1, 2, 3, 4) * 4
+
+
+def test_results_survive_a_new_session(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    PersistentSolutionCache(path).store(4, GIVENS, (SOLUTION, True, 1, 2))
+
+    assert PersistentSolutionCache(path).load(4, GIVENS) == (SOLUTION, True, 1, 2)
+    assert PersistentSolutionCache(path).load(4, SOLUTION) is None
+
+
+def test_partial_results_are_merged(tmp_path):
+    cache = PersistentSolutionCache(str(tmp_path / "cache.sqlite3"))
+    cache.store(4, GIVENS, (SOLUTION, True, None, 0))
+    cache.store(4, GIVENS, (None, None, 1, 2))
+    assert cache.load(4, GIVENS) == (SOLUTION, True, 1, 2)
+
+
+def test_least_recently_used_rows_are_evicted(tmp_path):
+    cache = PersistentSolutionCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+    cache.store(4, (1,) + (0,) * 15, (None, None, 1, 2))
+    cache.store(4, (2,) + (0,) * 15, (None, None, 1, 2))
+    cache.load(4, (1,) + (0,) * 15)
+    cache.store(4, (3,) + (0,) * 15, (None, None, 1, 2))
+
+    assert len(cache) == 2
+    assert cache.load(4, (2,) + (0,) * 15) is None
+    assert cache.load(4, (1,) + (0,) * 15) is not None
+
+
+def store_from_process(arguments):
+    path, digit = arguments
+    PersistentSolutionCache(path).store(4, (digit,) + (0,) * 15, (None, None, 1, 2))
+
+
+def test_concurrent_processes_share_the_cache(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    PersistentSolutionCache(path)
+    with Pool(4) as pool:
+        pool.map(store_from_process, [(path, digit) for digit in range(1, 5)] * 4)
+    assert len(PersistentSolutionCache(path)) == 4
+
+
+def test_content_hash_depends_on_size_and_values():
+    assert content_hash(4, GIVENS) == content_hash(4, list(GIVENS))
+    assert content_hash(4, GIVENS) != content_hash(4, SOLUTION)
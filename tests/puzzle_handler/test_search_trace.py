@@ -0,0 +1,102 @@
+import io
+import json
+
+import pytest
+
+from benchmarks.search_tree import main
+from puzzle_handler.puzzle_solver.puzzle_solver import backtrack, count_solutions
+from puzzle_handler.puzzle_solver.search_trace import (BACKTRACK, BRANCH, END, GUESS, SOLUTION, SearchTrace,
+                                                       WastedSubtree, open_trace, read_events, summarise_trace)
+from puzzle_handler.puzzle_solver.stepwise_solver import count_solutions_stepwise, run_stepwise, solve_stepwise
+from utils.grid_utils import values_to_grid
+
+GRIDS = [
+    ("034078012602105308190340560059061023406803701710920850061037084207409605340280170", 9),  # Unique solution
+    ("0" * 16, 4),  # Many solutions
+    ("1000010000000000", 4),  # Unsolvable
+]
+
+
+def grid_from_string(puzzle: str, grid_size: int):
+    return values_to_grid(tuple(int(char) for char in puzzle), grid_size)
+
+
+def traced_run(solver, grid):
+    stream = io.StringIO()
+    trace = SearchTrace(stream)
+    if solver == "solve":
+        result = run_stepwise(solve_stepwise(grid, slice_nodes=1, trace=trace))
+    else:
+        result = run_stepwise(count_solutions_stepwise(grid, grid.grid_size, slice_nodes=1, trace=trace))
+    return result, list(read_events(stream.getvalue().splitlines()))
+
+
+@pytest.mark.parametrize("puzzle, grid_size", GRIDS)
+def test_traced_solve_matches_backtrack(puzzle, grid_size):
+    grid = grid_from_string(puzzle, grid_size)
+    result, events = traced_run("solve", grid)
+    assert result == backtrack(grid)
+    assert events[-1]["event"] == END
+    assert events[-1]["solutions"] == (1 if result[1] else 0)
+
+
+@pytest.mark.parametrize("puzzle, grid_size", GRIDS)
+def test_traced_count_matches_count_solutions(puzzle, grid_size):
+    grid = grid_from_string(puzzle, grid_size)
+    result, events = traced_run("count", grid)
+    assert result == count_solutions(grid, grid_size)
+    kinds = [event["event"] for event in events]
+    nodes = events[-1]["node"]
+    # Every node either branches or completes the grid, and every branch is eventually abandoned
+    assert kinds.count(BRANCH) + kinds.count(SOLUTION) == nodes
+    assert kinds.count(BRANCH) == kinds.count(BACKTRACK)
+    summary = summarise_trace(events)
+    assert summary.nodes == nodes
+    assert summary.solutions == min(result, 2)
+
+
+def test_branch_records_candidates_and_eliminations():
+    grid = grid_from_string("1000010000000000", 4)
+    _, events = traced_run("count", grid)
+    branch = events[0]
+    assert (branch["event"], branch["row"], branch["col"]) == (BRANCH, 0, 1)
+    assert branch["candidates"] == [2, 3, 4]
+    assert branch["eliminated"] == 1
+
+
+def test_summary_finds_outermost_wasted_subtrees():
+    events = [
+        {"event": BRANCH, "node": 1, "depth": 0, "row": 0, "col": 0},
+        {"event": GUESS, "node": 1, "depth": 0, "row": 0, "col": 0, "value": 1},
+        {"event": BRANCH, "node": 2, "depth": 1, "row": 0, "col": 1},
+        {"event": GUESS, "node": 2, "depth": 1, "row": 0, "col": 1, "value": 2},
+        {"event": BRANCH, "node": 3, "depth": 2, "row": 0, "col": 2},
+        {"event": BACKTRACK, "node": 3, "depth": 2, "row": 0, "col": 2},
+        {"event": BACKTRACK, "node": 3, "depth": 1, "row": 0, "col": 1},
+        {"event": GUESS, "node": 3, "depth": 0, "row": 0, "col": 0, "value": 2},
+        {"event": SOLUTION, "node": 4, "depth": 1},
+        {"event": END, "node": 4, "depth": 0, "solutions": 1},
+    ]
+    summary = summarise_trace(events)
+    assert (summary.nodes, summary.solutions, summary.max_depth) == (4, 1, 2)
+    assert summary.branches_by_depth == {0: 1, 1: 1, 2: 1}
+    assert summary.wasted == [WastedSubtree(0, 0, 1, 0, 1, 2)]
+    assert summary.wasted_nodes == 2
+    assert summary.hottest_cells[0] == ((0, 1), 1, 1)  # Ties go to the cell backtracked on more
+
+
+def test_compressed_trace_round_trip(tmp_path):
+    path = str(tmp_path / "trace.jsonl.gz")
+    with open_trace(path, "w") as file:
+        SearchTrace(file).solution(1, 0)
+    with open_trace(path) as file:
+        assert list(read_events(file)) == [{"event": SOLUTION, "node": 1, "depth": 0}]
+
+
+def test_record_and_summary_commands(tmp_path, capsys):
+    path = str(tmp_path / "trace.jsonl")
+    assert main(["record", "--puzzle", "0" * 16, "--solver", "count", "--output", path]) == 0
+    assert main(["summary", path, "--json"]) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["solutions"] == 2
+    assert summary["max_depth"] > 0
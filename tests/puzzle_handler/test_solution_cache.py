@@ -0,0 +1,125 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from core_data.cell import Cell
+from core_data.cell_state import CellState
+from core_data.cell_value import CellValue
+from core_data.coordinate import Coordinate
+from core_data.grid import Grid
+from puzzle_handler.puzzle_solver import solution_cache
+from puzzle_handler.puzzle_solver.canonical_form import transpose_values
+from puzzle_handler.puzzle_solver.puzzle_solver import backtrack, count_solutions
+from puzzle_handler.puzzle_solver.solution_cache import solve_cached, count_solutions_cached, known_solution_count
+from puzzle_handler.puzzle_solver.solver_memo import solver_memo
+from utils.grid_utils import grid_to_values
+
+PUZZLE = "034078012602105308190340560059061023406803701710920850061037084207409605340280170"
+
+
+def grid_from_string(puzzle: str, grid_size: int = 9) -> Grid:
+    cells = {
+        Coordinate(index // grid_size, index % grid_size, grid_size): Cell(CellValue(int(char), grid_size),
+                                                                           CellState.PRE_FILLED)
+        for index, char in enumerate(puzzle) if char != "0"
+    }
+    return Grid.create(grid_size, cells)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    solver_memo.clear()
+    yield
+    solver_memo.clear()
+
+
+def test_solve_cached_matches_backtrack():
+    grid = grid_from_string(PUZZLE)
+    solved_grid, success = solve_cached(grid)
+    expected_grid, expected_success = backtrack(grid)
+    assert success == expected_success
+    assert grid_to_values(solved_grid) == grid_to_values(expected_grid)
+
+
+def test_equivalent_puzzle_is_answered_without_search():
+    grid = grid_from_string(PUZZLE)
+    solved_grid, _ = solve_cached(grid)
+    transposed = grid_from_string("".join(map(str, transpose_values(grid_to_values(grid), 9))))
+
+    with patch('puzzle_handler.puzzle_solver.solution_cache.backtrack') as mock_backtrack:
+        solved_transposed, success = solve_cached(transposed)
+        mock_backtrack.assert_not_called()
+
+    assert success
+    assert grid_to_values(solved_transposed) == transpose_values(grid_to_values(solved_grid), 9)
+
+
+def test_count_solutions_cached_reuses_counts():
+    grid = grid_from_string(PUZZLE)
+    assert count_solutions_cached(grid, 9) == count_solutions(grid, 9)
+    with patch('puzzle_handler.puzzle_solver.solution_cache.count_solutions') as mock_count_solutions:
+        assert count_solutions_cached(grid, 9) == 1
+        mock_count_solutions.assert_not_called()
+
+
+def test_capped_count_is_recomputed_for_a_higher_limit():
+    grid = Grid.create(9)
+    with patch('puzzle_handler.puzzle_solver.solution_cache.count_solutions', side_effect=[2, 3]) as mock_count:
+        assert count_solutions_cached(grid, 9, 2) == 2
+        assert count_solutions_cached(grid, 9, 2) == 2
+        assert count_solutions_cached(grid, 9, 3) == 3
+        assert mock_count.call_count == 2
+
+
+def test_failed_count_is_not_cached():
+    grid = grid_from_string(PUZZLE)
+    with patch('puzzle_handler.puzzle_solver.solution_cache.count_solutions', side_effect=RecursionError):
+        assert count_solutions_cached(grid, 9) == 0
+    assert known_solution_count(grid) is None
+    assert count_solutions_cached(grid, 9) == 1
+
+
+def test_persistent_cache_answers_a_new_session(tmp_path):
+    grid = grid_from_string(PUZZLE)
+    solution_cache.configure_solution_cache({'solver_cache': {'persistent': True,
+                                                              'path': str(tmp_path / "cache.sqlite3")}})
+    try:
+        count_solutions_cached(grid, 9)
+        solver_memo.clear()  # Simulate a new process with an empty memory cache
+        with patch('puzzle_handler.puzzle_solver.solution_cache.count_solutions') as mock_count_solutions:
+            assert count_solutions_cached(grid, 9) == 1
+            mock_count_solutions.assert_not_called()
+    finally:
+        solution_cache.configure_solution_cache({})
+
+
+def test_concurrent_solves_share_one_search():
+    grid = grid_from_string(PUZZLE)
+    transposed = grid_from_string("".join(map(str, transpose_values(grid_to_values(grid), 9))))
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_backtrack(search_grid):
+        calls.append(search_grid)
+        started.set()
+        release.wait(5)
+        return backtrack(search_grid)
+
+    with patch.object(solution_cache, 'backtrack', slow_backtrack):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            leader = pool.submit(solve_cached, grid)
+            started.wait(5)
+            # The transposed puzzle is equivalent, so it waits for the same search
+            followers = [pool.submit(solve_cached, grid), pool.submit(solve_cached, transposed)]
+            while solution_cache.solver_in_flight.stats().coalesced < 2:
+                time.sleep(0.01)
+            release.set()
+            results = [leader.result(), *(follower.result() for follower in followers)]
+
+    assert len(calls) == 1
+    assert all(success for _, success in results)
+    assert grid_to_values(results[2][0]) == transpose_values(grid_to_values(results[0][0]), 9)
@@ -0,0 +1,45 @@
+from core_data.cell import Cell
+from core_data.cell_state import CellState
+from core_data.cell_value import CellValue
+from core_data.coordinate import Coordinate
+from core_data.grid import Grid
+from puzzle_handler.puzzle_solver.solver_memo import grid_key, memoize_solver, solver_memo
+
+
+def test_grid_key_ignores_cell_states():
+    coord = Coordinate(0, 0, 4)
+    pre_filled = Grid.create(4, {coord: Cell(CellValue(1, 4), CellState.PRE_FILLED)})
+    user_filled = Grid.create(4, {coord: Cell(CellValue(1, 4), CellState.USER_FILLED)})
+    assert grid_key(pre_filled) == grid_key(user_filled)
+    assert grid_key(pre_filled) != grid_key(Grid.create(4))
+
+
+def test_memoize_solver_answers_repeated_grids_from_the_shared_memo():
+    calls = []
+
+    @memoize_solver
+    def filled_cells(grid):
+        calls.append(grid)
+        return sum(1 for row in grid.rows for cell in row.cells.values() if cell.value.value)
+
+    solver_memo.clear()
+    hits_before = solver_memo.stats().hits
+    assert filled_cells(Grid.create(4)) == 0
+    assert filled_cells(Grid.create(4)) == 0
+    assert len(calls) == 1
+    assert solver_memo.stats().hits == hits_before + 1
+
+
+def test_grid_key_tells_apart_grids_whose_hashes_collide():
+    one = Grid.create(4, {Coordinate(0, 0, 4): Cell(CellValue(1, 4), CellState.PRE_FILLED)})
+    two = Grid.create(4, {Coordinate(0, 0, 4): Cell(CellValue(2, 4), CellState.PRE_FILLED)})
+    object.__setattr__(two, '_zobrist_hash', one.zobrist_hash)
+    assert hash(grid_key(one)) == hash(grid_key(two))
+    assert grid_key(one) != grid_key(two)
+
+    @memoize_solver
+    def first_value(grid):
+        return grid[0, 0].value.value
+
+    solver_memo.clear()
+    assert (first_value(one), first_value(two)) == (1, 2)
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from puzzle_handler.puzzle_solver.puzzle_solver import backtrack, count_solutions
+from puzzle_handler.puzzle_solver.stepwise_solver import (solve_stepwise, count_solutions_stepwise, run_stepwise,
+                                                          run_stepwise_async, SolverProgress)
+from utils.grid_utils import values_to_grid
+
+PUZZLE = "034078012602105308190340560059061023406803701710920850061037084207409605340280170"
+
+
+def grid_from_string(puzzle: str, grid_size: int = 9):
+    return values_to_grid(tuple(int(char) for char in puzzle), grid_size)
+
+
+GRIDS = [
+    (PUZZLE, 9),  # Unique solution
+    ("0" * 16, 4),  # Many solutions
+    ("1000010000000000", 4),  # Unsolvable
+]
+
+
+@pytest.mark.parametrize("puzzle, grid_size", GRIDS)
+def test_solve_stepwise_matches_backtrack(puzzle, grid_size):
+    grid = grid_from_string(puzzle, grid_size)
+    assert run_stepwise(solve_stepwise(grid, slice_nodes=1)) == backtrack(grid)
+
+
+@pytest.mark.parametrize("puzzle, grid_size", GRIDS)
+@pytest.mark.parametrize("max_solutions", [1, 2, 5])
+def test_count_solutions_stepwise_matches_count_solutions(puzzle, grid_size, max_solutions):
+    grid = grid_from_string(puzzle, grid_size)
+    assert (run_stepwise(count_solutions_stepwise(grid, grid_size, max_solutions, slice_nodes=1))
+            == count_solutions(grid, grid_size, max_solutions))
+
+
+def test_stepwise_solver_reports_progress_every_slice():
+    grid = grid_from_string("0" * 16, 4)
+    progress = []
+    run_stepwise(count_solutions_stepwise(grid, 4, max_solutions=3, slice_nodes=2), progress.append)
+    assert progress
+    assert [report.nodes for report in progress] == list(range(2, 2 * len(progress) + 1, 2))
+    assert all(isinstance(report, SolverProgress) for report in progress)
+    assert progress[-1].solutions <= 3
+
+
+def test_run_stepwise_async_interleaves_with_other_tasks():
+    grid = grid_from_string(PUZZLE)
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(1)
+            await asyncio.sleep(0)
+
+    async def main():
+        ticking = asyncio.ensure_future(ticker())
+        result = await run_stepwise_async(solve_stepwise(grid, slice_nodes=1))
+        ticking.cancel()
+        return result
+
+    assert asyncio.run(main()) == backtrack(grid)
+    assert len(ticks) > 1
+
+
+def test_cancelling_async_solve_closes_the_search():
+    grid = grid_from_string("0" * 16, 4)
+    steps = count_solutions_stepwise(grid, 4, max_solutions=1000, slice_nodes=1)
+
+    async def main():
+        task = asyncio.ensure_future(run_stepwise_async(steps))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    with pytest.raises(StopIteration):
+        next(steps)
@@ -0,0 +1,136 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from server.game_server import GameServer
+from utils.tracing import configure_tracing
+
+PUZZLE = "034078012602105308190340560059061023406803701710920850061037084207409605340280170"
+CONFIG = {'hint_limit': 3, 'grid_size': 9}
+
+
+def test_sessions_are_independent():
+    async def scenario():
+        server = GameServer(CONFIG, ThreadPoolExecutor(max_workers=2))
+        first = await server.dispatch({"cmd": "new", "puzzle": PUZZLE})
+        second = await server.dispatch({"cmd": "new", "puzzle": PUZZLE})
+        assert first["session"] != second["session"]
+        moved = await server.dispatch({"cmd": "move", "session": first["session"], "moves": "A1=5"})
+        undone = await server.dispatch({"cmd": "undo", "session": second["session"]})
+        assert moved["grid"][0] == 5
+        assert undone["grid"][0] == 0
+        assert (await server.dispatch({"cmd": "close", "session": first["session"]}))["ok"]
+        missing = await server.dispatch({"cmd": "move", "session": first["session"], "moves": "A1=5"})
+        assert not missing["ok"]
+        assert (await server.dispatch({"cmd": "stats"}))["sessions"] == 1
+        server.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_trace_reports_commands_end_to_end():
+    async def scenario():
+        server = GameServer(CONFIG, ThreadPoolExecutor(max_workers=1))
+        session = (await server.dispatch({"cmd": "new", "puzzle": PUZZLE}))["session"]
+        await server.dispatch({"cmd": "move", "session": session, "moves": "A1=5"})
+        trace = (await server.dispatch({"cmd": "trace"}))["trace"]
+        server.shutdown()
+        return trace
+
+    configure_tracing({'tracing': {'enabled': True}})
+    try:
+        trace = asyncio.run(scenario())
+    finally:
+        configure_tracing({})
+    assert trace["server.new"]["count"] == 1
+    assert trace["server.move"]["count"] == 1
+    assert "server.move/command.move" in trace
+
+
+def test_memory_reports_the_server_process():
+    async def scenario():
+        server = GameServer(CONFIG, ThreadPoolExecutor(max_workers=1))
+        await server.dispatch({"cmd": "new", "puzzle": PUZZLE})
+        memory = await server.dispatch({"cmd": "memory"})
+        server.shutdown()
+        return memory
+
+    memory = asyncio.run(scenario())
+    assert memory["ok"]
+    assert memory["memory"]["objects"]["Session"] >= 1
+    assert memory["memory"]["objects"]["GameState"] >= 1
+
+
+def test_unix_socket_round_trip(tmp_path):
+    socket_path = str(tmp_path / "sudoku.sock")
+
+    async def scenario():
+        server = GameServer({**CONFIG, "server": {"socket_path": socket_path, "workers": 1}})
+        listener = await server.start()
+        try:
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            writer.write((json.dumps({"id": 1, "cmd": "new", "puzzle": PUZZLE}) + "\n").encode())
+            created = json.loads(await reader.readline())
+            writer.write((json.dumps({"id": 2, "cmd": "solve", "session": created["session"]}) + "\n").encode())
+            solved = json.loads(await reader.readline())
+            writer.close()
+        finally:
+            listener.close()
+            await listener.wait_closed()
+            server.shutdown()
+        assert created["ok"] and created["id"] == 1
+        assert solved["ok"] and solved["complete"]
+
+    asyncio.run(scenario())
+
+
+def test_malformed_lines_keep_the_connection_open(tmp_path):
+    socket_path = str(tmp_path / "sudoku.sock")
+    bad_lines = [b"[1, 2]\n", b"not json\n", b'{"cmd": "move", "session": [1], "moves": "A1=5"}\n',
+                 b'{"cmd": ["new"]}\n', b"\xff\xfe\n"]
+
+    async def scenario():
+        server = GameServer({**CONFIG, "server": {"socket_path": socket_path, "workers": 1}},
+                            ThreadPoolExecutor(max_workers=1))
+        listener = await server.start()
+        try:
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            responses = []
+            for line in bad_lines + [(json.dumps({"cmd": "new", "puzzle": PUZZLE}) + "\n").encode()]:
+                writer.write(line)
+                responses.append(json.loads(await reader.readline()))
+            writer.close()
+        finally:
+            listener.close()
+            await listener.wait_closed()
+            server.shutdown()
+        return responses
+
+    *errors, created = asyncio.run(scenario())
+    assert all(not response["ok"] and response["error"] for response in errors)
+    assert created["ok"]
+
+
+def test_save_and_load_stay_inside_the_save_directory(tmp_path):
+    save_dir = tmp_path / "saves"
+
+    async def scenario(settings):
+        server = GameServer({**CONFIG, "server": settings}, ThreadPoolExecutor(max_workers=1))
+        session = (await server.dispatch({"cmd": "new", "puzzle": PUZZLE}))["session"]
+        responses = [await server.dispatch({"cmd": cmd, "session": session, "path": path})
+                     for cmd, path in (("save", "games/mine.json"), ("load", "games/mine.json"),
+                                       ("save", str(tmp_path / "outside.json")), ("save", "../outside.json"),
+                                       ("load", "/etc/passwd"))]
+        server.shutdown()
+        return responses
+
+    saved, loaded, *escapes = asyncio.run(scenario({"save_dir": str(save_dir)}))
+    assert saved["ok"] and saved["path"] == "games/mine.json"
+    assert (save_dir / "games" / "mine.json").exists()
+    assert loaded["ok"]
+    assert not any(response["ok"] for response in escapes)
+    assert not (tmp_path / "outside.json").exists()
+
+    disabled = asyncio.run(scenario({}))
+    assert not any(response["ok"] for response in disabled)
+    assert "disabled" in disabled[0]["error"]
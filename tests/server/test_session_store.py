@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from core_data.cell import Cell, CellValue, CellState
+from core_data.coordinate import Coordinate
+from core_data.game_state import GameState
+from core_data.grid import Grid
+from server.session_store import SessionStore, SessionLimitError
+
+
+def test_idle_sessions_are_evicted():
+    store = SessionStore(max_sessions=10, idle_timeout=5)
+    session = store.create("a")
+    store.create("b")
+    assert store.evict_idle(session.last_used + 1) == 0
+    assert store.evict_idle(session.last_used + 60) == 2
+    assert store.get("a") is None
+
+
+def test_full_store_evicts_least_recently_used():
+    store = SessionStore(max_sessions=2)
+    store.create("a")
+    store.create("b")
+    store.get("a")
+    store.create("c")
+    assert store.get("b") is None
+    assert store.get("a") is not None
+
+
+def test_full_store_keeps_busy_sessions():
+    async def scenario():
+        store = SessionStore(max_sessions=1)
+        session = store.create("a")
+        async with session.lock:
+            with pytest.raises(SessionLimitError):
+                store.create("b")
+
+    asyncio.run(scenario())
+
+
+def test_history_is_trimmed_to_memory_limit():
+    store = SessionStore(max_history=4)
+    session = store.create()
+    game_state = GameState(Grid.create(9), {'hint_limit': 3})
+    for col in range(5):
+        grid = game_state.grid.with_updated_cell(Coordinate(0, col, 9),
+                                                 Cell(CellValue(col + 1, 9), CellState.USER_FILLED))
+        game_state = game_state.record_move(grid, [(0, col, None)])
+    store.update(session, game_state)
+    assert session.game_state.history_size() == 2
+    assert store.stats().trimmed == 1
@@ -72,3 +72,45 @@ def test_start_new_game_and_make_a_move(monkeypatch):
         updated_game_state = make_a_move(game_state)
         # No assertion needed; we just want to ensure no exceptions are raised
 
+
+
+def test_completing_the_puzzle_offers_a_new_game(monkeypatch):
+    from core_data.game_state import GameState
+    from user_interface.controller.transition import NEW_GAME
+    from utils.grid_utils import values_to_grid
+
+    solution = [(row * 3 + row // 3 + col) % 9 + 1 for row in range(9) for col in range(9)]
+    last_value = solution[-1]
+    solution[-1] = 0
+    game_state = GameState(values_to_grid(tuple(solution), 9), {'grid_size': 9, 'hint_limit': 3})
+
+    for answer, expected_new_game in (("yes", True), ("no", False)):
+        answers = iter([f"I9={last_value}", answer])
+        monkeypatch.setattr('builtins.input', lambda *args: next(answers))
+        result = make_a_move(game_state)
+        assert (result is NEW_GAME) == expected_new_game
+        if not expected_new_game:
+            assert result.grid[8, 8].value.value == last_value
+
+
+def test_prompts_are_left_out_of_the_move_span(monkeypatch):
+    from core_data.game_state import GameState
+    from utils import tracing
+    from utils.grid_utils import values_to_grid
+
+    spans_at_prompt = []
+
+    def prompt(*args):
+        spans_at_prompt.append(tracing.current_span.get())
+        return "A1=5"
+
+    monkeypatch.setattr('builtins.input', prompt)
+    game_state = GameState(values_to_grid((0,) * 81, 9), {'grid_size': 9, 'hint_limit': 3})
+    tracing.configure_tracing({'tracing': {'enabled': True}})
+    try:
+        make_a_move(game_state)
+        report = tracing.trace_report()
+    finally:
+        tracing.configure_tracing({})
+    assert spans_at_prompt == [None]
+    assert "apply_user_moves" in report
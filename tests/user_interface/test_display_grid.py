@@ -9,7 +9,8 @@ from core_data.cell_state import CellState
 from core_data.cell_value import CellValue
 from core_data.coordinate import Coordinate
 from core_data.grid import Grid
-from user_interface.display.display_grid import display_messages, get_row_label, print_row, display_grid
+from user_interface.display.display_grid import display_messages, get_row_label, print_row, display_grid, \
+    render_grid, render_row
 
 
 class TestGridDisplayFunctions(unittest.TestCase):
@@ -64,6 +65,18 @@ class TestGridDisplayFunctions(unittest.TestCase):
         self.assertIn("Message 2", output)
         self.assertIn("Message 3", output)
 
+    def test_display_grid_writes_single_frame(self):
+        # The whole frame is written with one call
+        with patch('sys.stdout') as mock_stdout:
+            display_grid(self.grid)
+        mock_stdout.write.assert_called_once_with(render_grid(self.grid))
+
+    def test_render_row(self):
+        row = render_row(self.grid, 1)
+        self.assertTrue(row.startswith("B | "))
+        self.assertTrue(row.endswith(" |"))
+        self.assertEqual(row.count("|"), 4)
+
     def test_get_row_label(self):
         # Test the row label conversion function
         self.assertEqual(get_row_label(0), 'A')
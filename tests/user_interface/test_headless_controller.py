@@ -0,0 +1,88 @@
+import json
+import random
+from io import StringIO
+
+from benchmarks.corpus import encode, load_corpus
+from user_interface.controller.headless_controller import run_headless
+from utils.tracing import configure_tracing
+
+CONFIG = {'hint_limit': 1, 'grid_size': 9}
+PUZZLE = "034078012602105308190340560059061023406803701710920850061037084207409605340280170"
+
+
+def run(*commands):
+    results = StringIO()
+    run_headless(CONFIG, StringIO("\n".join(json.dumps(command) for command in commands) + "\n"), results)
+    return [json.loads(line) for line in results.getvalue().splitlines()]
+
+
+def test_commands_require_a_game():
+    (result,) = run({"cmd": "undo"})
+    assert not result["ok"]
+
+
+def test_move_undo_redo():
+    new, move, undo, redo = run({"id": 7, "cmd": "new", "puzzle": PUZZLE}, {"cmd": "move", "moves": "A1=5"},
+                                {"cmd": "undo"}, {"cmd": "redo"})
+    assert new["id"] == 7 and new["grid"][0] == 0
+    assert move["ok"] and move["grid"][0] == 5
+    assert undo["grid"][0] == 0 and undo["undone"] == [[0, 0, None]]
+    assert redo["grid"][0] == 5
+
+
+def test_hint_limit_and_solve(tmp_path):
+    path = str(tmp_path / "game.json")
+    results = run({"cmd": "new", "puzzle": PUZZLE}, {"cmd": "hint", "cell": "A1"}, {"cmd": "hint"},
+                  {"cmd": "save", "path": path}, {"cmd": "load", "path": path}, {"cmd": "solve"})
+    new, hint, limited, saved, loaded, solved = results
+    assert hint["ok"] and hint["hint"] == {"row": 0, "col": 0, "value": 5}
+    assert not limited["ok"]
+    assert saved["ok"] and loaded["grid"] == hint["grid"] and loaded["hints_used"] == 1
+    assert solved["complete"] and 0 not in solved["grid"]
+
+
+def test_invalid_lines_report_errors():
+    results = StringIO()
+    run_headless(CONFIG, StringIO("not json\n\n{\"cmd\": \"fly\"}\n"), results)
+    lines = [json.loads(line) for line in results.getvalue().splitlines()]
+    assert [line["ok"] for line in lines] == [False, False]
+
+
+def test_trace_reports_commands_and_solver_calls():
+    configure_tracing({'tracing': {'enabled': True}})
+    try:
+        new, *_, solved, result = run({"cmd": "new", "puzzle": PUZZLE}, {"cmd": "move", "moves": "A1=5"},
+                                      {"cmd": "solve"}, {"cmd": "trace"})
+    finally:
+        configure_tracing({})
+    assert result["ok"]
+    assert not new["complete"] and solved["complete"]
+    assert {"command.new", "command.new/count_solutions_cached", "command.move",
+            "command.solve/find_unique_solution"} <= set(result["trace"])
+    assert result["trace"]["command.move"]["count"] == 1
+
+
+def test_memory_reports_live_game_objects():
+    *_, result = run({"cmd": "new", "puzzle": PUZZLE}, {"cmd": "memory"})
+    assert result["ok"]
+    assert result["memory"]["objects"]["GameState"] >= 1
+    assert result["memory"]["objects"]["Cell"] >= 81
+
+
+def test_new_reads_16x16_puzzles_written_with_letters():
+    puzzle = load_corpus("16x16")[0]
+    result, bad_symbol = run({"cmd": "new", "puzzle": encode(puzzle.puzzle)}, {"cmd": "new", "puzzle": "X" * 81})
+    assert result["ok"]
+    assert result["grid_size"] == 16
+    assert tuple(result["grid"]) == puzzle.puzzle
+    assert not bad_symbol["ok"]
+    assert "Invalid symbol" in bad_symbol["error"]
+
+
+def test_seeded_new_leaves_the_global_generator_alone():
+    random.seed(5)
+    state = random.getstate()
+    first, second = run({"cmd": "new", "seed": 3}, {"cmd": "new", "seed": 3})
+    assert first["ok"]
+    assert first["grid"] == second["grid"]
+    assert random.getstate() == state
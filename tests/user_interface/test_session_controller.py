@@ -0,0 +1,41 @@
+import sys
+from unittest.mock import patch
+
+from core_data.game_state import GameState
+from core_data.grid import Grid
+from user_interface.controller.game_actions_controller import as_transition, game_actions
+from user_interface.controller.session_controller import run_session
+from user_interface.controller.transition import Screen, Transition, MAIN_MENU, NEW_GAME
+
+CONFIG = {'hint_limit': 3, 'grid_size': 9}
+
+
+def scripted_input(answers):
+    answers = iter(answers)
+    return lambda prompt="": next(answers)
+
+
+def test_long_session_keeps_stack_depth_constant():
+    game_state = GameState(Grid.create(9), CONFIG)
+    # Far more actions than the recursion limit, then back to the main menu and exit
+    actions = ["3"] * (sys.getrecursionlimit() * 2) + ["7", "4"]
+    with patch('builtins.input', scripted_input(actions)), \
+            patch('user_interface.controller.main_menu_controller.clear_screen'):
+        run_session(CONFIG, Transition(Screen.GAME, game_state))
+
+
+def test_solve_transition_leaves_game_loop():
+    game_state = GameState(Grid.create(9), CONFIG)
+    with patch('builtins.input', scripted_input(["1"])), \
+            patch('user_interface.controller.game_actions_controller.get_menu_options',
+                  return_value={1: ("Solve the puzzle", lambda state: NEW_GAME)}):
+        assert game_actions(game_state) == NEW_GAME
+
+
+def test_as_transition():
+    game_state = GameState(Grid.create(9), CONFIG)
+    assert as_transition(None, game_state) == MAIN_MENU
+    assert as_transition(NEW_GAME, game_state) == NEW_GAME
+    assert as_transition(game_state, game_state).game_state is game_state
+    # Results that are not game states, such as the details returned when saving, keep the game going
+    assert as_transition(("game.json", "/tmp", {}), game_state) == Transition(Screen.GAME, game_state)
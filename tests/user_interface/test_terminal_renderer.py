@@ -0,0 +1,56 @@
+import os
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+from user_interface.display.terminal_renderer import TerminalRenderer, CLEAR_SCREEN, move_cursor
+
+
+class FakeTerminal(StringIO):
+    def isatty(self):
+        return True
+
+
+@pytest.fixture(autouse=True)
+def tall_terminal():
+    with patch('shutil.get_terminal_size', return_value=os.terminal_size((120, 60))), \
+            patch.dict(os.environ, {'TERM': 'xterm'}):
+        yield
+
+
+def test_first_frame_is_drawn_in_full():
+    stream = FakeTerminal()
+    TerminalRenderer(stream).draw(["a", "b"])
+    assert stream.getvalue() == CLEAR_SCREEN + "a\nb\n"
+
+
+def test_next_frame_rewrites_only_changed_lines():
+    stream = FakeTerminal()
+    renderer = TerminalRenderer(stream)
+    renderer.draw(["a", "b", "c"])
+    stream.truncate(0)
+    stream.seek(0)
+    renderer.draw(["a", "B", "c", "status"])
+    output = stream.getvalue()
+    assert CLEAR_SCREEN not in output
+    assert move_cursor(2) + "B" in output
+    assert move_cursor(4) + "status" in output
+    assert move_cursor(1) not in output and move_cursor(3) not in output
+
+
+def test_reset_redraws_in_full():
+    stream = FakeTerminal()
+    renderer = TerminalRenderer(stream)
+    renderer.draw(["a"])
+    renderer.reset()
+    renderer.draw(["a"])
+    assert stream.getvalue().count(CLEAR_SCREEN) == 2
+
+
+def test_non_terminal_output_gets_full_frames():
+    stream = StringIO()
+    renderer = TerminalRenderer(stream)
+    renderer.draw(["a", "b"])
+    renderer.draw(["a", "c"])
+    assert stream.getvalue() == "a\nb\na\nc\n"
@@ -0,0 +1,50 @@
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from utils import async_logging
+from utils.async_logging import configure_logging, stop_logging
+
+
+@pytest.fixture
+def restore_root_level():
+    level = logging.getLogger().level
+    yield
+    stop_logging()
+    logging.getLogger().setLevel(level)
+
+
+def test_records_reach_the_file_at_the_configured_level(tmp_path, restore_root_level):
+    log_file = tmp_path / "game.log"
+    configure_logging({'logging': {'level': 'warning', 'log_file': str(log_file)}})
+    logging.info("not written")
+    logging.warning("written %d", 42)
+    stop_logging()
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 1
+    assert lines[0].endswith("root - WARNING - written 42")
+
+
+def test_records_are_queued_by_the_caller(tmp_path, restore_root_level):
+    configure_logging({'logging': {'level': 'DEBUG', 'log_file': str(tmp_path / "game.log")}})
+    assert async_logging.queue_handler in logging.getLogger().handlers
+    assert isinstance(async_logging.queue_handler, QueueHandler)
+    assert logging.getLogger().level == logging.DEBUG
+
+
+def test_reconfiguring_replaces_the_queue(tmp_path, restore_root_level):
+    first, second = tmp_path / "first.log", tmp_path / "second.log"
+    configure_logging({'logging': {'log_file': str(first)}})
+    handler = async_logging.queue_handler
+    configure_logging({'logging': {'log_file': str(second)}})
+    assert handler not in logging.getLogger().handlers
+    logging.error("only in the second file")
+    stop_logging()
+    assert not first.exists()
+    assert "only in the second file" in second.read_text()
+
+
+def test_unknown_level_is_rejected(restore_root_level):
+    with pytest.raises(ValueError):
+        configure_logging({'logging': {'level': 'LOUD'}})
@@ -0,0 +1,38 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.inflight import InFlightTable
+
+
+def test_concurrent_callers_share_one_computation():
+    table = InFlightTable()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return 42
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [pool.submit(table.run, "key", compute) for _ in range(5)]
+        while table.stats().coalesced < 4:
+            threading.Event().wait(0.01)
+        release.set()
+        assert [future.result() for future in futures] == [42] * 5
+    assert len(calls) == 1
+    assert table.stats().in_flight == 0
+
+
+def test_exceptions_reach_every_caller_and_are_not_kept():
+    table = InFlightTable()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        table.run("key", fail)
+    assert table.run("key", lambda: 1) == 1
+    assert table.stats().computed == 2
@@ -0,0 +1,50 @@
+import pytest
+
+from utils.lru_cache import LRUCache, memoize
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "a" becomes the most recently used entry
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_cache_rejects_invalid_size():
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_lru_cache_reports_hits_misses_and_evictions():
+    cache = LRUCache(1)
+    cache.get("a")
+    cache.put("a", 1)
+    cache.get("a")
+    cache.put("b", 2)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size, stats.max_size) == (1, 1, 1, 1, 1)
+
+
+def test_memoize_shares_a_bounded_cache_between_functions():
+    cache = LRUCache(8)
+    calls = []
+
+    @memoize(cache, key=lambda value: value)
+    def double(value):
+        calls.append(value)
+        return value * 2
+
+    @memoize(cache, key=lambda value: value)
+    def negate(value):
+        return -value
+
+    assert double(2) == 4
+    assert double(2) == 4
+    assert negate(2) == -2  # Same argument, different function: no collision
+    assert calls == [2]
+    assert len(cache) == 2
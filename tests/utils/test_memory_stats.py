@@ -0,0 +1,45 @@
+import tracemalloc
+
+import pytest
+
+from core_data.grid import Grid
+from puzzle_handler.puzzle_solver.solver_memo import solver_memo
+from utils.memory_stats import TRACKED_TYPES, measure_footprint, memory_stats
+
+
+class Payload:
+    def __init__(self, size):
+        self.data = bytearray(size)
+
+
+def test_memory_stats_counts_live_grids():
+    before = memory_stats()["objects"]["Grid"]
+    grids = [Grid.create(4) for _ in range(3)]
+    stats = memory_stats()
+    assert stats["objects"]["Grid"] == before + 3
+    assert set(stats["objects"]) == set(TRACKED_TYPES)
+    assert stats["solver_memo"] == len(solver_memo)
+    assert stats["gc_objects"] >= sum(stats["objects"].values())
+    assert "traced_kib" not in stats or tracemalloc.is_tracing()
+    del grids
+
+
+def test_memory_stats_reports_traced_bytes_while_tracemalloc_runs():
+    tracemalloc.start()
+    try:
+        stats = memory_stats()
+    finally:
+        tracemalloc.stop()
+    assert stats["traced_peak_kib"] >= stats["traced_kib"] >= 0
+
+
+def test_measure_footprint_counts_bytes_and_objects_per_item():
+    footprint = measure_footprint(lambda index: Payload(10000), 5)
+    assert footprint.items == 5
+    assert 10000 <= footprint.bytes_each < 11000
+    assert footprint.objects_each["Payload"] == 1
+
+
+def test_measure_footprint_rejects_no_items():
+    with pytest.raises(ValueError):
+        measure_footprint(lambda index: None, 0)
@@ -0,0 +1,69 @@
+import os
+import pstats
+
+import pytest
+
+from utils import tracing
+from utils.profiling import configure_profiling
+from utils.tracing import traced
+
+
+@traced("allocate")
+def allocate(count):
+    return [str(index) for index in range(count)]
+
+
+@traced("build")
+def build(count):
+    return allocate(count) + allocate(count)
+
+
+@pytest.fixture
+def profiling(tmp_path):
+    def enable(environ=None, **settings):
+        configure_profiling({'profiling': dict(settings, output_dir=str(tmp_path))}, environ or {})
+        return tmp_path
+
+    yield enable
+    configure_profiling({}, {})
+
+
+def test_profiling_is_off_by_default():
+    configure_profiling({}, {})
+    assert tracing.profiler is None
+    assert not tracing.instrumented
+
+
+def test_environment_overrides_config(profiling):
+    output_dir = profiling({'SUDOKU_PROFILE': 'build, allocate', 'SUDOKU_PROFILE_MODE': 'memory'},
+                           actions=['request_hint'], cpu=True)
+    assert tracing.profiler.actions == {'build', 'allocate'}
+    assert (tracing.profiler.cpu, tracing.profiler.memory) == (False, True)
+    assert tracing.profiler.output_dir == str(output_dir)
+    assert tracing.instrumented
+
+
+def test_selected_action_writes_pstats(profiling):
+    output_dir = profiling(actions=['build'])
+    assert len(build(10)) == 20
+    allocate(10)  # Not selected
+    (report,) = os.listdir(output_dir)
+    assert report.startswith('build-') and report.endswith('.pstats')
+    stats = pstats.Stats(str(output_dir / report))
+    assert any(function == 'allocate' for _, _, function in stats.stats)
+
+
+def test_nested_selected_actions_share_one_capture(profiling):
+    output_dir = profiling(actions=['all'])
+    build(10)
+    assert [name.split('-')[0] for name in os.listdir(output_dir)] == ['build']
+
+
+def test_memory_mode_writes_top_allocations(profiling):
+    output_dir = profiling(actions=['allocate'], cpu=False, memory=True, top=3)
+    allocate(1000)
+    (report,) = os.listdir(output_dir)
+    assert report.startswith('allocate-') and report.endswith('.allocations.txt')
+    lines = (output_dir / report).read_text().splitlines()
+    assert lines[0].startswith('Allocations during allocate: peak')
+    assert 1 <= len(lines) - 2 <= 3
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from utils import tracing
+from utils.tracing import Tracer, configure_tracing, span, trace_report, traced
+
+
+@pytest.fixture
+def enabled_tracing():
+    configure_tracing({'tracing': {'enabled': True, 'capacity': 100}})
+    yield tracing.tracer
+    configure_tracing({})
+
+
+@traced("inner")
+def inner(value):
+    return value * 2
+
+
+@traced("outer")
+def outer(value):
+    return inner(value) + inner(value)
+
+
+@traced("failing")
+def failing():
+    raise ValueError("boom")
+
+
+def test_disabled_tracing_records_nothing():
+    configure_tracing({'tracing': {'enabled': False}})
+    assert tracing.tracer is None
+    assert outer(1) == 4
+    assert trace_report() == {}
+
+
+def test_nested_spans_are_named_by_path(enabled_tracing):
+    assert outer(2) == 8
+    assert [name for name, _ in enabled_tracing.spans()] == ["outer/inner", "outer/inner", "outer"]
+    report = trace_report()
+    assert report["outer/inner"]["count"] == 2
+    assert report["outer"]["count"] == 1
+    assert report["outer"]["total_ms"] >= report["outer/inner"]["total_ms"]
+
+
+def test_failing_calls_are_recorded(enabled_tracing):
+    with pytest.raises(ValueError):
+        failing()
+    assert [name for name, _ in enabled_tracing.spans()] == ["failing"]
+    assert tracing.current_span.get() is None
+
+
+def test_coroutines_and_blocks_are_traced(enabled_tracing):
+    @traced("handler")
+    async def handler():
+        await asyncio.sleep(0)
+        with span("block"):
+            return inner(1)
+
+    assert asyncio.run(handler()) == 2
+    assert [name for name, _ in enabled_tracing.spans()] == ["handler/block/inner", "handler/block", "handler"]
+
+
+def test_ring_buffer_keeps_most_recent_spans():
+    tracer = Tracer(3)
+    for index in range(5):
+        tracer.record(f"span{index}", 0.001)
+    assert [name for name, _ in tracer.spans()] == ["span2", "span3", "span4"]
+
+
+def test_report_percentiles():
+    tracer = Tracer(1000)
+    for milliseconds in range(100, 0, -1):
+        tracer.record("action", milliseconds / 1e3)
+    stats = tracer.report()["action"]
+    assert (stats.count, stats.p50_ms, stats.p95_ms, stats.p99_ms, stats.max_ms) == (100, 50, 95, 99, 100)
+
+
+def test_tracer_rejects_invalid_capacity():
+    with pytest.raises(ValueError):
+        Tracer(0)
@@ -6,9 +6,10 @@ from core_data.cell_state import CellState
 from core_data.cell_value import CellValue
 from core_data.game_state import GameState
 from core_data.grid import Grid, Cell, Coordinate, Row
-from puzzle_handler.puzzle_solver.puzzle_solver import count_solutions
-from user_interface.controller.game_actions_controller import game_actions
+from puzzle_handler.puzzle_solver.solution_cache import count_solutions_cached
+from user_interface.controller.transition import Screen, Transition
 from user_interface.display.display_grid import display_grid
+from utils.tracing import traced
 
 
 def prompt_for_load_location() -> str:
@@ -169,6 +170,7 @@ def create_rows_from_cells(cells: Dict[Coordinate, Cell], grid_size: int) -> Tup
     return create_row(0, [])
 
 
+@traced("validate_saved_game_file")
 def validate_saved_game_file(file_path: str) -> Optional[GameState]:
     """
     Validate the saved game file and load the game state.
@@ -192,13 +194,13 @@ def validate_saved_game_file(file_path: str) -> Optional[GameState]:
 
         config = game_state_data['config']
         hints_used = game_state_data['hints_used']
-        undo_stack = game_state_data['undo_stack']
-        redo_stack = game_state_data['redo_stack']
+        undo_stack = [tuple(action) for action in game_state_data['undo_stack']]
+        redo_stack = [tuple(action) for action in game_state_data['redo_stack']]
 
         game_state = GameState(grid=grid, config=config, hints_used=hints_used, undo_stack=undo_stack,
                                redo_stack=redo_stack)
 
-        if count_solutions(grid, grid.grid_size) == 1:
+        if count_solutions_cached(grid, grid.grid_size) == 1:
             return game_state  # Return the game state if the grid has a unique solution
         else:
             print("The puzzle in the saved file does not have a unique solution.")
@@ -208,19 +210,22 @@ def validate_saved_game_file(file_path: str) -> Optional[GameState]:
         return None  # Return None if there was an error loading the file
 
 
-def load_saved_game(config: dict) -> None:
+def load_saved_game(config: dict) -> Optional[Transition]:
     """
     Load a saved game file and pass control to game actions.
 
     Args:
         config (dict): Configuration settings.
+
+    Returns:
+        Optional[Transition]: The loaded game to play, or None to stay in the main menu.
     """
     directory = prompt_for_load_location()  # Get the load location from the user
     saved_game_files = list_saved_game_files(directory)  # List saved game files in the directory
 
     if not saved_game_files:
         print("No saved game files found in the specified location.")
-        return  # Exit if no saved game files found
+        return None  # Exit if no saved game files found
 
     chosen_file = prompt_for_file_choice(saved_game_files)  # Get the user's file choice
     file_path = os.path.join(directory, chosen_file)  # Construct the file path
@@ -229,6 +234,7 @@ def load_saved_game(config: dict) -> None:
     if game_state:
         print("Saved game loaded successfully.")
         display_grid(game_state.grid)  # Display the loaded grid
-        game_actions(game_state)  # Pass control to game actions
+        return Transition(Screen.GAME, game_state)  # Pass control to game actions
     else:
         print("Failed to load the saved game. Returning to main menu.")
+        return None
@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 from core_data.cell import Cell
 from core_data.cell_state import CellState
@@ -9,12 +9,14 @@ from core_data.grid import Grid
 from gherkin_spec.make_a_move_steps import convert_parsed_moves, apply_and_report_moves, validate_user_input
 from puzzle_handler.puzzle_solver.puzzle_solver import is_valid
 from puzzle_handler.puzzle_solver.sudoku_validation import has_empty_cells, check_and_handle_completion
-from user_interface.display.display_grid import display_grid, display_messages
+from user_interface.controller.transition import Transition, NEW_GAME
+from user_interface.display.display_grid import redraw_grid, display_messages
 from user_interface.input.user_input_handler import get_user_move
 from utils.input_parsing import parse_user_input
+from utils.tracing import traced
 
 
-def make_a_move(game_state: GameState) -> Optional[GameState]:
+def make_a_move(game_state: GameState) -> Optional[Union[GameState, Transition]]:
     grid = game_state.grid
     user_input = get_user_move()
 
@@ -23,21 +25,13 @@ def make_a_move(game_state: GameState) -> Optional[GameState]:
         return None
 
     try:
-        parsed_moves = parse_user_input(user_input, grid.grid_size)
-        moves = convert_parsed_moves(parsed_moves, grid.grid_size)
+        game_state, messages = apply_user_moves(game_state, user_input)
+        grid = game_state.grid
 
-        game_state = push_undo_recursively(game_state, moves, grid, 0)
-        game_state = game_state.clear_redo()
+        redraw_grid(grid, messages)  # Only the changed rows and messages are redrawn on a terminal
 
-        grid, messages = apply_and_report_moves(grid, moves)
-
-        display_messages(messages)
-        display_grid(grid)
-
-        game_state = game_state.with_grid(grid)
-
-        if not has_empty_cells(grid):
-            game_state = check_and_handle_completion(game_state)
+        if not has_empty_cells(grid) and check_and_handle_completion(game_state):
+            return NEW_GAME
 
     except ValueError as e:
         error_message = f"Error: {e}"
@@ -53,20 +47,35 @@ def make_a_move(game_state: GameState) -> Optional[GameState]:
     return game_state
 
 
-def push_undo_recursively(game_state: GameState, moves: List[Tuple[Coordinate, Cell]], grid: Grid,
-                          index: int) -> GameState:
-    if index >= len(moves):
-        return game_state
+@traced("apply_user_moves")
+def apply_user_moves(game_state: GameState, user_input: str) -> Tuple[GameState, List[str]]:
+    """
+    Apply moves such as 'A1=5, B2=None' to the game, without prompting or displaying anything.
+
+    Args:
+        game_state (GameState): The current state of the game.
+        user_input (str): The moves to apply.
+
+    Returns:
+        Tuple[GameState, List[str]]: The updated game state and a message per move.
+
+    Raises:
+        ValueError: If the moves cannot be parsed or applied.
+    """
+    grid = game_state.grid
+    parsed_moves = parse_user_input(user_input, grid.grid_size)
+    moves = convert_parsed_moves(parsed_moves, grid.grid_size)
+
+    undo_actions = collect_undo_actions(moves, grid)
+    grid, messages = apply_and_report_moves(grid, moves)
+
+    # The grid before the move is kept as an undo snapshot, so undoing it is a pointer swap
+    return game_state.record_move(grid, undo_actions), messages
 
-    try:
-        coord, _ = moves[index]
-        undo_action = (coord.row_index, coord.col_index, grid[coord].value.value)
-        game_state = game_state.push_undo(undo_action)
-    except Exception as e:
-        logging.error(f"Error pushing undo: {e}")
-        raise
 
-    return push_undo_recursively(game_state, moves, grid, index + 1)
+def collect_undo_actions(moves: List[Tuple[Coordinate, Cell]], grid: Grid) -> List[Tuple[int, int, int]]:
+    # One (row, col, previous value) entry per cell the move touches, in the order the moves are applied
+    return [(coord.row_index, coord.col_index, grid[coord].value.value) for coord, _ in moves]
 
 
 def is_puzzle_complete(grid: Grid) -> bool:
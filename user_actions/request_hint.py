@@ -1,14 +1,19 @@
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 from core_data.cell_state import CellState
 from core_data.coordinate import Coordinate
 from core_data.game_state import GameState
 from core_data.grid import Grid, update_grid
-from puzzle_handler.puzzle_solver.puzzle_solver import count_solutions, is_valid
+from puzzle_handler.puzzle_solver.background_solver import precomputed
+from puzzle_handler.puzzle_solver.logical_hints import LogicalHint
+from puzzle_handler.puzzle_solver.puzzle_solver import is_valid
+from puzzle_handler.puzzle_solver.solution_cache import count_solutions_cached
 from puzzle_handler.puzzle_solver.sudoku_validation import has_empty_cells, check_and_handle_completion
-from user_interface.display.display_grid import display_grid
+from user_interface.controller.transition import Transition, NEW_GAME
+from user_interface.display.display_grid import redraw_grid
 from user_interface.input.user_input_handler import get_hint_choice
 from utils.grid_utils import find_random_empty_cell, try_values_recursive, label_to_index
+from utils.tracing import traced
 
 
 def get_specific_cell(grid_size: int) -> Tuple[int, int]:
@@ -27,8 +32,13 @@ def get_specific_cell(grid_size: int) -> Tuple[int, int]:
 
 def generate_hint(grid: Grid, row: int, col: int) -> Optional[int]:
     """
-    Generate a valid hint value for the given cell.
+    Generate a valid hint value for the given cell, from the precomputed solution if there is one,
+    otherwise by trying every value with a uniqueness search.
     """
+    ready = precomputed(grid)
+    if ready is not None and ready.solution is not None and not grid[row, col].value.value:
+        # With a unique solution, its value is the only one that keeps the puzzle uniquely solvable
+        return ready.solution[row, col].value.value
 
     def hint_callback(num: int, context: Tuple[Grid, int, int]) -> Optional[int]:
         """
@@ -37,7 +47,7 @@ def generate_hint(grid: Grid, row: int, col: int) -> Optional[int]:
         grid, row, col = context
         if is_valid(grid, row, col, num):
             test_grid = update_grid(grid, Coordinate(row, col, grid.grid_size), num, CellState.HINT)
-            if count_solutions(test_grid, grid.grid_size) == 1:
+            if count_solutions_cached(test_grid, grid.grid_size) == 1:
                 return num  # Return the valid hint value
         return None
 
@@ -45,7 +55,7 @@ def generate_hint(grid: Grid, row: int, col: int) -> Optional[int]:
     return try_values_recursive(list(range(1, grid.grid_size + 1)), hint_callback, context)
 
 
-def request_hint(game_state: GameState) -> GameState:
+def request_hint(game_state: GameState) -> Union[GameState, Transition]:
     """
     Request a hint for the given grid based on the user's choice and configuration.
     Returns the updated game state with the applied hint (if any).
@@ -56,9 +66,14 @@ def request_hint(game_state: GameState) -> GameState:
 
     choice = validate_hint_choice(get_hint_choice())  # Get and validate user's hint choice
 
-    row, col = (get_specific_cell(game_state.grid.grid_size)
-                if choice == 'specific'
-                else find_random_empty_cell(game_state.grid))
+    technique = None
+    if choice == 'specific':
+        row, col = get_specific_cell(game_state.grid.grid_size)
+    else:
+        # The cheapest next deduction, or any empty cell if the techniques get stuck
+        hint = game_state.hint_map().easiest()
+        row, col = (hint.row, hint.col) if hint else find_random_empty_cell(game_state.grid)
+        technique = hint.describe() if hint else None
 
     if row is None or col is None:
         print("No empty cells available for a hint.")
@@ -72,7 +87,7 @@ def request_hint(game_state: GameState) -> GameState:
     if cell.state == CellState.USER_FILLED and not confirm_overwrite(row, col, cell.value.value):
         return game_state
 
-    return apply_hint(game_state, row, col)
+    return apply_hint(game_state, row, col, technique)
 
 
 def confirm_overwrite(row: int, col: int, value: int) -> bool:
@@ -83,32 +98,65 @@ def confirm_overwrite(row: int, col: int, value: int) -> bool:
     return input("> ").strip().upper() == 'Y'
 
 
-def apply_hint(game_state: GameState, row: int, col: int) -> GameState:
+def apply_hint(game_state: GameState, row: int, col: int,
+               technique: Optional[str] = None) -> Union[GameState, Transition]:
     """
-    Apply a hint to the given cell and return the updated game state.
+    Apply a hint to the given cell and return the updated game state. The technique that found the
+    cell, if any, is shown with the hint.
     """
     try:
-        hint_value = generate_hint(game_state.grid, row, col)
-        if hint_value is None:
+        placed = place_hint(game_state, row, col)
+        if placed is None:
             print(f"No valid hint could be generated for the cell {chr(ord('A') + row)}{col + 1}.")
             return game_state
 
-        new_grid = update_grid(game_state.grid, Coordinate(row, col, game_state.grid.grid_size), hint_value,
-                               CellState.HINT)
-        new_game_state = game_state.increment_hints().with_grid(new_grid)
-        print(f"Hint applied for cell {chr(ord('A') + row)}{col + 1}. Value: {hint_value}.")
-        print(f"Hints remaining: {new_game_state.hints_remaining()}")
+        new_game_state, hint_value = placed
+        redraw_grid(new_game_state.grid,
+                    [f"Hint applied for cell {chr(ord('A') + row)}{col + 1}"
+                     f"{f' ({technique})' if technique else ''}. Value: {hint_value}.",
+                     f"Hints remaining: {new_game_state.hints_remaining()}"])
 
-        if not has_empty_cells(new_grid):
-            new_game_state = check_and_handle_completion(new_game_state)
-
-        display_grid(new_game_state.grid)
+        if not has_empty_cells(new_game_state.grid) and check_and_handle_completion(new_game_state):
+            return NEW_GAME
         return new_game_state
     except ValueError as e:
         print(f"System failed to puzzle_generator hint. Please check your previous moves. Error: {e}")
         return game_state
 
 
+@traced("place_hint")
+def place_hint(game_state: GameState, row: int, col: int) -> Optional[Tuple[GameState, int]]:
+    """
+    Fill the given cell with a hint and count it, without prompting or displaying anything. Cells the
+    game's hint map can deduce are answered from it; other cells fall back to generate_hint.
+
+    Returns:
+        Optional[Tuple[GameState, int]]: The updated game state and the hint value, or None if no hint fits.
+    """
+    hint = deduced_hint(game_state, row, col)
+    hint_value = hint.value if hint is not None else generate_hint(game_state.grid, row, col)
+    if hint_value is None:
+        return None
+    new_grid = update_grid(game_state.grid, Coordinate(row, col, game_state.grid.grid_size), hint_value,
+                           CellState.HINT)
+    return game_state.increment_hints().with_grid(new_grid), hint_value
+
+
+def deduced_hint(game_state: GameState, row: int, col: int) -> Optional[LogicalHint]:
+    """
+    Look the cell up in the game's hint map. A deduction is dropped only when the background solver has
+    already finished the grid and found it without a unique solution (e.g. after a wrong move); the check
+    never waits for the solver.
+    """
+    hint = game_state.hint_map().get(row, col)
+    if hint is None:
+        return None
+    ready = precomputed(game_state.grid, timeout=0)
+    if ready is not None and ready.solution_count != 1:
+        return None
+    return hint
+
+
 def validate_hint_choice(choice: str) -> str:
     """
     Validate the user's hint choice, re-prompting if necessary.
@@ -6,6 +6,7 @@ from core_data.coordinate import Coordinate
 from core_data.game_state import GameState
 from core_data.grid import Grid
 from user_interface.input.user_input_handler import prompt_for_file_details
+from utils.tracing import traced
 
 
 def game_state_to_dict(game_state: GameState) -> Dict:
@@ -22,8 +23,8 @@ def game_state_to_dict(game_state: GameState) -> Dict:
         "grid": grid_to_dict(game_state.grid),
         "config": game_state.config,
         "hints_used": game_state.hints_used,
-        "undo_stack": game_state.undo_stack,
-        "redo_stack": game_state.redo_stack
+        "undo_stack": game_state.undo_stack.to_list(),
+        "redo_stack": game_state.redo_stack.to_list()
     }
 
 
@@ -58,6 +59,7 @@ def grid_to_dict(grid: Grid) -> Dict:
     return {'grid_size': grid.grid_size, 'cells': cells_dict}
 
 
+@traced("save_game_to_file")
 def save_game_to_file(game_state: GameState) -> Tuple[str, str, Dict]:
     """
     Prepare the current game state to be saved to a file.
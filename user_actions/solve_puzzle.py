@@ -1,32 +1,32 @@
+from typing import Optional, Tuple, Union
+
 from colorama import Fore, Style
 
 from core_data.game_state import GameState
 from core_data.grid import Grid
-from puzzle_handler.puzzle_solver.puzzle_solver import backtrack, count_solutions
-from user_actions.start_new_game import start_new_game
-from user_interface.controller.main_menu_controller import menu_loop
+from puzzle_handler.puzzle_solver.background_solver import precomputed
+from puzzle_handler.puzzle_solver.solution_cache import solve_cached, count_solutions_cached
+from user_interface.controller.transition import Transition, NEW_GAME, MAIN_MENU
 from user_interface.display.display_grid import display_grid
 from user_interface.input.user_input_handler import get_post_solve_choice
+from utils.tracing import traced
 
 
-def solve_puzzle(game_state: GameState) -> Grid:
+def solve_puzzle(game_state: GameState) -> Union[GameState, Transition]:
     """
     Solve the Sudoku puzzle using backtracking.
 
     Args:
-        grid (Grid): The Sudoku grid to puzzle_solver.
+        game_state (GameState): The current state of the game.
 
     Returns:
-        Grid: The solved Sudoku grid.
-        :param game_state:
+        Union[GameState, Transition]: The screen chosen after solving, or the unchanged game state
+        if the puzzle could not be solved.
     """
-    grid = game_state.grid
-    grid_size = grid.grid_size
-    num_solutions = count_solutions(grid, grid_size)
+    num_solutions, solved_grid = find_unique_solution(game_state.grid)
 
     if num_solutions == 1:
-        solved_grid, success = backtrack(grid)
-        if success:
+        if solved_grid is not None:
             # If the puzzle is successfully solved
 
             display_grid(solved_grid)  # Display the solved grid
@@ -36,17 +36,34 @@ def solve_puzzle(game_state: GameState) -> Grid:
             choice = get_post_solve_choice()  # Get user's choice after solving
             if choice == 1:
                 print("Starting a new game...")
-                # Implement starting a new game logic here
-                start_new_game(game_state.config)
-            elif choice == 2:
-                print("Returning to main menu...")
-                # returning to main menu
-                menu_loop(game_state.config)
-            return solved_grid
+                return NEW_GAME
+            print("Returning to main menu...")
+            return MAIN_MENU
         else:
             print("Failed to puzzle_solver the puzzle")
-            return grid
+            return game_state
     else:
         print(f"The puzzle has {num_solutions} solutions. It must have a unique solution to be solved. Please recheck "
               f" your moves.")
-        return grid
+        return game_state
+
+
+@traced("find_unique_solution")
+def find_unique_solution(grid: Grid) -> Tuple[int, Optional[Grid]]:
+    """
+    Count the puzzle's solutions and, if there is exactly one, solve it, without prompting or displaying
+    anything.
+
+    Args:
+        grid (Grid): The puzzle to solve.
+
+    Returns:
+        Tuple[int, Optional[Grid]]: The number of solutions and the solved grid, or None if the puzzle
+        has no unique solution or could not be solved.
+    """
+    ready = precomputed(grid)  # Usually finished by the background solver while the player was thinking
+    num_solutions = ready.solution_count if ready else count_solutions_cached(grid, grid.grid_size)
+    if num_solutions != 1:
+        return num_solutions, None
+    solved_grid, success = (ready.solution, True) if ready and ready.solution else solve_cached(grid)
+    return num_solutions, solved_grid if success else None
@@ -1,13 +1,19 @@
+from typing import Optional
+
 from core_data.game_state import GameState
 from puzzle_handler.puzzle_generator.generate_puzzle import generate_puzzle
+from user_interface.controller.transition import Screen, Transition
 from user_interface.display.display_grid import display_grid
 from user_interface.display.menu_display import display_invalid_input
 from user_interface.input.user_input_handler import get_difficulty_choice
 
 
-def start_new_game(config):
+def start_new_game(config) -> Optional[Transition]:
     """
     Function to start a new game.
+
+    Returns:
+        Optional[Transition]: The new game to play, or None to stay in the main menu.
     """
     difficulty = get_difficulty_choice()
     if difficulty not in ["easy", "medium", "hard"]:
@@ -16,7 +22,7 @@ def start_new_game(config):
     grid = generate_puzzle(config, difficulty)
     game_state = initialize_game_state(grid, config)
     display_grid(game_state.grid)
-    prompt_for_game_actions(game_state)
+    return prompt_for_game_actions(game_state)
 
 
 def initialize_game_state(grid, config):
@@ -33,12 +39,14 @@ def initialize_game_state(grid, config):
     return GameState(grid, config)
 
 
-def prompt_for_game_actions(game_state):
+def prompt_for_game_actions(game_state) -> Transition:
     """
     Prompt for game actions.
 
     Args:
         game_state: The current state of the game.
+
+    Returns:
+        Transition: Hands the game to the session controller's game screen.
     """
-    from user_interface.controller.game_actions_controller import game_actions
-    game_actions(game_state)
+    return Transition(Screen.GAME, game_state)
@@ -1,8 +1,7 @@
-from core_data.cell_state import CellState
-from core_data.coordinate import Coordinate
+from typing import List, Tuple
+
 from core_data.game_state import GameState
-from core_data.grid import update_grid
-from user_interface.display.display_grid import display_grid
+from user_interface.display.display_grid import redraw_grid
 
 
 def undo_move(game_state: GameState) -> GameState:
@@ -10,34 +9,42 @@ def undo_move(game_state: GameState) -> GameState:
     Undo the last user action.
     """
     try:
-        action, new_game_state = game_state.pop_undo()
-        if action is None:
+        actions, new_game_state = game_state.undo()
+        if not actions:
             print("No more actions to undo.")
             return new_game_state
 
-        row, col, previous_value = action
-
-        # Push the current state to the redo stack
-        new_game_state = new_game_state.push_redo((row, col, new_game_state.grid[row, col].value.value))
+        # Display the grid with a message indicating which cells were undone
+        redraw_grid(new_game_state.grid, describe_changed_cells("Undo", "reverted to", actions))
+        return new_game_state
+    except ValueError as e:
+        print(f"Undo operation failed: {e}")
+        return game_state
+    except Exception as e:
+        print(f"An unexpected error occurred during undo: {e}")
+        return game_state
 
-        # Revert the grid to the previous value
-        new_grid = update_grid(
-            new_game_state.grid,
-            Coordinate(row, col, new_game_state.grid.grid_size),
-            previous_value,
-            CellState.USER_FILLED if previous_value != 0 else CellState.EMPTY
-        )
 
-        # Display a message indicating which cell was undone
-        print(
-            f"Undo applied: cell {chr(ord('A') + row)}{col + 1} reverted to {previous_value if previous_value != 0 else 'empty'}.")
+def redo_move(game_state: GameState) -> GameState:
+    """
+    Redo the last undone user action.
+    """
+    try:
+        actions, new_game_state = game_state.redo()
+        if not actions:
+            print("No more actions to redo.")
+            return new_game_state
 
-        # Display the grid
-        display_grid(new_grid)
-        return new_game_state.with_grid(new_grid)
+        redraw_grid(new_game_state.grid, describe_changed_cells("Redo", "set to", actions))
+        return new_game_state
     except ValueError as e:
-        print(f"Undo operation failed: {e}")
+        print(f"Redo operation failed: {e}")
         return game_state
     except Exception as e:
-        print(f"An unexpected error occurred during undo: {e}")
+        print(f"An unexpected error occurred during redo: {e}")
         return game_state
+
+
+def describe_changed_cells(operation: str, verb: str, actions: List[Tuple[int, int, int]]) -> List[str]:
+    return [f"{operation} applied: cell {chr(ord('A') + row)}{col + 1} {verb} {value if value else 'empty'}."
+            for row, col, value in actions]
@@ -7,14 +7,13 @@ from core_data.cell_value import CellValue
 from core_data.coordinate import Coordinate
 from core_data.game_state import GameState
 from core_data.grid import Grid, update_grid
-from puzzle_handler.puzzle_solver.puzzle_solver import apply_naked_singles, check_unique_solvability, \
-    count_solutions
-from user_interface.controller.game_actions_controller import game_actions
+from puzzle_handler.puzzle_solver.puzzle_solver import apply_naked_singles
+from puzzle_handler.puzzle_solver.solution_cache import check_unique_solvability_cached, count_solutions_cached
+from user_interface.controller.transition import Screen, Transition
 from user_interface.display.display_grid import display_grid
-from user_interface.display.menu_display import display_menu_with_title
-from user_interface.input.menu_enums import MainMenuOption, get_menu_options
 from user_interface.input.user_input_handler import get_user_move
 from utils.input_parsing import parse_user_input
+from utils.tracing import traced
 
 
 def input_sudoku_values_recursively(grid: Grid, user_moves: List[Tuple[Coordinate, int]], index: int = 0) -> Optional[
@@ -55,6 +54,7 @@ def input_sudoku_values_recursively(grid: Grid, user_moves: List[Tuple[Coordinat
     return input_sudoku_values_recursively(grid, user_moves, index + 1)
 
 
+@traced("validate_uploaded_grid")
 def validate_uploaded_grid(grid: Grid) -> bool:
     """
     Validate the uploaded Sudoku grid.
@@ -69,7 +69,7 @@ def validate_uploaded_grid(grid: Grid) -> bool:
     grid = apply_naked_singles(grid)
 
     # Count solutions and check unique solvability
-    if count_solutions(grid, grid.grid_size) == 1 and check_unique_solvability(grid):
+    if count_solutions_cached(grid, grid.grid_size) == 1 and check_unique_solvability_cached(grid):
         return True
     else:
         return False  # Ensure the function returns False for an invalid grid
@@ -77,7 +77,7 @@ def validate_uploaded_grid(grid: Grid) -> bool:
 
 def input_and_validate(config: dict, grid: Grid) -> Optional[Grid]:
     """
-    Input values and validate the Sudoku grid.
+    Input values and validate the Sudoku grid, asking again until the grid is valid.
 
     Args:
         config (dict): Configuration settings.
@@ -86,63 +86,62 @@ def input_and_validate(config: dict, grid: Grid) -> Optional[Grid]:
     Returns:
         Optional[Grid]: The updated grid if valid, otherwise None.
     """
-    display_grid(grid)  # Display the current grid state
+    while True:
+        display_grid(grid)  # Display the current grid state
 
-    print("Enter your moves in the format 'A1=5, B2=3, C3=7' or type 'menu' to return to the main menu:")
-    user_input = get_user_move()  # Get user input moves
+        print("Enter your moves in the format 'A1=5, B2=3, C3=7' or type 'menu' to return to the main menu:")
+        user_input = get_user_move()  # Get user input moves
 
-    if user_input.lower() == 'menu':
-        display_menu_with_title("Main Menu", get_menu_options(MainMenuOption))  # Display the main menu
-        return None
+        if user_input.lower() == 'menu':
+            return None
+
+        try:
+            user_moves = parse_user_input(user_input, grid.grid_size)
+            if not user_moves:
+                print("Error: Invalid input format. Please try again.")
+                continue  # Retry input and validation
+
+            moves = [(Coordinate(coord[0], coord[1], grid.grid_size), value) for coord, value in user_moves]
+            updated_grid = input_sudoku_values_recursively(grid, moves)  # Apply user input values
+
+            if updated_grid is None:
+                print("Failed to upload Sudoku. Please correct the errors and try again.")
+                continue  # Retry input and validation
 
-    try:
-        user_moves = parse_user_input(user_input, grid.grid_size)
-        if not user_moves:
-            print("Error: Invalid input format. Please try again.")
-            return input_and_validate(config, grid)  # Retry input and validation
-
-        moves = [(Coordinate(coord[0], coord[1], grid.grid_size), value) for coord, value in user_moves]
-        updated_grid = input_sudoku_values_recursively(grid, moves)  # Apply user input values
-
-        if updated_grid is None:
-            print("Failed to upload Sudoku. Please correct the errors and try again.")
-            return input_and_validate(config, grid)  # Retry input and validation
-        else:
             display_grid(updated_grid)  # Display the filled grid
             if validate_uploaded_grid(updated_grid):
                 print("Uploaded Sudoku is valid and has a unique solution.")
-                new_game_state = GameState(updated_grid, config, 0, [])
-                game_actions(new_game_state)  # Proceed to game actions
                 return updated_grid  # Return the valid updated grid
-            else:
-                print(
-                    "Failed to upload Sudoku. The grid does not have a unique solution. Please correct the errors and "
-                    "try again.")
-                return input_and_validate(config, updated_grid)  # Retry input and validation
-    except ValueError as e:
-        print(f"Error: {e}")
-        logging.error(f"ValueError: {e}")
-        return input_and_validate(config, grid)  # Retry input and validation
+            print(
+                "Failed to upload Sudoku. The grid does not have a unique solution. Please correct the errors and "
+                "try again.")
+            grid = updated_grid  # Retry input and validation on the updated grid
+        except ValueError as e:
+            print(f"Error: {e}")
+            logging.error(f"ValueError: {e}")
 
 
-def upload_sudoku(config: dict) -> None:
+def upload_sudoku(config: dict) -> Optional[Transition]:
     """
     Upload a Sudoku puzzle and proceed to game actions if valid.
 
     Args:
         config (dict): Configuration settings.
+
+    Returns:
+        Optional[Transition]: The uploaded game to play, or None to return to the main menu.
     """
     grid_size = config.get('grid_size')  #
     if not grid_size or not isinstance(grid_size, int) or grid_size < 1:
         print("Error: Invalid grid size in the configuration.")
-        return
+        return None
 
     grid = Grid.create(grid_size)  # Use the Grid class to create an empty grid
     if grid is None:
         print("Error: Failed to create an empty grid.")
-        return
+        return None
 
     updated_grid = input_and_validate(config, grid)  # Input values and validate
-    if updated_grid is not None:
-        # Optionally do something with the updated grid if needed
-        pass
+    if updated_grid is None:
+        return None
+    return Transition(Screen.GAME, GameState(updated_grid, config, 0, []))  # Proceed to game actions
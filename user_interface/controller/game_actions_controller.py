@@ -1,40 +1,49 @@
 from core_data.game_state import GameState
+from puzzle_handler.puzzle_solver.background_solver import precompute
+from user_interface.controller.transition import Screen, Transition, MAIN_MENU
 from user_interface.display.menu_display import display_invalid_input, display_menu_with_title
 from user_interface.input.menu_enums import get_menu_options, GameAction
 
 
-def game_actions(game_state: GameState) -> None:
+def game_actions(game_state: GameState) -> Transition:
     """
-    Function to handle game actions.
+    Function to handle game actions until the user leaves the game.
 
     Args:
         game_state (GameState): The current state of the game.
+
+    Returns:
+        Transition: The screen to show after leaving the game.
     """
-    actions = get_menu_options(GameAction)
-    game_actions_recursive(game_state, actions)
+    transition = Transition(Screen.GAME, game_state)
+    while transition.screen is Screen.GAME:
+        transition = game_action_step(transition.game_state)
+    precompute(None)  # Nothing to work ahead on outside the game
+    return transition
 
 
-def game_actions_recursive(game_state: GameState, actions: dict) -> None:
+def game_action_step(game_state: GameState) -> Transition:
     """
-    Recursively handle game actions.
+    Show the game action menu once and handle a single action.
 
     Args:
         game_state (GameState): The current state of the game.
-        actions (dict): Dictionary mapping choices to their handlers.
+
+    Returns:
+        Transition: The game to continue, or the screen to move to.
     """
+    # Solve ahead while the player chooses; a new grid replaces any work on the previous one
+    precompute(game_state.grid)
+    actions = get_menu_options(GameAction)
     # Display the game action menu
     display_menu_with_title("Choose a Game Action", actions)
     # Prompt the user for their choice
     choice = prompt_action(len(actions))
-
-    # Handle the chosen action and get the updated game state
-    new_game_state = handle_action(choice, game_state, actions)
-    # Continue recursion only if not returning to the main menu
-    if new_game_state is not None:
-        game_actions_recursive(new_game_state, actions)
+    # Handle the chosen action and get the next step
+    return handle_action(choice, game_state, actions)
 
 
-def handle_action(choice: int, game_state: GameState, actions: dict) -> GameState:
+def handle_action(choice: int, game_state: GameState, actions: dict) -> Transition:
     """
     Handle the user's action choice.
 
@@ -44,20 +53,35 @@ def handle_action(choice: int, game_state: GameState, actions: dict) -> GameStat
         actions (dict): Dictionary mapping choices to their handlers.
 
     Returns:
-        GameState: The updated state of the game or None if returning to main menu.
+        Transition: The updated game, or the main menu if returning to main menu.
     """
     action = actions.get(choice)
     if action:
         _, handler = action
         if handler:
-            # Execute the handler function and return the updated game state
-            return handler(game_state)
+            # Execute the handler function and continue with its result
+            return as_transition(handler(game_state), game_state)
         else:
             # Handle "Back to main menu"
             print("Exiting to the main menu...")
-            return None
+            return MAIN_MENU
     print("Invalid choice. Please enter a valid number.")
-    return game_state
+    return Transition(Screen.GAME, game_state)
+
+
+def as_transition(result, game_state: GameState) -> Transition:
+    """
+    Turn the result of a game action into the next step. Actions return an updated GameState, a
+    Transition to another screen, or None to go back to the main menu; any other result (e.g. the
+    details returned by save_game_to_file) leaves the game unchanged.
+    """
+    if isinstance(result, Transition):
+        return result
+    if result is None:
+        return MAIN_MENU
+    if isinstance(result, GameState):
+        return Transition(Screen.GAME, result)
+    return Transition(Screen.GAME, game_state)
 
 
 def prompt_action(num_options: int) -> int:
@@ -70,9 +94,8 @@ def prompt_action(num_options: int) -> int:
     Returns:
         int: The user's valid action choice.
     """
-    choice = input("> ")
-    if choice.isdigit() and 1 <= int(choice) <= num_options:
-        return int(choice)
-    else:
+    while True:
+        choice = input("> ")
+        if choice.isdigit() and 1 <= int(choice) <= num_options:
+            return int(choice)
         display_invalid_input(f"Invalid choice. Please enter a number between 1 and {num_options}.")
-        return prompt_action(num_options)
@@ -0,0 +1,236 @@
+import json
+import logging
+import random
+import sys
+from contextlib import redirect_stdout
+from typing import Callable, Dict, Optional, TextIO, Tuple
+
+from core_data.cell_state import CellState
+from core_data.game_state import GameState
+from puzzle_handler.puzzle_generator.generate_puzzle import generate_puzzle
+from puzzle_handler.puzzle_solver.solution_cache import count_solutions_cached
+from puzzle_handler.puzzle_solver.sudoku_validation import is_puzzle_complete
+from user_actions.load_saved_game import validate_saved_game_file
+from user_actions.make_a_move import apply_user_moves
+from user_actions.request_hint import place_hint
+from user_actions.solve_puzzle import find_unique_solution
+from user_actions.save_game import game_state_to_dict
+from utils import tracing
+from utils.grid_utils import decode_values, grid_to_values, values_to_grid, find_random_empty_cell, label_to_index
+from utils.memory_stats import memory_stats
+from utils.tracing import span, trace_report
+
+# A command handler takes the current game (None before 'new' or 'load') and the command,
+# and returns the next game and the fields to report
+CommandResult = Tuple[Optional[GameState], Dict]
+
+
+class CommandError(Exception):
+    pass
+
+
+def require_game(game_state: Optional[GameState]) -> GameState:
+    if game_state is None:
+        raise CommandError("No game in progress. Send 'new' or 'load' first.")
+    return game_state
+
+
+def new_command(config: Dict, game_state: Optional[GameState], command: Dict) -> CommandResult:
+    # Either replay a known puzzle, given as row-major values with 0 for empty cells, or generate one. A string
+    # gives one symbol per cell, 1-9 then A-P for 10-25 as in the benchmark corpora; a list gives the numbers
+    if "puzzle" in command:
+        puzzle = command["puzzle"]
+        values = decode_values(puzzle) if isinstance(puzzle, str) else tuple(puzzle)
+        grid_size = int(round(len(values) ** 0.5))
+        grid = values_to_grid(values, grid_size)
+        if count_solutions_cached(grid, grid_size) != 1:
+            raise CommandError("The puzzle does not have a unique solution.")
+    else:
+        # A local generator, so a seed does not reseed the global one other sessions share
+        rng = random.Random(command["seed"]) if "seed" in command else None
+        grid = generate_puzzle(config, command.get("difficulty", "easy"), rng)
+    return GameState(grid, config), {}
+
+
+def move_command(config: Dict, game_state: Optional[GameState], command: Dict) -> CommandResult:
+    moves = command.get("moves", "")
+    if not isinstance(moves, str):
+        moves = ", ".join(moves)
+    try:
+        new_game_state, messages = apply_user_moves(require_game(game_state), moves)
+    except ValueError as e:
+        raise CommandError(str(e))
+    return new_game_state, {"messages": messages}
+
+
+def hint_command(config: Dict, game_state: Optional[GameState], command: Dict) -> CommandResult:
+    game_state = require_game(game_state)
+    if not game_state.can_use_hint():
+        raise CommandError("Hint limit reached. No more hints available.")
+    if "cell" in command:
+        cell = label_to_index(str(command["cell"]).strip().upper(), game_state.grid.grid_size)
+        if cell is None:
+            raise CommandError(f"Invalid cell coordinate: {command['cell']}.")
+        hint = None
+    else:
+        hint = game_state.hint_map().easiest()
+        cell = (hint.row, hint.col) if hint else find_random_empty_cell(game_state.grid)
+        if cell is None:
+            raise CommandError("No empty cells available for a hint.")
+    row, col = cell
+    if game_state.grid[row, col].state == CellState.PRE_FILLED:
+        raise CommandError(f"The cell {chr(ord('A') + row)}{col + 1} is prefilled and cannot be modified.")
+    placed = place_hint(game_state, row, col)
+    if placed is None:
+        raise CommandError(f"No valid hint could be generated for the cell {chr(ord('A') + row)}{col + 1}.")
+    new_game_state, hint_value = placed
+    details = {"row": row, "col": col, "value": hint_value}
+    if hint is not None:
+        details["technique"] = hint.describe()
+    return new_game_state, {"hint": details, "hints_remaining": new_game_state.hints_remaining()}
+
+
+def undo_command(config: Dict, game_state: Optional[GameState], command: Dict) -> CommandResult:
+    actions, new_game_state = require_game(game_state).undo()
+    return new_game_state, {"undone": [list(action) for action in actions]}
+
+
+def redo_command(config: Dict, game_state: Optional[GameState], command: Dict) -> CommandResult:
+    actions, new_game_state = require_game(game_state).redo()
+    return new_game_state, {"redone": [list(action) for action in actions]}
+
+
+def solve_command(config: Dict, game_state: Optional[GameState], command: Dict) -> CommandResult:
+    game_state = require_game(game_state)
+    num_solutions, solved_grid = find_unique_solution(game_state.grid)
+    if num_solutions != 1:
+        raise CommandError(f"The puzzle has {num_solutions} solutions. It must have a unique solution to be solved.")
+    if solved_grid is None:
+        raise CommandError("Failed to solve the puzzle.")
+    return game_state.with_grid(solved_grid), {}
+
+
+def save_command(config: Dict, game_state: Optional[GameState], command: Dict) -> CommandResult:
+    game_state = require_game(game_state)
+    if "path" not in command:
+        raise CommandError("'save' needs a 'path'.")
+    with open(command["path"], "w") as file:
+        json.dump(game_state_to_dict(game_state), file)
+    return game_state, {"path": command["path"]}
+
+
+def load_command(config: Dict, game_state: Optional[GameState], command: Dict) -> CommandResult:
+    if "path" not in command:
+        raise CommandError("'load' needs a 'path'.")
+    loaded = validate_saved_game_file(command["path"])
+    if loaded is None:
+        raise CommandError(f"Failed to load the saved game from {command['path']}.")
+    return loaded, {}
+
+
+def trace_command(config: Dict, game_state: Optional[GameState], command: Dict) -> CommandResult:
+    return game_state, {"trace": trace_report()}
+
+
+def memory_command(config: Dict, game_state: Optional[GameState], command: Dict) -> CommandResult:
+    return game_state, {"memory": memory_stats()}
+
+
+COMMANDS: Dict[str, Callable[[Dict, Optional[GameState], Dict], CommandResult]] = {
+    "new": new_command,
+    "move": move_command,
+    "hint": hint_command,
+    "undo": undo_command,
+    "redo": redo_command,
+    "solve": solve_command,
+    "save": save_command,
+    "load": load_command,
+    "trace": trace_command,
+    "memory": memory_command,
+}
+
+
+def describe_game(game_state: Optional[GameState]) -> Dict:
+    if game_state is None:
+        return {}
+    grid = game_state.grid
+    return {
+        "grid_size": grid.grid_size,
+        "grid": list(grid_to_values(grid)),
+        "hints_used": game_state.hints_used,
+        "complete": is_puzzle_complete(grid),
+    }
+
+
+def parse_command(line: str) -> Dict:
+    command = json.loads(line)
+    if not isinstance(command, dict):
+        raise CommandError("A command must be a JSON object.")
+    return command
+
+
+def run_command(config: Dict, game_state: Optional[GameState], command: Dict) -> CommandResult:
+    """
+    Run one parsed command against the game.
+
+    Args:
+        config (Dict): Configuration settings.
+        game_state (Optional[GameState]): The current game, None before 'new' or 'load'.
+        command (Dict): A 'cmd' field and the command's arguments.
+
+    Returns:
+        CommandResult: The next game and the JSON-ready result, with 'ok' and the game or an 'error'.
+    """
+    response = {}
+    if "id" in command:
+        response["id"] = command["id"]  # Lets callers match results to pipelined commands
+    try:
+        handler = COMMANDS.get(command.get("cmd"))
+        if handler is None:
+            raise CommandError(f"Unknown command {command.get('cmd')!r}. Expected one of: {', '.join(COMMANDS)}.")
+        if not tracing.instrumented:
+            game_state, result = handler(config, game_state, command)
+        else:
+            with span(f"command.{command['cmd']}"):
+                game_state, result = handler(config, game_state, command)
+        response.update(ok=True, **result, **describe_game(game_state))
+    except (CommandError, ValueError, KeyError, TypeError, OSError) as e:
+        response.update(ok=False, error=str(e))
+    except Exception as e:
+        logging.error(f"Headless command failed: {e}", exc_info=True)
+        response.update(ok=False, error=f"An unexpected error occurred: {e}")
+    return game_state, response
+
+
+def execute_command(config: Dict, game_state: Optional[GameState], line: str) -> CommandResult:
+    """
+    Run one JSON command line against the game, reporting malformed lines as errors.
+    """
+    try:
+        command = parse_command(line)
+    except (CommandError, ValueError) as e:
+        return game_state, {"ok": False, "error": str(e)}
+    return run_command(config, game_state, command)
+
+
+def run_headless(config: Dict, commands: TextIO = None, results: TextIO = None) -> None:
+    """
+    Read JSON commands (new, move, hint, undo, redo, solve, save, load, trace), one per line, and write one JSON
+    result per line. Nothing is prompted or rendered; anything the game logic prints goes to stderr so the
+    result stream stays valid JSON lines.
+
+    Args:
+        config (Dict): Configuration settings.
+        commands (TextIO): The command stream, stdin by default.
+        results (TextIO): The result stream, stdout by default.
+    """
+    commands = commands or sys.stdin
+    results = results or sys.stdout
+    game_state = None
+    for line in commands:
+        if not line.strip():
+            continue
+        with redirect_stdout(sys.stderr):
+            game_state, response = execute_command(config, game_state, line)
+        results.write(json.dumps(response) + "\n")
+        results.flush()
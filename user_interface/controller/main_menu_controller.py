@@ -1,5 +1,6 @@
 import logging
 
+from user_interface.controller.transition import Transition, MAIN_MENU, EXIT
 from user_interface.display.display_utilities import clear_screen
 from user_interface.display.menu_display import display_invalid_input, display_menu_with_title
 from user_interface.input.menu_enums import MainMenuOption, get_menu_options
@@ -10,74 +11,58 @@ def get_menu_choice(max_val: int) -> int:
     return prompt_choice(1, max_val)
 
 
-def handle_menu_choice(config: dict, choice: int, menu_options: dict) -> bool:
+def handle_menu_choice(config: dict, choice: int, menu_options: dict) -> Transition:
+    """
+    Run the chosen main menu entry.
+
+    Args:
+        config (dict): Configuration settings.
+        choice (int): The user's menu choice.
+        menu_options (dict): Dictionary mapping choices to their handlers.
+
+    Returns:
+        Transition: The screen the handler moves to, the main menu if it returns nothing, or EXIT.
+    """
     clear_screen()
     action = menu_options.get(choice)
     if action:
         _, handler = action
         if handler:
-            handler(config)
-            return True
+            return handler(config) or MAIN_MENU
         else:
             print("Exiting the game...")  # Exit the game
-            return False
+            return EXIT
     display_invalid_input("Invalid choice. Please enter a valid number.")
-    return True
+    return MAIN_MENU
 
 
-def menu_loop(config: dict) -> None:
+def main_menu_step(config: dict) -> Transition:
     """
-    Main menu loop.
+    Show the main menu once and handle a single choice.
 
     Args:
         config (dict): Configuration settings.
-    """
-    logging.info("Entering menu loop")
-    print("Entering menu loop")
-
-    menu_options = get_menu_options(MainMenuOption)  # Get menu options once
-
-    while True:
-        clear_screen()
-        display_menu_with_title("Main Menu", menu_options)  # Display the main menu
-        menu_choice = get_menu_choice(len(menu_options))  # Get the user's menu choice
-        if not handle_menu_choice(config, menu_choice, menu_options):
-            break  # Exit the loop if the user chooses to exit
-
-    logging.info("Exiting menu loop")
-    print("Exiting menu loop")
-
-
-def get_menu_choice(max_val: int) -> int:
-    return prompt_choice(1, max_val)
-
 
-def handle_menu_choice(config: dict, choice: int, menu_options: dict) -> bool:
+    Returns:
+        Transition: The next step of the session.
+    """
+    menu_options = get_menu_options(MainMenuOption)
     clear_screen()
-    action = menu_options.get(choice)
-    if action:
-        _, handler = action
-        if handler:
-            handler(config)
-            return True
-        else:
-            print("Exiting the game...")  # Exit the game
-            return False
-    display_invalid_input("Invalid choice. Please enter a valid number.")
-    return True
+    display_menu_with_title("Main Menu", menu_options)  # Display the main menu
+    menu_choice = get_menu_choice(len(menu_options))  # Get the user's menu choice
+    return handle_menu_choice(config, menu_choice, menu_options)
 
 
 def menu_loop(config: dict) -> None:
-    logging.info("Entering menu loop")
-
-    menu_options = get_menu_options(MainMenuOption)  # Get menu options once
+    """
+    Main menu loop.
 
-    while True:
-        clear_screen()
-        display_menu_with_title("Main Menu", menu_options)  # Display the main menu
-        menu_choice = get_menu_choice(len(menu_options))  # Get the user's menu choice
-        if not handle_menu_choice(config, menu_choice, menu_options):
-            break  # Exit the loop if the user chooses to exit
+    Args:
+        config (dict): Configuration settings.
+    """
+    from user_interface.controller.session_controller import run_session
 
+    logging.info("Entering menu loop")
+    run_session(config)
     logging.info("Exiting menu loop")
     print("Exiting menu loop")
@@ -0,0 +1,43 @@
+import logging
+from typing import Callable, Dict
+
+from user_interface.controller.game_actions_controller import game_action_step
+from user_interface.controller.main_menu_controller import main_menu_step
+from user_interface.controller.transition import Screen, Transition, MAIN_MENU
+from user_actions.start_new_game import start_new_game
+
+
+def new_game_step(config: dict, transition: Transition) -> Transition:
+    return start_new_game(config) or MAIN_MENU
+
+
+def game_step(config: dict, transition: Transition) -> Transition:
+    return game_action_step(transition.game_state)
+
+
+def main_menu_screen_step(config: dict, transition: Transition) -> Transition:
+    return main_menu_step(config)
+
+
+SCREEN_STEPS: Dict[Screen, Callable[[dict, Transition], Transition]] = {
+    Screen.MAIN_MENU: main_menu_screen_step,
+    Screen.NEW_GAME: new_game_step,
+    Screen.GAME: game_step,
+}
+
+
+def run_session(config: dict, transition: Transition = MAIN_MENU) -> None:
+    """
+    Run the game as an event loop over screens until the user exits.
+
+    Every screen handles one user interaction and returns the next transition, so stack depth
+    and memory stay constant however long the session runs: only the current game state is kept.
+
+    Args:
+        config (dict): Configuration settings.
+        transition (Transition): The screen to start on, the main menu by default.
+    """
+    while transition.screen is not Screen.EXIT:
+        step = SCREEN_STEPS[transition.screen]
+        transition = step(config, transition)
+    logging.info("Session finished")
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import Optional
+
+from core_data.game_state import GameState
+
+
+class Screen(Enum):
+    MAIN_MENU = auto()
+    NEW_GAME = auto()
+    GAME = auto()
+    EXIT = auto()
+
+
+@dataclass(frozen=True)
+class Transition:
+    """
+    The next step of the session. Actions return a Transition instead of calling the next screen
+    themselves, so the session controller never nests one screen inside another.
+    """
+    screen: Screen  # The screen to show next
+    game_state: Optional[GameState] = None  # The game to continue, only used by Screen.GAME
+
+
+MAIN_MENU = Transition(Screen.MAIN_MENU)
+NEW_GAME = Transition(Screen.NEW_GAME)
+EXIT = Transition(Screen.EXIT)
@@ -1,90 +1,133 @@
-from typing import List
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from typing import List, Optional, Sequence, Tuple
 
 from colorama import Fore, Style
 
 from core_data.cell_state import CellState
+from core_data.coordinate import Coordinate
 from core_data.grid import Grid
+from user_interface.display.terminal_renderer import terminal_renderer
 
+LEGEND = (f"\n(See your Sudoku Puzzle. Pre-Filled in {Fore.GREEN}Green{Style.RESET_ALL}, User-Filled in "
+          f"{Fore.BLUE}Blue{Style.RESET_ALL}, and Hint in {Fore.YELLOW}Yellow{Style.RESET_ALL})")
 
-def print_column_labels(grid_size: int, subgrid_size: int):
+STATE_COLOURS = {
+    CellState.PRE_FILLED: Fore.GREEN,
+    CellState.USER_FILLED: Fore.BLUE,
+    CellState.HINT: Fore.YELLOW,
+}
+
+
+@dataclass(frozen=True)
+class GridTemplate:
+    """The parts of a rendered grid that depend only on its size, built once per size."""
+    column_labels: str  # The column label line
+    separator: str  # The horizontal separator between subgrids
+    row_prefixes: Tuple[str, ...]  # The row label and left border of each row
+    joiners: Tuple[str, ...]  # The text following each cell of a row, including subgrid separators
+    row_coordinates: Tuple[Tuple[Coordinate, ...], ...]  # The coordinates of each row in column order
+    subgrid_size: int
+
+
+@lru_cache(maxsize=None)
+def grid_template(grid_size: int) -> GridTemplate:
+    subgrid_size = int(grid_size ** 0.5)
+    column_labels = "    " + "".join(
+        ("  " if col_index > 0 and col_index % subgrid_size == 0 else "") + f" {col_index + 1}  "
+        for col_index in range(grid_size)
+    )
+    joiners = tuple(
+        " |" if col_index + 1 == grid_size else " | " if (col_index + 1) % subgrid_size == 0 else " "
+        for col_index in range(grid_size)
+    )
+    return GridTemplate(
+        column_labels=column_labels,
+        separator="   " + "-" * (4 * grid_size + subgrid_size + 1),
+        row_prefixes=tuple(get_row_label(row_index) + " | " for row_index in range(grid_size)),
+        joiners=joiners,
+        row_coordinates=tuple(
+            tuple(Coordinate(row_index, col_index, grid_size) for col_index in range(grid_size))
+            for row_index in range(grid_size)
+        ),
+        subgrid_size=subgrid_size,
+    )
+
+
+@lru_cache(maxsize=None)
+def render_cell(value: Optional[int], state: CellState) -> str:
     """
-    Function to print the column labels using recursion.
+    Render a single cell, colour-coded by its state. There are few distinct cells, so every one is cached.
     """
+    if value is None:
+        return " . "
+    colour = STATE_COLOURS.get(state)
+    return f"{colour} {value} {Style.RESET_ALL}" if colour else f" {value} "
 
-    def _print_column_labels(col_index: int):
-        if col_index >= grid_size:
-            print()
-            return  # Base case: all column labels have been printed
-        if col_index == 0:
-            print("    ", end="")
-        if col_index > 0 and col_index % subgrid_size == 0:
-            print("  ", end="")  # Add space for separator
-        print(f" {col_index + 1}  ", end="")
-        _print_column_labels(col_index + 1)  # Recursive call to print the next column label
 
-    _print_column_labels(0)
+def render_row(grid: Grid, row_index: int) -> str:
+    """
+    Render one row of the grid, without a trailing newline.
+    """
+    template = grid_template(grid.grid_size)
+    row_cells = grid.rows[row_index].cells
+    cells = (render_cell(cell.value.value, cell.state)
+             for cell in map(row_cells.__getitem__, template.row_coordinates[row_index]))
+    return template.row_prefixes[row_index] + "".join(chain.from_iterable(zip(cells, template.joiners)))
 
 
-def display_grid(grid: Grid):
+def render_grid_lines(grid: Grid) -> List[str]:
     """
-    Function to display the Sudoku grid with row and column labels using recursion.
+    Render the whole grid, legend and labels included, as a list of lines.
     """
-    grid_size = grid.grid_size
-    subgrid_size = int(grid_size ** 0.5)
+    template = grid_template(grid.grid_size)
+    lines = ["", LEGEND.lstrip("\n"), template.column_labels]
+    for row_index in range(grid.grid_size):
+        if row_index % template.subgrid_size == 0:
+            lines.append(template.separator)
+        lines.append(render_row(grid, row_index))
+    lines.append(template.separator)
+    return lines
+
+
+def render_grid(grid: Grid) -> str:
+    """
+    Render the whole grid, legend and labels included, into a single string.
+    """
+    return "\n".join(render_grid_lines(grid)) + "\n"
 
-    print(
-        f"\n(See your Sudoku Puzzle. Pre-Filled in {Fore.GREEN}Green{Style.RESET_ALL}, User-Filled in {Fore.BLUE}Blue{Style.RESET_ALL}, and Hint in {Fore.YELLOW}Yellow{Style.RESET_ALL})")
 
-    def print_all_rows(row_index: int):
-        """
-        Recursively print all rows of the Sudoku grid.
-        """
-        if row_index >= grid_size:
-            return  # Base case: all rows have been printed
-        if row_index % subgrid_size == 0 or row_index == 0:
-            print("   " + "-" * (4 * grid_size + subgrid_size + 1))  # Print the horizontal separator
-        print_row(grid, row_index)  # Print the current row
-        print_all_rows(row_index + 1)  # Recursive call to print the next row
+def print_column_labels(grid_size: int, subgrid_size: int):
+    """
+    Function to print the column labels.
+    """
+    print(grid_template(grid_size).column_labels)
 
-    print_column_labels(grid_size, subgrid_size)  # Print the column labels
-    print_all_rows(0)  # Start the recursion for rows
-    print("   " + "-" * (4 * grid_size + subgrid_size + 1))  # Print the bottom boundary
+
+def display_grid(grid: Grid):
+    """
+    Function to display the Sudoku grid with row and column labels. The frame is written in one go to avoid flicker.
+    """
+    terminal_renderer.reset()  # The frame is printed in the flow of other output, not at a fixed position
+    sys.stdout.write(render_grid(grid))
+    sys.stdout.flush()
+
+
+def redraw_grid(grid: Grid, messages: Sequence[str] = ()):
+    """
+    Redraw the grid in place with status messages below it. On a terminal only the lines that changed since
+    the previous redraw are rewritten; other output gets the full grid and messages.
+    """
+    terminal_renderer.draw(render_grid_lines(grid) + list(messages))
 
 
 def print_row(grid: Grid, row_index: int):
     """
-    Recursively prints the cells of a given row with color-coding for different cell states.
+    Prints the cells of a given row with color-coding for different cell states.
     """
-    grid_size = grid.grid_size
-    subgrid_size = int(grid_size ** 0.5)
-    row_label = get_row_label(row_index)
-    row_display = [row_label + " |"]
-
-    def print_cell(col_index: int):
-        if col_index >= grid_size:
-            row_display.append("|")
-            print(" ".join(row_display))
-            return  # Base case: all columns in the current row have been printed
-
-        cell = grid[row_index, col_index]
-        if cell is not None and cell.value.value is not None:
-            value_str = str(cell.value.value)
-            if cell.state == CellState.PRE_FILLED:
-                row_display.append(Fore.GREEN + f" {value_str} " + Style.RESET_ALL)
-            elif cell.state == CellState.USER_FILLED:
-                row_display.append(Fore.BLUE + f" {value_str} " + Style.RESET_ALL)
-            elif cell.state == CellState.HINT:
-                row_display.append(Fore.YELLOW + f" {value_str} " + Style.RESET_ALL)
-            else:
-                row_display.append(f" {value_str} ")
-        else:
-            row_display.append(" . ")
-
-        if (col_index + 1) % subgrid_size == 0 and (col_index + 1) != grid_size:
-            row_display.append("|")  # Add vertical separator for subgrids
-        print_cell(col_index + 1)  # Recursive call to print the next cell
-
-    print_cell(0)  # Start the recursion for columns
+    print(render_row(grid, row_index))
 
 
 def display_messages(messages: List[str], index: int = 0):
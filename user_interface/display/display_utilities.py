@@ -1,15 +1,12 @@
-import os
 import sys
 
+from user_interface.display.terminal_renderer import CLEAR_SCREEN, is_terminal, terminal_renderer
+
 
 def clear_screen() -> None:
-    if os.name == 'nt':  # For Windows
-        os.system('cls')
-    else:  # For Mac and Linux
-        os.system('clear')
-    if sys.stdout.isatty():
-        print("\033[H\033[J", end='')  # ANSI escape sequences for terminals
+    if is_terminal(sys.stdout):
+        sys.stdout.write(CLEAR_SCREEN)  # ANSI escape sequences, no need to start a shell
+        sys.stdout.flush()
     else:
         print("\n" * 100)  # Fallback for IDEs like PyCharm
-
-
+    terminal_renderer.reset()
@@ -0,0 +1,74 @@
+import os
+import shutil
+import sys
+from typing import Optional, Sequence, TextIO
+
+CLEAR_SCREEN = "\033[H\033[2J\033[3J"  # Cursor home, clear the screen and the scrollback
+CLEAR_LINE_END = "\033[K"
+CLEAR_BELOW = "\033[J"
+
+# Lines kept free below the frame for menus and prompts before falling back to full output
+PROMPT_MARGIN = 12
+
+
+def move_cursor(line: int) -> str:
+    # ANSI cursor position, 1-based
+    return f"\033[{line};1H"
+
+
+def is_terminal(stream: TextIO) -> bool:
+    return hasattr(stream, "isatty") and stream.isatty() and os.environ.get("TERM") != "dumb"
+
+
+class TerminalRenderer:
+    """
+    Draws a frame of text lines at the top of the terminal and remembers it, so the next frame only
+    rewrites the lines that changed, using ANSI cursor moves instead of clearing the screen.
+
+    Output that is not a terminal, or a terminal too short to hold the frame and a menu below it,
+    gets the full frame every time.
+    """
+
+    def __new__(cls, stream: Optional[TextIO] = None):
+        instance = super(TerminalRenderer, cls).__new__(cls)
+        instance.stream = stream  # None writes to whatever sys.stdout is at draw time
+        instance._previous = None  # The lines of the frame currently on screen
+        return instance
+
+    def reset(self) -> None:
+        """Forget the frame on screen, e.g. after the screen was cleared or scrolled by other output."""
+        self._previous = None
+
+    def draw(self, lines: Sequence[str]) -> int:
+        """
+        Draw a frame, rewriting only what changed since the last one.
+
+        Args:
+            lines (Sequence[str]): The lines of the frame, without newlines.
+
+        Returns:
+            int: The number of characters written.
+        """
+        stream = self.stream or sys.stdout
+        lines = tuple(lines)
+        if not is_terminal(stream) or len(lines) + PROMPT_MARGIN > shutil.get_terminal_size().lines:
+            output = "\n".join(lines) + "\n"
+            lines = None  # The frame scrolls with the rest of the output, so there is nothing to diff against
+        elif self._previous is None:
+            output = CLEAR_SCREEN + "\n".join(lines) + "\n"
+        else:
+            previous = self._previous
+            changed = [
+                move_cursor(index + 1) + line + CLEAR_LINE_END
+                for index, line in enumerate(lines)
+                if index >= len(previous) or previous[index] != line
+            ]
+            # Leave the cursor below the frame, clearing the menu and prompts printed after the last frame
+            output = "".join(changed) + move_cursor(len(lines) + 1) + CLEAR_BELOW
+        self._previous = lines
+        stream.write(output)
+        stream.flush()
+        return len(output)
+
+
+terminal_renderer = TerminalRenderer()
@@ -30,7 +30,7 @@ class PostSolveOption(BaseEnum):
 
 
 class HintOption(BaseEnum):
-    RANDOM_CELL = "Random cell", None
+    RANDOM_CELL = "Next logical step", None
     SPECIFIC_CELL = "Specific cell", None
 
 
@@ -43,6 +43,7 @@ class GameAction(BaseEnum):
     MAKE_A_MOVE = "Make a move", "user_actions.make_a_move.make_a_move"
     GET_A_HINT = "Get a hint", "user_actions.request_hint.request_hint"
     UNDO_LAST_MOVE = "Undo last move", "user_actions.undo_move.undo_move"
+    REDO_LAST_MOVE = "Redo last move", "user_actions.undo_move.redo_move"
     SOLVE_PUZZLE = "Solve the puzzle", "user_actions.solve_puzzle.solve_puzzle"
     SAVE_GAME = "Save the game", "user_actions.save_game.save_game_to_file"
     BACK_TO_MAIN_MENU = "Back to main menu", None
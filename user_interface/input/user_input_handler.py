@@ -15,9 +15,9 @@ def get_menu_choice(max_val: int) -> int:
 
 def prompt_choice(min_val: int, max_val: int) -> int:
     choice = validate_choice(input("> "), min_val, max_val)
-    if choice is None:
+    while choice is None:
         display_invalid_input(f"Invalid input. Please enter a number between {min_val} and {max_val}.")
-        return prompt_choice(min_val, max_val)
+        choice = validate_choice(input("> "), min_val, max_val)
     return choice
 
 
@@ -44,8 +44,8 @@ def get_user_move() -> str:
 
 def prompt_user_move() -> str:
     user_input = input("> ").strip()
-    if not validate_moves(user_input):
-        return prompt_user_move()
+    while not validate_moves(user_input):
+        user_input = input("> ").strip()
     return user_input
 
 
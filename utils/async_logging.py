@@ -0,0 +1,64 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DEFAULT_LOG_LEVEL = 'INFO'
+DEFAULT_LOG_FILE = 'error_log.txt'
+
+# Set by configure_logging: callers only queue records, the listener thread does all the file writes
+queue_handler: Optional[QueueHandler] = None
+log_listener: Optional[QueueListener] = None
+
+
+def log_level(settings: Dict) -> int:
+    name = str(settings.get('level', DEFAULT_LOG_LEVEL)).upper()
+    level = logging.getLevelName(name)
+    if not isinstance(level, int):
+        raise ValueError(f"Unknown logging level {settings.get('level')!r}.")
+    return level
+
+
+def configure_logging(config: Dict) -> None:
+    """
+    Route the root logger through a queue to a file written on a background thread, at the level and
+    into the file named in the 'logging' configuration section. Calling it again replaces the previous setup.
+
+    Args:
+        config (Dict): The game configuration.
+    """
+    global queue_handler, log_listener
+    settings = config.get('logging') or {}
+    level = log_level(settings)
+    stop_logging()
+
+    file_handler = logging.FileHandler(settings.get('log_file') or DEFAULT_LOG_FILE, delay=True)  # Opened on first record
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    log_listener = QueueListener(log_queue, file_handler)
+    log_listener.start()
+
+    root = logging.getLogger()
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+
+def stop_logging() -> None:
+    """
+    Write out the queued records and detach the queue from the root logger.
+    """
+    global queue_handler, log_listener
+    if queue_handler is not None:
+        logging.getLogger().removeHandler(queue_handler)
+        queue_handler = None
+    if log_listener is not None:
+        log_listener.stop()  # Waits for the records already queued
+        for handler in log_listener.handlers:
+            handler.close()
+        log_listener = None
+
+
+atexit.register(stop_logging)
@@ -7,6 +7,9 @@ from core_data.cell_value import CellValue
 from core_data.coordinate import Coordinate
 from core_data.grid import Grid
 
+# One symbol per cell value when grids are written as text: 0 for an empty cell, 1-9, then A-P for 10-25
+VALUE_SYMBOLS = "0123456789ABCDEFGHIJKLMNOP"
+
 
 def find_empty_cell(grid: Grid) -> Optional[Tuple[int, int]]:
     def find_cell(row: int, col: int) -> Optional[Tuple[int, int]]:
@@ -48,16 +51,19 @@ def find_random_empty_cell(grid: Grid) -> Optional[Tuple[int, int]]:
     return random.choice(empty_cells) if empty_cells else None  # Randomly select an empty cell if available
 
 
-def remove_cells(grid_size: int, num_cells_to_remove: int) -> Set[Tuple[int, int]]:
+def remove_cells(grid_size: int, num_cells_to_remove: int,
+                 rng: Optional[random.Random] = None) -> Set[Tuple[int, int]]:
     """
     Recursively select cells to remove while ensuring balance across rows, columns, and subgrids.
+    Cells are drawn from rng, or from the global generator when it is None.
     """
     subgrid_size = int(grid_size ** 0.5)
+    rng = rng or random
 
     def select_cells(selected_cells: Set[Tuple[int, int]], remaining: int) -> Set[Tuple[int, int]]:
         if remaining == 0:
             return selected_cells  # Base case: no more cells to remove
-        row, col = random.randint(0, grid_size - 1), random.randint(0, grid_size - 1)
+        row, col = rng.randint(0, grid_size - 1), rng.randint(0, grid_size - 1)
         subgrid_row, subgrid_col = row // subgrid_size, col // subgrid_size
 
         if (row, col) in selected_cells:
@@ -166,3 +172,65 @@ def create_empty_grid(grid_size: int = 9) -> Grid:
     cells = {}
     init_cells(0, 0, cells)  # Initialize cells starting from (0, 0)
     return Grid.create(grid_size, cells)  # Return a new Grid instance
+
+
+def grid_to_values(grid: Grid) -> Tuple[int, ...]:
+    """
+    Flatten the grid into a row-major tuple of values, using 0 for empty cells.
+    """
+    grid_size = grid.grid_size
+    values = [0] * (grid_size * grid_size)
+    for row in grid.rows:
+        for coord, cell in row.cells.items():
+            values[coord.row_index * grid_size + coord.col_index] = cell.value.value or 0
+    return tuple(values)
+
+
+def fill_empty_cells(grid: Grid, values: Tuple[int, ...]) -> Grid:
+    """
+    Fill every empty cell of the grid from a row-major tuple of values, keeping the existing cells.
+    Filled cells are marked PRE_FILLED, matching the grids returned by the backtracking solver.
+    """
+    grid_size = grid.grid_size
+    cells = {}
+    for row in grid.rows:
+        for coord, cell in row.cells.items():
+            if cell.value.value is None or cell.value.value == 0:
+                value = values[coord.row_index * grid_size + coord.col_index]
+                cell = Cell(CellValue(value, grid_size), CellState.PRE_FILLED)
+            cells[coord] = cell
+    return Grid.create(grid_size, cells)
+
+
+def encode_values(values: Tuple[int, ...]) -> str:
+    return "".join(VALUE_SYMBOLS[value] for value in values)
+
+
+def decode_values(text: str) -> Tuple[int, ...]:
+    """
+    Read row-major values written one symbol per cell, as encode_values writes them.
+
+    Raises:
+        ValueError: If a symbol is not one of VALUE_SYMBOLS.
+    """
+    values = []
+    for symbol in text.upper():
+        value = VALUE_SYMBOLS.find(symbol)
+        if value < 0:
+            raise ValueError(f"Invalid symbol {symbol!r}: use 0 for empty cells, 1-9, then A-P for 10-25.")
+        values.append(value)
+    return tuple(values)
+
+
+def values_to_grid(values: Tuple[int, ...], grid_size: int) -> Grid:
+    """
+    Build a puzzle from a row-major tuple of values, using 0 for empty cells. Givens are marked PRE_FILLED.
+    """
+    if len(values) != grid_size * grid_size:
+        raise ValueError(f"Expected {grid_size * grid_size} values for a {grid_size}x{grid_size} grid.")
+    cells = {
+        Coordinate(index // grid_size, index % grid_size, grid_size): Cell(CellValue(value, grid_size),
+                                                                            CellState.PRE_FILLED)
+        for index, value in enumerate(values) if value
+    }
+    return Grid.create(grid_size, cells)
@@ -0,0 +1,74 @@
+from concurrent.futures import Future
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class InFlightStats:
+    computed: int  # Calls that ran the computation
+    coalesced: int  # Calls that waited for a computation already running instead of repeating it
+    in_flight: int  # Computations running now
+
+
+class InFlightTable:
+    """
+    Coalesces identical concurrent work. The first caller for a key runs the computation; callers arriving
+    while it runs wait for the same future and share its result or exception. Nothing is kept afterwards,
+    results are cached elsewhere.
+    """
+
+    def __new__(cls):
+        instance = super(InFlightTable, cls).__new__(cls)
+        instance._futures = {}
+        instance._lock = Lock()
+        instance._computed = 0
+        instance._coalesced = 0
+        return instance
+
+    def run(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Run compute for the key, unless the same key is already being computed.
+
+        Args:
+            key (Hashable): Identifies the work; equal keys must produce interchangeable results.
+            compute (Callable[[], T]): The work to run.
+
+        Returns:
+            T: The result of the computation, shared by every caller that waited for it.
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = Future()
+                self._futures[key] = future
+                self._computed += 1
+                leader = True
+            else:
+                self._coalesced += 1
+                leader = False
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = compute()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            # Later callers start afresh; by then the result is normally in the caller's cache
+            with self._lock:
+                del self._futures[key]
+
+    def stats(self) -> InFlightStats:
+        with self._lock:
+            return InFlightStats(self._computed, self._coalesced, len(self._futures))
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._computed, self._coalesced = 0, 0
@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Hashable, Optional
+
+# Sentinel distinguishing a cached None from a missing entry
+MISSING = object()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int  # Lookups answered from the cache
+    misses: int  # Lookups that found nothing
+    evictions: int  # Entries dropped to respect max_size
+    size: int  # Entries currently held
+    max_size: int  # Maximum number of entries held
+
+
+class LRUCache:
+    """A bounded least-recently-used mapping. The oldest entry is evicted once max_size is exceeded."""
+
+    def __new__(cls, max_size: int):
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError("LRUCache max_size must be a positive integer.")
+        instance = super(LRUCache, cls).__new__(cls)
+        instance.max_size = max_size
+        instance._entries = OrderedDict()
+        instance._lock = Lock()  # Caches are shared between callers, keep updates atomic
+        instance._hits = 0
+        instance._misses = 0
+        instance._evictions = 0
+        return instance
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return default
+            self._hits += 1
+            # Mark the entry as most recently used
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            # Evict the least recently used entries until the cache fits again
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self._hits, self._misses, self._evictions, len(self._entries), self.max_size)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits, self._misses, self._evictions = 0, 0, 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def memoize(cache: LRUCache, key: Callable[..., Hashable]) -> Callable[[Callable], Callable]:
+    """
+    Memoize a pure function in a bounded LRU cache.
+
+    Args:
+        cache (LRUCache): The cache holding results, possibly shared with other functions.
+        key (Callable[..., Hashable]): Builds the cache key from the call arguments.
+
+    Returns:
+        Callable[[Callable], Callable]: A decorator applying the memoization.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def memoized_func(*args):
+            cache_key = (func.__qualname__, key(*args))  # Functions sharing a cache never collide
+            result = cache.get(cache_key, MISSING)
+            if result is MISSING:
+                result = func(*args)
+                cache.put(cache_key, result)
+            return result
+
+        return memoized_func
+
+    return decorator
@@ -0,0 +1,92 @@
+import gc
+import sys
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict
+
+from puzzle_handler.puzzle_solver.solver_memo import solver_memo
+
+# Types reported by memory_stats: the game model, the undo history and what the caches and sessions hold
+TRACKED_TYPES = ('Grid', 'Row', 'Cell', 'CellValue', 'Coordinate', 'GameState', 'Snapshot', 'PersistentStack',
+                 'CachedSolution', 'Session')
+
+
+@dataclass(frozen=True)
+class Footprint:
+    items: int  # Items built and kept alive while measuring
+    bytes_each: float  # Traced bytes still allocated per item
+    objects_each: Dict[str, float]  # Objects added per item that the garbage collector tracks, by type name
+
+
+def object_counts() -> Dict[str, int]:
+    """
+    Count the objects the garbage collector tracks, by type name. This walks every tracked object, so it
+    takes time in proportion to the heap: call it on demand, not on every request.
+    """
+    return dict(Counter(type(obj).__name__ for obj in gc.get_objects()))
+
+
+def memory_stats() -> Dict:
+    """
+    Report the memory held by the process: the game objects alive by type, the objects the garbage
+    collector tracks, the entries of the shared solver memo and, while tracemalloc runs (e.g. started
+    with PYTHONTRACEMALLOC=1), the traced bytes.
+
+    Returns:
+        Dict: The JSON-ready statistics.
+    """
+    counts = object_counts()
+    stats = {
+        "objects": {name: counts.get(name, 0) for name in TRACKED_TYPES},
+        "gc_objects": sum(counts.values()),
+        "gc_generations": list(gc.get_count()),  # Allocations since the last collection of each generation
+        "solver_memo": len(solver_memo),
+    }
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        stats["traced_kib"] = round(current / 1024, 1)
+        stats["traced_peak_kib"] = round(peak / 1024, 1)
+    return stats
+
+
+def measure_footprint(build: Callable[[int], object], count: int, warm_up: bool = True) -> Footprint:
+    """
+    Measure how much memory items take while they are all alive: build count of them under tracemalloc,
+    then divide the bytes still allocated, and the new objects the garbage collector tracks, by count.
+    Memory the items share with objects that existed before, such as module-level tables, is not counted.
+
+    Args:
+        build (Callable[[int], object]): Builds the item with the given index. Items stored elsewhere,
+            e.g. in a cache, may return None; whatever they leave allocated is counted.
+        count (int): Items to build.
+        warm_up (bool): Build and drop one item first, so tables filled on first use are not counted.
+
+    Returns:
+        Footprint: The bytes and objects per item.
+    """
+    if count < 1:
+        raise ValueError("measure_footprint needs at least one item.")
+    if warm_up:
+        build(count)
+    gc.collect()
+    objects_before = object_counts()
+    started_tracemalloc = not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+    try:
+        bytes_before, _ = tracemalloc.get_traced_memory()
+        items = [build(index) for index in range(count)]
+        gc.collect()
+        bytes_after, _ = tracemalloc.get_traced_memory()
+    finally:
+        if started_tracemalloc:
+            tracemalloc.stop()
+    objects_after = object_counts()
+    objects_after['list'] -= 1  # The list holding the items
+
+    held = bytes_after - bytes_before - sys.getsizeof(items)
+    added = {name: round((objects_after[name] - objects_before.get(name, 0)) / count, 2)
+             for name in sorted(objects_after) if objects_after[name] > objects_before.get(name, 0)}
+    del items
+    return Footprint(count, round(held / count, 1), added)
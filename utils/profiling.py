@@ -0,0 +1,136 @@
+import cProfile
+import logging
+import os
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from threading import Lock
+from typing import Dict, FrozenSet, Iterator, Mapping
+
+from utils import tracing
+
+# Environment variables overriding the 'profiling' configuration section, so a field install can be
+# profiled without editing its config, e.g. SUDOKU_PROFILE=place_hint,generate_puzzle SUDOKU_PROFILE_MODE=cpu,memory
+PROFILE_ACTIONS_ENV = 'SUDOKU_PROFILE'
+PROFILE_MODE_ENV = 'SUDOKU_PROFILE_MODE'
+PROFILE_DIR_ENV = 'SUDOKU_PROFILE_DIR'
+
+ALL_ACTIONS = 'all'
+DEFAULT_PROFILE_DIR = 'profiles'
+DEFAULT_TOP_ALLOCATIONS = 25
+TRACEMALLOC_FRAMES = 5  # Stack depth kept per allocation; deeper costs more while capturing
+
+
+class Profiler:
+    """
+    Captures cProfile statistics and tracemalloc allocation reports for calls of selected traced spans,
+    writing one file per call named by the span and a timestamp. One call is captured at a time; spans
+    selected while another capture runs are included in that capture instead.
+    """
+
+    def __new__(cls, actions: FrozenSet[str], cpu: bool = True, memory: bool = False,
+                output_dir: str = DEFAULT_PROFILE_DIR, top: int = DEFAULT_TOP_ALLOCATIONS):
+        if not cpu and not memory:
+            raise ValueError("Profiler needs cpu or memory profiling enabled.")
+        instance = super(Profiler, cls).__new__(cls)
+        instance.actions = frozenset(actions)
+        instance.cpu = cpu
+        instance.memory = memory
+        instance.output_dir = output_dir
+        instance.top = top
+        instance._busy = Lock()  # cProfile and tracemalloc hooks are process-wide, nesting them breaks the outer one
+        return instance
+
+    def wants(self, name: str) -> bool:
+        return ALL_ACTIONS in self.actions or name in self.actions
+
+    @contextmanager
+    def capture(self, name: str) -> Iterator[None]:
+        """
+        Profile the block if the span name is selected and no other capture is running.
+
+        Args:
+            name (str): The span name, e.g. 'place_hint'.
+        """
+        if not self.wants(name) or not self._busy.acquire(blocking=False):
+            yield
+            return
+        try:
+            profile = cProfile.Profile() if self.cpu else None
+            started_tracemalloc = self.memory and not tracemalloc.is_tracing()
+            if started_tracemalloc:
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+            if self.memory:
+                tracemalloc.reset_peak()
+                before = tracemalloc.take_snapshot()
+            if profile is not None:
+                profile.enable()
+            try:
+                yield
+            finally:
+                if profile is not None:
+                    profile.disable()
+                stem = self.output_stem(name)
+                if profile is not None:
+                    profile.dump_stats(stem + '.pstats')
+                    logging.info(f"Profile of {name} written to {stem}.pstats")
+                if self.memory:
+                    after = tracemalloc.take_snapshot()
+                    _, peak = tracemalloc.get_traced_memory()
+                    if started_tracemalloc:
+                        tracemalloc.stop()
+                    self.write_allocations(stem + '.allocations.txt', name, before, after, peak)
+        finally:
+            self._busy.release()
+
+    def output_stem(self, name: str) -> str:
+        os.makedirs(self.output_dir, exist_ok=True)
+        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        return os.path.join(self.output_dir, f"{name.replace('/', '_')}-{timestamp}")
+
+    def write_allocations(self, path: str, name: str, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot,
+                          peak: int) -> None:
+        # Leave out what the profilers allocate themselves when both run
+        profiler_files = [tracemalloc.Filter(False, cProfile.__file__), tracemalloc.Filter(False, tracemalloc.__file__)]
+        differences = after.filter_traces(profiler_files).compare_to(before.filter_traces(profiler_files), 'lineno')
+        lines = [f"Allocations during {name}: peak {peak / 1024:.1f} KiB, "
+                 f"net {sum(difference.size_diff for difference in differences) / 1024:+.1f} KiB",
+                 f"Top {self.top} allocation sites by net size:"]
+        lines.extend(str(difference) for difference in differences[:self.top])
+        with open(path, 'w') as file:
+            file.write('\n'.join(lines) + '\n')
+        logging.info(f"Allocation report of {name} written to {path}")
+
+
+def parse_names(value) -> FrozenSet[str]:
+    # Accept a list from the config file or a comma-separated string from the environment
+    if isinstance(value, str):
+        value = value.split(',')
+    return frozenset(name.strip() for name in value or () if name.strip())
+
+
+def configure_profiling(config: Dict, environ: Mapping[str, str] = None) -> None:
+    """
+    Enable or disable per-action profiling from the 'profiling' configuration section, overridden by the
+    SUDOKU_PROFILE, SUDOKU_PROFILE_MODE and SUDOKU_PROFILE_DIR environment variables.
+
+    Args:
+        config (Dict): The game configuration.
+        environ (Mapping[str, str]): The environment, os.environ by default.
+    """
+    environ = os.environ if environ is None else environ
+    settings = config.get('profiling') or {}
+    actions = parse_names(environ.get(PROFILE_ACTIONS_ENV, settings.get('actions')))
+    if PROFILE_MODE_ENV in environ:
+        modes = parse_names(environ[PROFILE_MODE_ENV])
+        cpu, memory = 'cpu' in modes, 'memory' in modes
+    else:
+        cpu, memory = settings.get('cpu', True), settings.get('memory', False)
+    output_dir = environ.get(PROFILE_DIR_ENV, settings.get('output_dir', DEFAULT_PROFILE_DIR))
+
+    tracing.profiler = None
+    if actions and (cpu or memory):
+        tracing.profiler = Profiler(actions, cpu, memory, output_dir, settings.get('top', DEFAULT_TOP_ALLOCATIONS))
+        logging.info(f"Profiling {', '.join(sorted(actions))} into {output_dir}")
+    tracing.refresh_instrumented()
+
@@ -0,0 +1,195 @@
+import inspect
+import logging
+import math
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from functools import wraps
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from utils.profiling import Profiler
+
+# Spans kept by default; the oldest are dropped beyond this
+DEFAULT_TRACE_CAPACITY = 10000
+
+# Path of the span running in the current thread or task, so nested spans are reported under their caller
+current_span: ContextVar[Optional[str]] = ContextVar('current_span', default=None)
+
+
+@dataclass(frozen=True)
+class SpanStats:
+    count: int  # Spans of this name still in the buffer
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    total_ms: float  # Time spent in the spans, including nested spans
+
+
+class Tracer:
+    """
+    Records how long named spans take into a bounded ring buffer. Nested spans are named by their path,
+    e.g. 'place_hint/count_solutions_cached'.
+    """
+
+    def __new__(cls, capacity: int = DEFAULT_TRACE_CAPACITY):
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("Tracer capacity must be a positive integer.")
+        instance = super(Tracer, cls).__new__(cls)
+        instance.capacity = capacity
+        # Appending to and copying a deque are atomic, so recording threads need no lock
+        instance._spans = deque(maxlen=capacity)
+        return instance
+
+    def record(self, name: str, seconds: float) -> None:
+        self._spans.append((name, seconds))
+
+    def spans(self) -> List[Tuple[str, float]]:
+        return list(self._spans)
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+    def report(self) -> Dict[str, SpanStats]:
+        """
+        Summarise the buffered spans by name.
+
+        Returns:
+            Dict[str, SpanStats]: Latency percentiles per span name, in name order.
+        """
+        durations: Dict[str, List[float]] = {}
+        for name, seconds in self.spans():
+            durations.setdefault(name, []).append(seconds * 1e3)
+        return {name: span_stats(sorted(durations[name])) for name in sorted(durations)}
+
+
+# Enabled through configure_tracing
+tracer: Optional[Tracer] = None
+# Enabled through utils.profiling.configure_profiling
+profiler: Optional['Profiler'] = None
+# Whether either is enabled; traced calls check only this when both are off
+instrumented = False
+
+
+def configure_tracing(config: Dict) -> None:
+    """
+    Enable or disable latency tracing from the 'tracing' configuration section.
+
+    Args:
+        config (Dict): The game configuration.
+    """
+    global tracer
+    settings = config.get('tracing') or {}
+    if settings.get('enabled', False):
+        tracer = Tracer(settings.get('capacity', DEFAULT_TRACE_CAPACITY))
+    else:
+        tracer = None
+    refresh_instrumented()
+
+
+def refresh_instrumented() -> None:
+    global instrumented
+    instrumented = tracer is not None or profiler is not None
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    # Nearest-rank percentile of an already sorted sequence
+    index = max(0, min(len(sorted_values) - 1, math.ceil(round(fraction * len(sorted_values), 9)) - 1))
+    return sorted_values[index]
+
+
+def span_stats(sorted_ms: Sequence[float]) -> SpanStats:
+    return SpanStats(len(sorted_ms), round(percentile(sorted_ms, 0.50), 3), round(percentile(sorted_ms, 0.95), 3),
+                     round(percentile(sorted_ms, 0.99), 3), round(sorted_ms[-1], 3), round(sum(sorted_ms), 3))
+
+
+def traced(name: str) -> Callable[[Callable], Callable]:
+    """
+    Time every call of a function, or coroutine function, as a span when tracing or profiling is enabled.
+
+    Args:
+        name (str): The span name, nested under the span of the caller if there is one.
+
+    Returns:
+        Callable[[Callable], Callable]: A decorator recording the span.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def traced_coroutine(*args, **kwargs):
+                if not instrumented:
+                    return await func(*args, **kwargs)
+                with span(name):
+                    return await func(*args, **kwargs)
+
+            return traced_coroutine
+
+        @wraps(func)
+        def traced_func(*args, **kwargs):
+            if not instrumented:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+
+        return traced_func
+
+    return decorator
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Time a block as a span, and profile it if the profiler selects its name. Check instrumented first,
+    as traced functions do, to keep disabled spans down to a single check.
+
+    Args:
+        name (str): The span name, nested under the span of the caller if there is one.
+    """
+    parent = current_span.get()
+    path = f"{parent}/{name}" if parent else name
+    token = current_span.set(path)
+    active_profiler = profiler
+    capture = active_profiler.capture(name) if active_profiler is not None else nullcontext()
+    start = perf_counter()
+    try:
+        with capture:
+            yield
+    finally:
+        elapsed = perf_counter() - start
+        current_span.reset(token)
+        active_tracer = tracer
+        if active_tracer is not None:  # Tracing may have been switched off while the span ran
+            active_tracer.record(path, elapsed)
+
+
+def trace_report() -> Dict[str, Dict]:
+    """
+    Report latency percentiles per span, or nothing when tracing is disabled.
+
+    Returns:
+        Dict[str, Dict]: The JSON-ready SpanStats fields per span name.
+    """
+    if tracer is None:
+        return {}
+    return {name: asdict(stats) for name, stats in tracer.report().items()}
+
+
+def format_trace_report(report: Dict[str, Dict]) -> str:
+    lines = [f"{'span':<48} {'count':>6} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'max ms':>10}"]
+    for name, stats in report.items():
+        lines.append(f"{name:<48} {stats['count']:>6} {stats['p50_ms']:>10} {stats['p95_ms']:>10} "
+                     f"{stats['p99_ms']:>10} {stats['max_ms']:>10}")
+    return "\n".join(lines)
+
+
+def log_trace_report() -> None:
+    """
+    Log the latency percentiles per span, if tracing is enabled and anything was traced.
+    """
+    report = trace_report()
+    if report:
+        logging.info("Latency per traced span:\n" + format_trace_report(report))